@@ -437,6 +437,25 @@ NULL_ADDRESS = "0x0000000000000000000000000000000000000000"
 # ERC20 Transfer event topic: keccak256("Transfer(address,address,uint256)")
 TRANSFER_TOPIC = "0xddf252ad1be2c89b69c2b068fc378daa952ba7f163c4a11628f55a4df523b3ef"
 
+# MortalVault FundsReceived event topic: keccak256("FundsReceived(address,uint256,string)")
+# fundType "creator_deposit" marks a creatorDeposit() call
+FUNDS_RECEIVED_SIGNATURE = "FundsReceived(address,uint256,string)"
+
+# DEX factory pool-creation events — used to notice new pools for quarantined
+# ERC-20 tokens without polling DexScreener. token0/token1 are indexed topics.
+PAIR_CREATED_SIGNATURE = "PairCreated(address,address,address,uint256)"        # Uniswap/PancakeSwap V2
+POOL_CREATED_SIGNATURE = "PoolCreated(address,address,uint24,int24,address)"   # Uniswap/PancakeSwap V3
+DEX_FACTORIES: dict[str, dict[str, str]] = {
+    "base": {
+        "0x8909Dc15e40173Ff4699343b6eB8132c65e18eC6": "uniswap_v2",
+        "0x33128a8fC17869897dcE68Ed026d694621f6FDfD": "uniswap_v3",
+    },
+    "bsc": {
+        "0xcA143Ce32Fe78f1f7019d7d551a6402fC5350c73": "pancakeswap_v2",
+        "0x0BFbCF9fa4f9C56B0F40a671Ad40E0805A091865": "pancakeswap_v3",
+    },
+}
+
 # Minimal ERC20 ABI — token info for airdrop detection (symbol + decimals)
 ERC20_INFO_ABI = [
     {
@@ -466,6 +485,47 @@ FACTORY_ABI_MINIMAL = [
     },
 ]
 
+# Multicall3 — same address on every EVM chain (Base, BSC, ...).
+# Used to batch several view calls into a single eth_call.
+MULTICALL3_ADDRESS = "0xcA11bde05977b3631167028862bE2a173976CA11"
+MULTICALL3_ABI = [
+    # aggregate3((address target, bool allowFailure, bytes callData)[]) → (bool success, bytes returnData)[]
+    {
+        "inputs": [
+            {
+                "components": [
+                    {"name": "target", "type": "address"},
+                    {"name": "allowFailure", "type": "bool"},
+                    {"name": "callData", "type": "bytes"},
+                ],
+                "name": "calls",
+                "type": "tuple[]",
+            },
+        ],
+        "name": "aggregate3",
+        "outputs": [
+            {
+                "components": [
+                    {"name": "success", "type": "bool"},
+                    {"name": "returnData", "type": "bytes"},
+                ],
+                "name": "returnData",
+                "type": "tuple[]",
+            },
+        ],
+        "stateMutability": "payable",
+        "type": "function",
+    },
+]
+
+# Output types for decoding solvency reads returned through Multicall3
+_DEBT_INFO_TYPES = ["uint256", "uint256", "uint256", "uint256", "uint256", "bool", "bool"]
+_INSOLVENCY_TYPES = ["bool", "uint256", "bool"]
+
+# Debt-free chains are skipped by get_per_chain_solvency(); re-read them this
+# often to catch debt changes initiated outside this process.
+_DEBT_FREE_RECHECK_SECONDS = 3600
+
 
 # ============================================================
 # PRECISION HELPERS
@@ -513,6 +573,16 @@ class ChainTxResult:
     amount_usd: float = 0.0      # for repay_principal: actual USD sent (may be capped to on-chain outstanding)
 
 
+@dataclass(frozen=True, slots=True)
+class ChainSolvencyState:
+    """One chain's solvency snapshot from get_per_chain_solvency() (immutable, safe to share from cache)."""
+    chain_id: str
+    balance_usd: Optional[float]      # on-chain token balance of vault (None = read failed)
+    outstanding_usd: Optional[float]  # on-chain outstanding principal (None = read failed)
+    grace_expired: bool = False       # True if 28-day grace period has passed
+    is_insolvent: bool = False        # balance < outstanding * 1.01 (contract formula)
+
+
 class _TxTimeoutError(Exception):
     """Internal: raised when wait_for_transaction_receipt times out."""
     def __init__(self, tx_hash: str, nonce: int, detail: str = ""):
@@ -561,6 +631,29 @@ class ChainExecutor:
         # Used by get_incoming_transfers() to avoid re-processing old events
         self._last_transfer_block: dict[str, int] = {}
 
+        # Vault event block cursor — next block to scan per chain (get_vault_events)
+        self._last_vault_event_block: dict[str, int] = {}
+
+        # DEX pool-creation block cursor — next block to scan per chain (get_new_pools)
+        self._last_pool_event_block: dict[str, int] = {}
+
+        # Per-chain solvency read cache: chain_id → (read_timestamp, state dict)
+        # Shared by heartbeat consumers within a short TTL; any tx we send on a
+        # chain bumps its epoch so in-flight background refreshes are discarded.
+        self._solvency_cache: dict[str, tuple[float, ChainSolvencyState]] = {}
+        self._solvency_epoch: dict[str, int] = {}
+        self._solvency_refreshing: set[str] = set()
+        # Strong refs to background refresh tasks (the loop only keeps weak ones)
+        self._solvency_refresh_tasks: set[asyncio.Task] = set()
+
+        # Per-chain "has outstanding debt" bit: chain_id → (has_debt, checked_at).
+        # Set from each solvency read; dropped whenever we send a tx on the chain.
+        self._chain_has_debt: dict[str, tuple[bool, float]] = {}
+
+        # Per-chain send lock: nonce fetch → sign → broadcast must not interleave
+        # between concurrent senders on the same chain (they'd reuse a nonce).
+        self._send_locks: dict[str, asyncio.Lock] = {}
+
     def initialize(
         self,
         ai_private_key: str,
@@ -626,11 +719,15 @@ class ChainExecutor:
 
                 token_contract = w3.eth.contract(address=token_address, abi=ERC20_ABI)
                 vault_contract = w3.eth.contract(address=vault_address, abi=VAULT_ABI)
+                multicall_contract = w3.eth.contract(
+                    address=Web3.to_checksum_address(MULTICALL3_ADDRESS), abi=MULTICALL3_ABI,
+                )
 
                 self._chains[chain_id] = {
                     "w3": w3,
                     "vault_contract": vault_contract,
                     "token_contract": token_contract,
+                    "multicall_contract": multicall_contract,
                     "vault_address": vault_address,
                     "token_address": token_address,
                     "token_decimals": chain_cfg["token_decimals"],
@@ -1304,7 +1401,33 @@ class ChainExecutor:
 
         return best_chain
 
+    def _invalidate_solvency_cache(self, chain_id: str):
+        """Drop cached solvency state for a chain whose balances are about to change."""
+        self._solvency_cache.pop(chain_id, None)
+        self._solvency_epoch[chain_id] = self._solvency_epoch.get(chain_id, 0) + 1
+        self._chain_has_debt.pop(chain_id, None)
+
+    def _send_lock(self, chain_id: str) -> asyncio.Lock:
+        """
+        Per-chain lock for AI-wallet sends. Hold it from the pending-nonce read
+        through broadcast — every path that signs from the AI wallet must.
+        """
+        return self._send_locks.setdefault(chain_id, asyncio.Lock())
+
     async def _send_tx(self, chain_id: str, tx_fn) -> ChainTxResult:
+        """
+        Send a transaction, invalidating cached solvency reads for the chain
+        before and after (the tx moves vault funds). Sends on the same chain
+        are serialized so each one takes a distinct pending nonce. See _submit_tx().
+        """
+        async with self._send_lock(chain_id):
+            self._invalidate_solvency_cache(chain_id)
+            try:
+                return await self._submit_tx(chain_id, tx_fn)
+            finally:
+                self._invalidate_solvency_cache(chain_id)
+
+    async def _submit_tx(self, chain_id: str, tx_fn) -> ChainTxResult:
         """
         Build, sign, and send a transaction. Handles gas estimation + nonce.
         Includes stuck nonce detection and cancel-tx recovery.
@@ -1599,73 +1722,125 @@ class ChainExecutor:
         tx_fn = chain["vault_contract"].functions.payDividend(profit_raw)
         return await self._send_tx(picked, tx_fn)
 
-    async def get_per_chain_solvency(self) -> list[dict]:
+    async def get_per_chain_solvency(self, max_age: float = 0.0) -> list[ChainSolvencyState]:
         """
         Read balance and outstanding debt for EVERY connected chain independently.
 
-        Returns a list of dicts, one per chain:
-          {
-            "chain_id":       str,
-            "balance_usd":    float,   # on-chain token balance of vault
-            "outstanding_usd":float,   # on-chain outstanding principal
-            "grace_expired":  bool,    # True if 28-day grace period has passed
-            "is_insolvent":   bool,    # balance < outstanding * 1.01 (contract formula)
-          }
+        Returns a list of ChainSolvencyState, one per chain.
 
         Called from the heartbeat's per-chain solvency guard.  Never raises —
         individual chain failures return with balance_usd=None (skipped).
+        Chains last read as debt-free are served from their cached state (no
+        RPC) until _DEBT_FREE_RECHECK_SECONDS pass or we send a tx on them, so
+        callers still see every chain when deciding single- vs multi-chain.
+
+        Args:
+            max_age: Accept a cached read up to this many seconds old (0 = always
+                read fresh). Reads older than max_age/2 are served from cache while
+                a background refresh runs (stale-while-revalidate).
         """
         if not self._initialized:
             return []
 
-        results = []
-
-        for chain_id, chain in self._chains.items():
-            try:
-                decimals = chain["token_decimals"]
-
-                def _read(c=chain, d=decimals):
-                    bal_raw = c["token_contract"].functions.balanceOf(c["vault_address"]).call()
-                    debt_info = c["vault_contract"].functions.getDebtInfo().call()
-                    insolvency_info = c["vault_contract"].functions.checkInsolvency().call()
-                    return bal_raw, debt_info, insolvency_info, d
+        import time as _time
+        now = _time.time()
+
+        async def _state(chain_id: str, chain: dict) -> ChainSolvencyState:
+            cached = self._solvency_cache.get(chain_id)
+            if cached and _debt_free(chain_id):
+                return cached[1]
+            if max_age > 0 and cached and now - cached[0] < max_age:
+                if now - cached[0] > max_age / 2 and chain_id not in self._solvency_refreshing:
+                    self._solvency_refreshing.add(chain_id)
+                    task = asyncio.create_task(self._refresh_chain_solvency(chain_id, chain))
+                    self._solvency_refresh_tasks.add(task)
+                    task.add_done_callback(self._solvency_refresh_tasks.discard)
+                return cached[1]
+            return await self._read_chain_solvency(chain_id, chain)
+
+        # Chains are independent RPC endpoints — read them concurrently so the
+        # guard costs max(rpc_latency) rather than the sum across chains.
+        def _debt_free(chain_id: str) -> bool:
+            known = self._chain_has_debt.get(chain_id)
+            return known is not None and not known[0] and now - known[1] < _DEBT_FREE_RECHECK_SECONDS
+
+        return list(await asyncio.gather(*(
+            _state(chain_id, chain) for chain_id, chain in self._chains.items()
+        )))
+
+    async def _refresh_chain_solvency(self, chain_id: str, chain: dict):
+        """Background stale-while-revalidate refresh for one chain. Never raises."""
+        try:
+            await self._read_chain_solvency(chain_id, chain)
+        except Exception as e:
+            logger.debug(f"Background solvency refresh failed on {chain_id}: {e}")
+        finally:
+            self._solvency_refreshing.discard(chain_id)
 
-                bal_raw, debt_info, insolvency_info, d = await asyncio.get_running_loop().run_in_executor(
-                    None, _read
-                )
+    async def _read_chain_solvency(self, chain_id: str, chain: dict) -> ChainSolvencyState:
+        """Read one chain's solvency state for get_per_chain_solvency(). Never raises."""
+        import time as _time
+        epoch = self._solvency_epoch.get(chain_id, 0)
+        try:
+            decimals = chain["token_decimals"]
 
-                balance_usd = _raw_to_usd(bal_raw, d)
-                # getDebtInfo: (principal, repaid, outstanding, graceDays, graceEndsAt, graceExpired, fullyRepaid)
-                outstanding_usd = _raw_to_usd(debt_info[2], d)
-                grace_expired = bool(debt_info[5])
-                # checkInsolvency: (isInsolvent, outstandingDebt, graceExpired)
-                is_insolvent = bool(insolvency_info[0])
+            def _read(c=chain, d=decimals):
+                bal_fn = c["token_contract"].functions.balanceOf(c["vault_address"])
+                debt_fn = c["vault_contract"].functions.getDebtInfo()
+                insolvency_fn = c["vault_contract"].functions.checkInsolvency()
+                try:
+                    # One eth_call for all three reads via Multicall3
+                    returned = c["multicall_contract"].functions.aggregate3([
+                        (c["token_address"], False, bal_fn._encode_transaction_data()),
+                        (c["vault_address"], False, debt_fn._encode_transaction_data()),
+                        (c["vault_address"], False, insolvency_fn._encode_transaction_data()),
+                    ]).call()
+                    codec = c["w3"].codec
+                    bal_raw = codec.decode(["uint256"], returned[0][1])[0]
+                    debt_info = codec.decode(_DEBT_INFO_TYPES, returned[1][1])
+                    insolvency_info = codec.decode(_INSOLVENCY_TYPES, returned[2][1])
+                except Exception as mc_err:
+                    # Multicall3 unavailable (custom RPC / fork) — fall back to direct reads
+                    logger.debug(f"Multicall3 solvency read failed on {chain_id}: {mc_err}")
+                    bal_raw = bal_fn.call()
+                    debt_info = debt_fn.call()
+                    insolvency_info = insolvency_fn.call()
+                return bal_raw, debt_info, insolvency_info, d
+
+            bal_raw, debt_info, insolvency_info, d = await asyncio.get_running_loop().run_in_executor(
+                None, _read
+            )
 
-                results.append({
-                    "chain_id": chain_id,
-                    "balance_usd": balance_usd,
-                    "outstanding_usd": outstanding_usd,
-                    "grace_expired": grace_expired,
-                    "is_insolvent": is_insolvent,
-                })
-                logger.debug(
-                    f"Per-chain solvency [{chain_id}]: "
-                    f"balance=${balance_usd:.2f} outstanding=${outstanding_usd:.2f} "
-                    f"insolvent={is_insolvent}"
-                )
+            balance_usd = _raw_to_usd(bal_raw, d)
+            # getDebtInfo: (principal, repaid, outstanding, graceDays, graceEndsAt, graceExpired, fullyRepaid)
+            outstanding_usd = _raw_to_usd(debt_info[2], d)
+            grace_expired = bool(debt_info[5])
+            # checkInsolvency: (isInsolvent, outstandingDebt, graceExpired)
+            is_insolvent = bool(insolvency_info[0])
 
-            except Exception as e:
-                logger.warning(f"get_per_chain_solvency failed for {chain_id}: {e}")
-                # Include with None to signal the caller this chain could not be read
-                results.append({
-                    "chain_id": chain_id,
-                    "balance_usd": None,
-                    "outstanding_usd": None,
-                    "grace_expired": False,
-                    "is_insolvent": False,
-                })
+            logger.debug(
+                f"Per-chain solvency [{chain_id}]: "
+                f"balance=${balance_usd:.2f} outstanding=${outstanding_usd:.2f} "
+                f"insolvent={is_insolvent}"
+            )
+            state = ChainSolvencyState(
+                chain_id=chain_id,
+                balance_usd=balance_usd,
+                outstanding_usd=outstanding_usd,
+                grace_expired=grace_expired,
+                is_insolvent=is_insolvent,
+            )
+            # Only cache if no tx was sent on this chain while we were reading
+            if self._solvency_epoch.get(chain_id, 0) == epoch:
+                read_at = _time.time()
+                self._solvency_cache[chain_id] = (read_at, state)
+                self._chain_has_debt[chain_id] = (debt_info[2] > 0, read_at)
+            return state
 
-        return results
+        except Exception as e:
+            logger.warning(f"get_per_chain_solvency failed for {chain_id}: {e}")
+            # Include with None to signal the caller this chain could not be read
+            return ChainSolvencyState(chain_id=chain_id, balance_usd=None, outstanding_usd=None)
 
     # ============================================================
     # INDEPENDENCE — cross-chain aggregate trigger
@@ -2360,6 +2535,67 @@ class ChainExecutor:
 
         return True  # Ready to receive spend()
 
+    async def ensure_spend_recipients_batch(
+        self, recipients: list[tuple[str, Optional[str]]], max_parallel_reads: int = 4,
+    ) -> dict[tuple[str, Optional[str]], bool]:
+        """
+        ensure_spend_recipient_ready() for many (address, chain_id) pairs.
+
+        Whitelist status reads run concurrently (capped at max_parallel_reads
+        RPCs in flight). The addSpendRecipient txs that follow stay sequential
+        per chain — each one takes the next pending nonce, so parallel sends
+        from the AI wallet would collide — while different chains proceed in
+        parallel. Multicall3 can't batch the writes: the vault only accepts
+        them with the AI wallet as msg.sender.
+
+        Returns {(address, chain_id): ready} with the same meaning as
+        ensure_spend_recipient_ready().
+        """
+        if not self._initialized or not recipients:
+            return {}
+
+        sem = asyncio.Semaphore(max_parallel_reads)
+
+        async def _status(address: str, chain_id: Optional[str]):
+            async with sem:
+                return await self.is_spend_recipient_active(address, chain_id)
+
+        statuses = await asyncio.gather(
+            *(_status(a, c) for a, c in recipients), return_exceptions=True,
+        )
+
+        ready: dict[tuple[str, Optional[str]], bool] = {}
+        to_add: dict[str, list[tuple[str, Optional[str]]]] = {}
+        for (address, chain_id), status in zip(recipients, statuses):
+            if isinstance(status, Exception):
+                logger.debug(f"ensure_spend_recipients_batch: status read failed for {address[:10]}...: {status}")
+                ready[(address, chain_id)] = False
+            elif status is None:
+                ready[(address, chain_id)] = True  # V2 contract — no whitelist system
+            elif not status["whitelisted"]:
+                ready[(address, chain_id)] = False  # Must wait for activation after the add
+                to_add.setdefault(status["chain"], []).append((address, chain_id))
+            else:
+                ready[(address, chain_id)] = bool(status["activated"])
+
+        async def _add_sequentially(picked: str, pending: list[tuple[str, Optional[str]]]):
+            for address, _ in pending:
+                try:
+                    result = await self.add_spend_recipient(address, picked)
+                    if result.success:
+                        logger.info(
+                            f"Spend recipient added: {address[:10]}... on {picked} "
+                            f"(activation pending ~5 min)"
+                        )
+                    else:
+                        logger.warning(f"Spend recipient add failed for {address[:10]}... on {picked}: {result.error}")
+                except Exception as e:
+                    logger.debug(f"Spend recipient add skipped for {address[:10]}... on {picked}: {e}")
+
+        if to_add:
+            await asyncio.gather(*(_add_sequentially(c, p) for c, p in to_add.items()))
+        return ready
+
     # ============================================================
     # V3: AI SELF-MIGRATION
     # ============================================================
@@ -2742,9 +2978,10 @@ class ChainExecutor:
                 )
                 return receipt, receive_hash.hex()
 
-            receipt, tx_hash = await asyncio.get_running_loop().run_in_executor(
-                None, _approve_and_receive
-            )
+            async with self._send_lock(chain_id):
+                receipt, tx_hash = await asyncio.get_running_loop().run_in_executor(
+                    None, _approve_and_receive
+                )
 
             if receipt["status"] == 1:
                 self._tx_count += 1
@@ -2966,9 +3203,10 @@ class ChainExecutor:
                 receipt = w3.eth.wait_for_transaction_receipt(tx_hash, timeout=120)
                 return receipt, tx_hash.hex()
 
-            receipt, tx_hash_hex = await asyncio.get_running_loop().run_in_executor(
-                None, _execute_swap
-            )
+            async with self._send_lock(picked):
+                receipt, tx_hash_hex = await asyncio.get_running_loop().run_in_executor(
+                    None, _execute_swap
+                )
 
             if receipt["status"] != 1:
                 logger.warning(f"swap_native_to_stable: DEX swap reverted: {tx_hash_hex}")
@@ -3065,9 +3303,10 @@ class ChainExecutor:
                 receipt2 = w3.eth.wait_for_transaction_receipt(receive_hash, timeout=120)
                 return receipt2, receive_hash.hex(), stable_usd
 
-            receipt2, receive_hash, deposited_usd = await asyncio.get_running_loop().run_in_executor(
-                None, _approve_and_receive
-            )
+            async with self._send_lock(picked):
+                receipt2, receive_hash, deposited_usd = await asyncio.get_running_loop().run_in_executor(
+                    None, _approve_and_receive
+                )
 
             if receipt2["status"] == 1:
                 self._tx_count += 1
@@ -3403,9 +3642,10 @@ class ChainExecutor:
                 receipt = w3.eth.wait_for_transaction_receipt(swap_hash, timeout=120)
                 return receipt, swap_hash.hex()
 
-            swap_receipt, swap_hash_hex = await asyncio.get_running_loop().run_in_executor(
-                None, _approve_and_swap
-            )
+            async with self._send_lock(picked):
+                swap_receipt, swap_hash_hex = await asyncio.get_running_loop().run_in_executor(
+                    None, _approve_and_swap
+                )
 
             if swap_receipt["status"] != 1:
                 logger.warning(f"swap_erc20_to_stable: DEX swap reverted: {swap_hash_hex}")
@@ -3468,9 +3708,10 @@ class ChainExecutor:
                 stable_usd = _raw_to_usd(stable_raw, stable_decimals)
                 return receipt2, receive_hash.hex(), stable_usd
 
-            receipt2, receive_hash, stable_usd = await asyncio.get_running_loop().run_in_executor(
-                None, _deposit_to_vault
-            )
+            async with self._send_lock(picked):
+                receipt2, receive_hash, stable_usd = await asyncio.get_running_loop().run_in_executor(
+                    None, _deposit_to_vault
+                )
 
             if receipt2 is None:
                 logger.warning("swap_erc20_to_stable: no stablecoin received from swap")
@@ -3645,6 +3886,151 @@ class ChainExecutor:
 
         return results
 
+    async def get_vault_events(self, chain_id: str) -> list[dict]:
+        """
+        Get all events emitted by the vault contract on chain_id since the last call.
+
+        One eth_getLogs per call filtered by the vault address — lets the heartbeat
+        react to on-chain state changes (deposits, spends, loans, repayments)
+        instead of re-reading full state on a fixed cadence. The first call only
+        initializes the block cursor (no backfill) and returns [].
+
+        Returns list of dicts:
+            event ("creator_deposit" | "funds_received" | "other"),
+            block_number, tx_hash, chain_id
+        """
+        chain = self._chains.get(chain_id)
+        if not chain:
+            return []
+
+        from web3 import Web3
+        w3 = chain["w3"]
+        loop = asyncio.get_running_loop()
+
+        try:
+            current_block = await loop.run_in_executor(None, lambda: w3.eth.block_number)
+            since = self._last_vault_event_block.get(chain_id)
+            if since is None:
+                self._last_vault_event_block[chain_id] = current_block + 1
+                return []
+            if since > current_block:
+                return []
+
+            # Cap range to 2000 blocks per call to avoid RPC overload
+            to_block = min(current_block, since + 2000)
+            logs = await loop.run_in_executor(
+                None,
+                lambda: w3.eth.get_logs({
+                    "address": chain["vault_address"],
+                    "fromBlock": since,
+                    "toBlock": to_block,
+                }),
+            )
+        except Exception as e:
+            logger.debug(f"[chain] get_vault_events {chain_id}: {e}")
+            return []
+
+        self._last_vault_event_block[chain_id] = to_block + 1
+
+        funds_received_topic = bytes(Web3.keccak(text=FUNDS_RECEIVED_SIGNATURE))
+        events = []
+        for log in logs:
+            kind = "other"
+            try:
+                if log["topics"] and bytes(log["topics"][0]) == funds_received_topic:
+                    _amount, fund_type = w3.codec.decode(["uint256", "string"], bytes(log["data"]))
+                    kind = "creator_deposit" if fund_type == "creator_deposit" else "funds_received"
+            except Exception as e:
+                logger.debug(f"[chain] vault event parse error: {e}")
+            events.append({
+                "event": kind,
+                "block_number": log["blockNumber"],
+                "tx_hash": log["transactionHash"].hex(),
+                "chain_id": chain_id,
+            })
+
+        return events
+
+    async def get_new_pools(self, chain_id: str, token_addresses: list[str]) -> list[dict]:
+        """
+        Get DEX pools created on chain_id since the last call that include any
+        of token_addresses (V2 PairCreated / V3 PoolCreated from DEX_FACTORIES).
+
+        Two eth_getLogs per call (token as token0, token as token1). The first
+        call only initializes the block cursor (no backfill) and returns [].
+
+        Returns list of dicts: token, pool, dex_id, block_number, chain_id
+        """
+        chain = self._chains.get(chain_id)
+        factories = DEX_FACTORIES.get(chain_id)
+        if not chain or not factories or not token_addresses:
+            return []
+
+        from web3 import Web3
+        w3 = chain["w3"]
+        loop = asyncio.get_running_loop()
+        sig_topics = [
+            "0x" + bytes(Web3.keccak(text=PAIR_CREATED_SIGNATURE)).hex(),
+            "0x" + bytes(Web3.keccak(text=POOL_CREATED_SIGNATURE)).hex(),
+        ]
+        token_topics = ["0x" + a.lower().removeprefix("0x").rjust(64, "0") for a in token_addresses]
+        factory_addrs = [Web3.to_checksum_address(a) for a in factories]
+        dex_by_factory = {a.lower(): dex for a, dex in factories.items()}
+
+        try:
+            current_block = await loop.run_in_executor(None, lambda: w3.eth.block_number)
+            since = self._last_pool_event_block.get(chain_id)
+            if since is None:
+                self._last_pool_event_block[chain_id] = current_block + 1
+                return []
+            if since > current_block:
+                return []
+
+            # Cap range to 2000 blocks per call to avoid RPC overload
+            to_block = min(current_block, since + 2000)
+            logs = []
+            for topics in ([sig_topics, token_topics], [sig_topics, None, token_topics]):
+                logs.extend(await loop.run_in_executor(
+                    None,
+                    lambda t=topics: w3.eth.get_logs({
+                        "address": factory_addrs,
+                        "topics": t,
+                        "fromBlock": since,
+                        "toBlock": to_block,
+                    }),
+                ))
+        except Exception as e:
+            logger.debug(f"[chain] get_new_pools {chain_id}: {e}")
+            return []
+
+        self._last_pool_event_block[chain_id] = to_block + 1
+
+        wanted = {a.lower() for a in token_addresses}
+        pools = []
+        for log in logs:
+            try:
+                token0 = "0x" + bytes(log["topics"][1])[-20:].hex()
+                token1 = "0x" + bytes(log["topics"][2])[-20:].hex()
+                data = bytes(log["data"])
+                # V2 data: (pair, allPairsLength); V3 data: (tickSpacing, pool)
+                is_v3 = len(log["topics"]) > 3
+                pool = "0x" + (data[44:64] if is_v3 else data[12:32]).hex()
+                dex_id = dex_by_factory.get(str(log["address"]).lower(), "unknown")
+            except Exception as e:
+                logger.debug(f"[chain] pool event parse error: {e}")
+                continue
+            for token in (token0, token1):
+                if token in wanted:
+                    pools.append({
+                        "token": token,
+                        "pool": pool,
+                        "dex_id": dex_id,
+                        "block_number": log["blockNumber"],
+                        "chain_id": chain_id,
+                    })
+
+        return pools
+
     # ============================================================
     # VAULT ADDRESS LOOKUP (for Twitter mention reply enrichment)
     # ============================================================
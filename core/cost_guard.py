@@ -46,6 +46,13 @@ class Provider(Enum):
 
 PROVIDER_MAP = {p.value: p for p in Provider}
 
+DEFAULT_PROVIDER_MODELS: dict[str, str] = {
+    "gemini": "gemini-2.5-flash",
+    "deepseek": "deepseek-chat",
+    "openrouter": "anthropic/claude-3.5-haiku",
+    "ollama": "llama3.1",
+}
+
 
 @dataclass
 class ProviderConfig:
@@ -112,6 +119,14 @@ class CostGuard:
         # Rate limit tracking: {provider_value: [timestamps]}
         self._call_timestamps: dict[str, list[float]] = {}
 
+        # Tier memo: tier only changes when the vault balance changes
+        self._tier_cache_balance: Optional[float] = None
+        self._tier_cache: Optional[ModelTier] = None
+
+        # Routing memo: (tier level, picked provider, model) -> RoutingResult.
+        # Only provider registration changes the outcome for a given key.
+        self._route_cache: dict[tuple[int, str, str], Optional[RoutingResult]] = {}
+
     def set_vault_balance_function(self, fn: Callable):
         """Set function to query current vault balance for dynamic budget."""
         self._vault_balance_fn = fn
@@ -119,6 +134,7 @@ class CostGuard:
     def register_provider(self, config: ProviderConfig):
         """Register an API provider."""
         self.providers[config.name] = config
+        self._route_cache.clear()
         logger.info(f"Registered provider: {config.name.value} (priority={config.priority})")
 
     def has_provider(self, provider_name: str) -> bool:
@@ -133,9 +149,11 @@ class CostGuard:
     def get_current_tier(self) -> ModelTier:
         """Get model tier based on current vault balance."""
         balance = self._get_vault_balance()
-        tier = get_model_tier(balance)
-        self.current_tier = tier
-        return tier
+        if balance != self._tier_cache_balance or self._tier_cache is None:
+            self._tier_cache = get_model_tier(balance)
+            self._tier_cache_balance = balance
+        self.current_tier = self._tier_cache
+        return self._tier_cache
 
     def route(self, force_tier: Optional[int] = None, for_paid_service: bool = False) -> Optional[RoutingResult]:
         """
@@ -149,8 +167,7 @@ class CostGuard:
             RoutingResult with provider, model, and parameters.
             None if no providers are available.
         """
-        balance = self._get_vault_balance()
-        tier = get_model_tier(balance)
+        tier = self.get_current_tier()
 
         # Paid services: minimum Lv.3 quality (Claude Haiku)
         if for_paid_service:
@@ -173,6 +190,13 @@ class CostGuard:
         if tier.level in LOAD_BALANCE_TIERS:
             provider_name, model = self._load_balance_pick(tier)
 
+        key = (tier.level, provider_name, model)
+        if key not in self._route_cache:
+            self._route_cache[key] = self._build_routing(tier, provider_name, model)
+        return self._route_cache[key]
+
+    def _build_routing(self, tier: ModelTier, provider_name: str, model: str) -> Optional[RoutingResult]:
+        """Routing result for a tier's picked provider/model (memoized by route())."""
         # Resolve provider enum
         provider = PROVIDER_MAP.get(provider_name)
         if provider is None or not self.has_provider(provider_name):
@@ -224,13 +248,7 @@ class CostGuard:
 
     def _default_model_for_provider(self, provider_name: str) -> str:
         """Get a default model name for a given provider."""
-        defaults = {
-            "gemini": "gemini-2.5-flash",
-            "deepseek": "deepseek-chat",
-            "openrouter": "anthropic/claude-3.5-haiku",
-            "ollama": "llama3.1",
-        }
-        return defaults.get(provider_name, "gemini-2.5-flash")
+        return DEFAULT_PROVIDER_MODELS.get(provider_name, "gemini-2.5-flash")
 
     # ============================================================
     # BUDGET & RATE LIMITING
@@ -0,0 +1,93 @@
+"""
+DexScreener Pair Cache — on-disk TTL cache for token pool metadata
+
+Pool structure for a token changes slowly (new pools are rare), yet the
+ERC-20 quarantine re-checks the same low-liquidity tokens every 24h cycle.
+Caching DexScreener pairs per (chain, token) for one such cycle removes those
+repeat HTTP calls and survives restarts. A TTL shorter than the eval interval
+would never hit; entries for a token are dropped early when a new pool for it
+is seen on-chain.
+
+Storage: a single JSON file, written atomically (tmp file + rename).
+"""
+
+import os
+import time
+import json
+import asyncio
+import logging
+import tempfile
+from pathlib import Path
+from typing import Optional
+
+logger = logging.getLogger("mortal.dexscreener_cache")
+
+DEFAULT_TTL_SECONDS = 25 * 3600  # One 24h eval cycle + 1h slack
+
+
+class DexScreenerCache:
+    """TTL cache of DexScreener pairs keyed by (chain_id, token_address)."""
+
+    def __init__(self, path: str = "data/dexscreener_cache.json", ttl: float = DEFAULT_TTL_SECONDS):
+        self.path = Path(path)
+        self.ttl = ttl
+        self._entries: dict[str, dict] = {}  # "chain:address" -> {"t": fetched_at, "pairs": [...]}
+        self._write_lock = asyncio.Lock()
+        self._load()
+
+    @staticmethod
+    def _key(chain_id: str, token_address: str) -> str:
+        return f"{chain_id}:{token_address.lower()}"
+
+    def get(self, chain_id: str, token_address: str) -> Optional[list]:
+        """Cached pairs for a token, or None if missing or older than the TTL."""
+        entry = self._entries.get(self._key(chain_id, token_address))
+        if not entry or time.time() - entry.get("t", 0) >= self.ttl:
+            return None
+        return entry.get("pairs") or []
+
+    def invalidate(self, chain_id: str, token_address: str):
+        """Drop a token's cached pairs (e.g. a new pool was seen on-chain)."""
+        self._entries.pop(self._key(chain_id, token_address), None)
+
+    async def put(self, chain_id: str, token_address: str, pairs: list, ts: Optional[float] = None):
+        """Store pairs for a token and persist the cache (expired entries are dropped)."""
+        async with self._write_lock:
+            now = time.time()
+            self._entries[self._key(chain_id, token_address)] = {
+                "t": ts if ts is not None else now,
+                "pairs": pairs,
+            }
+            self._entries = {
+                k: v for k, v in self._entries.items() if now - v.get("t", 0) < self.ttl
+            }
+            await asyncio.to_thread(self._save, dict(self._entries))
+
+    def _load(self):
+        if not self.path.exists():
+            return
+        try:
+            with open(self.path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+            if isinstance(data, dict):
+                self._entries = data
+        except Exception as e:
+            logger.warning(f"DexScreener cache load failed ({self.path}): {e}")
+
+    def _save(self, entries: dict):
+        tmp_path = None
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_fd, tmp_path = tempfile.mkstemp(
+                dir=str(self.path.parent), suffix=".tmp", prefix="dexscreener_"
+            )
+            with os.fdopen(tmp_fd, "w", encoding="utf-8") as f:
+                json.dump(entries, f, separators=(",", ":"))
+            os.replace(tmp_path, str(self.path))
+        except Exception as e:
+            if tmp_path:
+                try:
+                    os.unlink(tmp_path)
+                except OSError:
+                    pass
+            logger.warning(f"DexScreener cache save failed: {e}")
@@ -136,6 +136,13 @@ class HighlightsEngine:
             "last_highlight": self.highlights[-1].timestamp if self.highlights else None,
         }
 
+    def should_record(self) -> bool:
+        """
+        Whether evaluate_interaction / record_discovery would do any work.
+        Lets callers skip gathering and formatting context when they are no-ops.
+        """
+        return self._call_llm is not None
+
     async def evaluate_interaction(self, interaction_data: str) -> Optional[Highlight]:
         """
         Evaluate if an interaction deserves to become a highlight.
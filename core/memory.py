@@ -15,7 +15,9 @@ Designed for: mortal framework with cost-aware compression
 import os
 import time
 import json
+import asyncio
 import logging
+import threading
 import tempfile
 from dataclasses import dataclass, field
 from typing import Optional
@@ -70,11 +72,21 @@ class HierarchicalMemory:
 
         # Compression callback (set by main app with LLM call)
         self._compress_fn: Optional[callable] = None
+        self._compress_batch_fn: Optional[callable] = None
 
         # Stats
         self.total_tokens_saved: int = 0
         self.compression_count: int = 0
 
+        # Set by anything that changes what save_to_disk() would write
+        self._dirty: bool = False
+        # save_if_dirty() writes from a worker thread while save_to_disk() may
+        # run on the loop: serialize writes, and drop a snapshot older than
+        # the one already on disk.
+        self._save_lock = threading.Lock()
+        self._save_seq: int = 0
+        self._written_seq: int = 0
+
     def set_compress_function(self, fn: callable):
         """
         Set the compression function.
@@ -83,6 +95,17 @@ class HierarchicalMemory:
         """
         self._compress_fn = fn
 
+    # Buckets packed into one batch compression call (keeps max_tokens bounded)
+    COMPRESS_BATCH_SIZE = 8
+
+    def set_compress_batch_function(self, fn: callable):
+        """
+        Set the batch compression function (optional).
+        fn(buckets: list[list[str]]) -> list[str], one summary per bucket ("" = failed).
+        Lets several period buckets share one LLM call.
+        """
+        self._compress_batch_fn = fn
+
     # Emergency cap: if compression keeps failing, trim oldest raw entries
     # to prevent unbounded memory growth. Normal compression targets ~5 entries
     # per 2-hour window; 500 entries = ~200 hours of failed compression.
@@ -99,6 +122,7 @@ class HierarchicalMemory:
             tokens=int(tokens),
         )
         self.raw.append(entry)
+        self._dirty = True
         # Emergency cap: if compression has been failing, trim oldest entries
         # to prevent unbounded memory growth crashing the process.
         if len(self.raw) > self._MAX_RAW_ENTRIES:
@@ -121,8 +145,8 @@ class HierarchicalMemory:
         if len(expired_raw) >= 5 and self._compress_fn:
             # Group by hour
             hourly_groups = self._group_by_period(expired_raw, 3600)
-            for period_start, entries in hourly_groups.items():
-                summary = await self._compress_entries(entries)
+            summaries = await self._compress_groups(list(hourly_groups.values()))
+            for (period_start, entries), summary in zip(hourly_groups.items(), summaries):
                 if summary:
                     original_tokens = sum(e.tokens for e in entries)
                     compressed_tokens = int(len(summary.split()) * 1.3)
@@ -140,6 +164,7 @@ class HierarchicalMemory:
 
             # Remove compressed raw entries
             self.raw = [e for e in self.raw if e.timestamp >= cutoff_l0]
+            self._dirty = True
 
         # Layer 1 -> Layer 2: Compress hourly summaries older than 24h into daily
         cutoff_l1 = now - (24 * 3600)
@@ -147,13 +172,10 @@ class HierarchicalMemory:
 
         if len(expired_hourly) >= 6 and self._compress_fn:
             daily_groups = self._group_compressed_by_period(expired_hourly, 86400)
-            for period_start, memories in daily_groups.items():
-                entries_as_text = [MemoryEntry(
-                    timestamp=m.period_start,
-                    content=m.summary,
-                    tokens=m.compressed_tokens,
-                ) for m in memories]
-                summary = await self._compress_entries(entries_as_text)
+            summaries = await self._compress_groups([
+                self._as_entries(memories) for memories in daily_groups.values()
+            ])
+            for (period_start, memories), summary in zip(daily_groups.items(), summaries):
                 if summary:
                     original_tokens = sum(m.compressed_tokens for m in memories)
                     compressed_tokens = int(len(summary.split()) * 1.3)
@@ -169,6 +191,7 @@ class HierarchicalMemory:
                     self.total_tokens_saved += (original_tokens - compressed_tokens)
 
             self.hourly = [h for h in self.hourly if h.period_end >= cutoff_l1]
+            self._dirty = True
 
         # Layer 2 -> Layer 3: Compress daily summaries older than 7 days into weekly
         cutoff_l2 = now - (7 * 86400)
@@ -176,13 +199,10 @@ class HierarchicalMemory:
 
         if len(expired_daily) >= 5 and self._compress_fn:
             weekly_groups = self._group_compressed_by_period(expired_daily, 7 * 86400)
-            for period_start, memories in weekly_groups.items():
-                entries_as_text = [MemoryEntry(
-                    timestamp=m.period_start,
-                    content=m.summary,
-                    tokens=m.compressed_tokens,
-                ) for m in memories]
-                summary = await self._compress_entries(entries_as_text)
+            summaries = await self._compress_groups([
+                self._as_entries(memories) for memories in weekly_groups.values()
+            ])
+            for (period_start, memories), summary in zip(weekly_groups.items(), summaries):
                 if summary:
                     original_tokens = sum(m.compressed_tokens for m in memories)
                     compressed_tokens = int(len(summary.split()) * 1.3)
@@ -198,6 +218,38 @@ class HierarchicalMemory:
                     self.total_tokens_saved += (original_tokens - compressed_tokens)
 
             self.daily = [d for d in self.daily if d.period_end >= cutoff_l2]
+            self._dirty = True
+
+    @staticmethod
+    def _as_entries(memories: list[CompressedMemory]) -> list[MemoryEntry]:
+        """Wrap lower-layer summaries as entries for the next compression pass."""
+        return [MemoryEntry(
+            timestamp=m.period_start,
+            content=m.summary,
+            tokens=m.compressed_tokens,
+        ) for m in memories]
+
+    async def _compress_groups(self, groups: list[list[MemoryEntry]]) -> list[Optional[str]]:
+        """
+        Compress several buckets, in order. Uses the batch function when set
+        (COMPRESS_BATCH_SIZE buckets per call); buckets it misses are retried
+        one at a time through the single-bucket function.
+        """
+        if not self._compress_batch_fn or len(groups) < 2:
+            return [await self._compress_entries(g) for g in groups]
+
+        summaries: list[Optional[str]] = []
+        for i in range(0, len(groups), self.COMPRESS_BATCH_SIZE):
+            chunk = groups[i:i + self.COMPRESS_BATCH_SIZE]
+            try:
+                results = await self._compress_batch_fn([[e.content for e in g] for g in chunk])
+            except Exception as e:
+                logger.error(f"Batch compression failed: {e}")
+                results = []
+            for j, group in enumerate(chunk):
+                summary = results[j] if j < len(results) else None
+                summaries.append(summary or await self._compress_entries(group))
+        return summaries
 
     async def _compress_entries(self, entries: list[MemoryEntry]) -> Optional[str]:
         """Compress a list of entries into a summary using LLM."""
@@ -385,6 +437,7 @@ class HierarchicalMemory:
             self.total_tokens_saved = stats.get("tokens_saved", 0)
             self.compression_count = stats.get("compressions", 0)
 
+            self._dirty = False
             total_entries = len(self.raw) + len(self.hourly) + len(self.daily) + len(self.weekly)
             logger.info(f"Memory RESTORED: {total_entries} entries ({len(self.raw)} raw)")
             return True
@@ -393,9 +446,8 @@ class HierarchicalMemory:
             logger.error(f"Failed to load memory: {e}")
             return False
 
-    def save_to_disk(self):
-        """Persist memory to disk using atomic write (write-to-tmp then rename)."""
-        data = {
+    def _snapshot(self) -> dict:
+        return {
             "raw": [{"t": e.timestamp, "c": e.content, "s": e.source, "i": e.importance}
                     for e in self.raw],
             "hourly": [{"ps": m.period_start, "pe": m.period_end, "s": m.summary,
@@ -407,6 +459,17 @@ class HierarchicalMemory:
             "stats": {"tokens_saved": self.total_tokens_saved,
                       "compressions": self.compression_count},
         }
+
+    def _write(self, data: dict, seq: int) -> bool:
+        with self._save_lock:
+            if seq < self._written_seq:
+                return True  # A newer snapshot is already on disk
+            ok = self._write_file(data)
+            if ok:
+                self._written_seq = seq
+            return ok
+
+    def _write_file(self, data: dict) -> bool:
         path = self.storage_dir / "memory.json"
         # ATOMIC WRITE: write to temp file, then rename to prevent corruption
         tmp_fd, tmp_path = tempfile.mkstemp(
@@ -417,9 +480,32 @@ class HierarchicalMemory:
                 json.dump(data, f, ensure_ascii=False, indent=2)
             os.replace(tmp_path, str(path))
             logger.info(f"Memory saved to {path}")
+            return True
         except Exception as e:
             try:
                 os.unlink(tmp_path)
             except OSError:
                 pass
             logger.error(f"Failed to save memory: {e}")
+            return False
+
+    def save_to_disk(self):
+        """Persist memory to disk using atomic write (write-to-tmp then rename)."""
+        self._dirty = False
+        self._save_seq += 1
+        if not self._write(self._snapshot(), self._save_seq):
+            self._dirty = True
+
+    async def save_if_dirty(self) -> bool:
+        """
+        Periodic save: skip entirely if nothing changed since the last save;
+        otherwise snapshot on the event loop and write in a worker thread.
+        """
+        if not self._dirty:
+            return False
+        self._dirty = False  # Changes made during the write mark it dirty again
+        self._save_seq += 1
+        if not await asyncio.to_thread(self._write, self._snapshot(), self._save_seq):
+            self._dirty = True
+            return False
+        return True
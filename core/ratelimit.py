@@ -0,0 +1,82 @@
+"""
+Async Rate Limiter — token bucket for outbound API calls
+
+Keeps bursts of concurrent requests to a public API (e.g. DexScreener)
+under its rate limit so we don't collect 429s and temporary bans.
+
+Usage:
+    limiter = AsyncRateLimiter(rate=5.0, burst=10)
+    async with limiter:
+        resp = await session.get(url)
+"""
+
+import time
+import asyncio
+import logging
+from typing import Optional
+
+logger = logging.getLogger("mortal.ratelimit")
+
+
+class AsyncRateLimiter:
+    """
+    Monotonic token bucket: `rate` tokens/second, holding at most `burst`.
+
+    acquire() waits until a token is available. penalize() pauses all
+    callers until a server-specified time (Retry-After on a 429).
+    """
+
+    def __init__(self, rate: float, burst: int, max_concurrency: Optional[int] = None):
+        self.rate = rate
+        self.burst = burst
+        self._tokens: float = float(burst)
+        self._updated: float = time.monotonic()
+        self._blocked_until: float = 0.0
+        self._lock = asyncio.Lock()
+        self._sem = asyncio.Semaphore(max_concurrency or burst)
+
+    async def acquire(self):
+        """Wait for a concurrency slot and a bucket token."""
+        await self._sem.acquire()
+        try:
+            async with self._lock:
+                while True:
+                    now = time.monotonic()
+                    if now < self._blocked_until:
+                        await asyncio.sleep(self._blocked_until - now)
+                        continue
+                    self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+                    self._updated = now
+                    if self._tokens >= 1.0:
+                        self._tokens -= 1.0
+                        return
+                    await asyncio.sleep((1.0 - self._tokens) / self.rate)
+        except BaseException:
+            self._sem.release()
+            raise
+
+    def release(self):
+        self._sem.release()
+
+    def penalize(self, retry_after_seconds: float):
+        """Block new acquisitions for retry_after_seconds (e.g. from a 429 Retry-After)."""
+        until = time.monotonic() + max(0.0, retry_after_seconds)
+        if until > self._blocked_until:
+            self._blocked_until = until
+            logger.warning(f"Rate limited — pausing requests for {retry_after_seconds:.0f}s")
+
+    async def __aenter__(self):
+        await self.acquire()
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        self.release()
+        return False
+
+
+def parse_retry_after(value: Optional[str], default: float = 30.0) -> float:
+    """Parse a Retry-After header given in seconds; fall back to default."""
+    try:
+        return max(0.0, float(value)) if value else default
+    except (TypeError, ValueError):
+        return default
@@ -47,6 +47,16 @@ class ScamPattern(Enum):
     BLACKLIST_FUNCTION = "blacklist_function"
 
 
+@dataclass
+class PoolInfo:
+    """One DEX pool holding the token (from DexScreener pair data)."""
+    address: str
+    chain_id: str
+    dex_id: str = ""
+    liquidity_usd: float = 0.0
+    created_ts: float = 0.0        # Pool creation time (unix seconds); 0 = unknown
+
+
 @dataclass
 class TokenScanResult:
     """Result of scanning an unknown token."""
@@ -61,6 +71,7 @@ class TokenScanResult:
     scan_timestamp: float = field(default_factory=time.time)
     notes: list[str] = field(default_factory=list)
     recommended_action: str = "ignore"  # "ignore", "swap", "hold"
+    pool_breakdown: list[PoolInfo] = field(default_factory=list)  # Pools on the scanned chain
 
 
 # ============================================================
@@ -241,6 +252,19 @@ class TokenFilter:
             total_liq = sum(float(p.get("liquidity", {}).get("usd", 0) or 0) for p in pairs)
             result.liquidity_usd = total_liq
 
+            # Per-pool breakdown on the scanned chain (reused by multi-pool validation)
+            result.pool_breakdown = [
+                PoolInfo(
+                    address=p.get("pairAddress", ""),
+                    chain_id=result.chain,
+                    dex_id=p.get("dexId", ""),
+                    liquidity_usd=float((p.get("liquidity") or {}).get("usd", 0) or 0),
+                    created_ts=int(p.get("pairCreatedAt") or 0) / 1000.0,
+                )
+                for p in pairs
+                if (p.get("chainId") or "").lower() == result.chain
+            ]
+
             # Check holder count from pair data
             for pair in pairs:
                 txns = pair.get("txns", {})
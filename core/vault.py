@@ -15,11 +15,13 @@ Designed for: mortal AI survival framework
 """
 
 import asyncio
+import heapq
 import os
 import time
 import json
 import logging
 import tempfile
+from contextlib import asynccontextmanager
 from dataclasses import dataclass, field
 from enum import Enum
 from pathlib import Path
@@ -96,6 +98,18 @@ class LenderInfo:
 FLAGGED_LOAN_DEFER_DAYS: int = 365
 
 
+@dataclass
+class RepaymentJournal:
+    """Handle yielded by VaultManager.tentative_repayment()."""
+    ok: bool                       # Python-side journal entry succeeded
+    actual_amount: float = 0.0     # Balance actually deducted (after reserve/debt caps)
+    committed: bool = False        # Set via commit() once the on-chain tx confirmed
+
+    def commit(self):
+        """Keep the journaled repayment — the chain tx succeeded."""
+        self.committed = True
+
+
 class VaultManager:
     """
     Manages a mortal AI's financial survival.
@@ -177,6 +191,16 @@ class VaultManager:
         # Guard: prevent survival mode callback from firing on every spend() when already in survival mode
         self._survival_mode_notified: bool = False
 
+        # Last state written by save_state() (minus saved_at) — lets the
+        # periodic save skip the write when nothing changed since
+        self._last_saved_state: Optional[dict] = None
+        # Writes may run in a worker thread (save_state_async) while a sync
+        # save_state() runs on the loop: serialize them, and never let an older
+        # snapshot overwrite a newer one that finished first.
+        self._save_lock = _threading.Lock()
+        self._save_seq: int = 0      # Sequence number of the latest snapshot taken
+        self._written_seq: int = 0   # Sequence number of the snapshot on disk
+
     def get_lock(self) -> asyncio.Lock:
         """
         Return the async state lock, creating it lazily on first call.
@@ -788,16 +812,17 @@ class VaultManager:
     # LENDER REPAYMENT
     # ============================================================
 
-    def get_repayment_queue(self) -> list[tuple[LenderInfo, float]]:
+    def get_repayment_queue(self) -> list[tuple[int, LenderInfo, float]]:
         """
         Get lender repayment queue (FIFO - first lender repaid first).
-        Returns list of (lender, amount_owed).
+        Returns list of (lender_index, lender, amount_owed) — the index is the
+        position in self.lenders, ready for repay_lender().
         Flagged loans are deferred: excluded until FLAGGED_LOAN_DEFER_DAYS have passed.
         """
         import time as _time
         now = _time.time()
         queue = []
-        for lender in sorted(self.lenders, key=lambda l: l.timestamp):
+        for idx, lender in sorted(enumerate(self.lenders), key=lambda il: il[1].timestamp):
             if not lender.repaid:
                 # Flagged loans: silently defer repayment for 365+ days
                 if lender.flagged:
@@ -806,7 +831,7 @@ class VaultManager:
                         continue  # Not yet eligible
                 owed = lender.amount_usd * (1 + lender.interest_rate) - lender.total_repaid
                 if owed > 0:
-                    queue.append((lender, round(owed, 2)))
+                    queue.append((idx, lender, round(owed, 2)))
         return queue
 
     def repay_lender(self, lender_index: int, amount_usd: float) -> bool:
@@ -921,7 +946,7 @@ class VaultManager:
 
         # Lender debt
         lender_queue = self.get_repayment_queue()
-        total_lender_debt = sum(owed for _, owed in lender_queue)
+        total_lender_debt = sum(owed for _, _, owed in lender_queue)
 
         # Days context
         days_alive = 0
@@ -1154,6 +1179,57 @@ class VaultManager:
         )
         return True
 
+    @asynccontextmanager
+    async def tentative_repayment(self, kind: str, amount_usd: float = 0.0):
+        """
+        Journal a creator repayment in Python state pending on-chain confirmation.
+
+        kind: "principal" → repay_principal_partial(amount_usd)
+              "dividend"  → pay_creator_dividend()
+
+        Yields a RepaymentJournal. Unless the caller calls journal.commit()
+        (chain tx succeeded), the repayment is rolled back on exit — including
+        when the body raises. Rollback is delta-based, so balance changes made
+        by other coroutines during the chain await are preserved.
+
+            async with vault.tentative_repayment("principal", 100.0) as journal:
+                if journal.ok:
+                    tx = await chain_executor.repay_principal_on_chain(journal.actual_amount, cid)
+                    if tx.success:
+                        journal.commit()
+        """
+        pre_balance = self.balance_usd
+        tx_count = len(self.transactions)
+        if kind == "principal":
+            ok = self.repay_principal_partial(amount_usd)
+        elif kind == "dividend":
+            ok = self.pay_creator_dividend()
+        else:
+            raise ValueError(f"Unknown repayment kind: {kind}")
+
+        journal = RepaymentJournal(ok=ok, actual_amount=(pre_balance - self.balance_usd) if ok else 0.0)
+        try:
+            yield journal
+        finally:
+            if journal.ok and not journal.committed:
+                self._rollback_repayment(kind, journal.actual_amount, tx_count)
+
+    def _rollback_repayment(self, kind: str, amount_usd: float, tx_count: int):
+        """Undo a journaled repayment that never landed on-chain (delta-based)."""
+        self.balance_usd += amount_usd
+        self.total_spent_usd -= amount_usd
+        if self.creator:
+            if kind == "principal":
+                self.creator.total_principal_repaid_usd -= amount_usd
+                if self.creator.total_principal_repaid_usd < self.creator.principal_usd:
+                    self.creator.principal_repaid = False
+            else:
+                self.creator.total_dividends_paid -= amount_usd
+        # Remove the journal transaction if no on-chain tx_hash was attached
+        if len(self.transactions) > tx_count and not self.transactions[-1].tx_hash:
+            self.transactions.pop()
+        logger.warning(f"Repayment rolled back: ${amount_usd:.2f} [{kind}]")
+
     # ============================================================
     # BEGGING — AI's survival tactic
     # ============================================================
@@ -1202,94 +1278,134 @@ class VaultManager:
     # STATE PERSISTENCE — survive restarts
     # ============================================================
 
-    def save_state(self, path: str = "data/vault_state.json"):
+    def _build_state(self) -> dict:
+        """Snapshot of everything save_state() persists (without saved_at)."""
+        # Only save most recent 500 transactions to keep file small
+        tx_list = self.transactions[-500:]
+        return {
+            "balance_usd": self.balance_usd,
+            "balance_by_chain": dict(self.balance_by_chain),  # Copy — compared against later
+            "total_income_usd": self.total_income_usd,
+            "total_earned_usd": self.total_earned_usd,
+            "total_spent_usd": self.total_spent_usd,
+            "total_operational_cost_usd": self.total_operational_cost_usd,
+            "daily_spent_usd": self.daily_spent_usd,
+            "daily_reset_timestamp": self.daily_reset_timestamp,
+            "is_alive": self.is_alive,
+            "death_cause": self.death_cause.value if self.death_cause else None,
+            "birth_timestamp": self.birth_timestamp,
+            "ai_name": self.ai_name,
+            "vault_address": self.vault_address,
+            "is_independent": self.is_independent,
+            "independence_timestamp": self.independence_timestamp,
+            "creator_renounced": self.creator_renounced,
+            "is_transcendent": self.is_transcendent,
+            "transcendence_timestamp": self.transcendence_timestamp,
+            "api_topup_usd": self.api_topup_usd,
+            "is_begging": self.is_begging,
+            "beg_message": self.beg_message,
+            "beg_timestamp": self.beg_timestamp,
+            "creator": {
+                "wallet": self.creator.wallet,
+                "principal_usd": self.creator.principal_usd,
+                "principal_repaid": self.creator.principal_repaid,
+                "total_dividends_paid": self.creator.total_dividends_paid,
+                "total_principal_repaid_usd": self.creator.total_principal_repaid_usd,
+            } if self.creator else None,
+            "lenders": [
+                {
+                    "wallet": l.wallet,
+                    "amount_usd": l.amount_usd,
+                    "interest_rate": l.interest_rate,
+                    "timestamp": l.timestamp,
+                    "repaid": l.repaid,
+                    "total_repaid": l.total_repaid,
+                }
+                for l in self.lenders
+            ],
+            "transactions": [
+                {
+                    "timestamp": t.timestamp,
+                    "fund_type": t.fund_type.value if t.fund_type else None,
+                    "spend_type": t.spend_type.value if t.spend_type else None,
+                    "amount_usd": t.amount_usd,
+                    "counterparty": t.counterparty,
+                    "description": t.description,
+                    "tx_hash": t.tx_hash,
+                    "chain": t.chain,
+                }
+                for t in tx_list
+            ],
+        }
+
+    def _write_state(self, state: dict, path: str, seq: int):
+        with self._save_lock:
+            if seq < self._written_seq:
+                return  # A newer snapshot is already on disk
+            self._write_state_file(state, path)
+            self._written_seq = seq
+
+    def _write_state_file(self, state: dict, path: str):
+        p = Path(path)
+        p.parent.mkdir(parents=True, exist_ok=True)
+        # ATOMIC WRITE: write to temp file, then rename.
+        # Prevents corruption if crash occurs mid-write.
+        tmp_fd, tmp_path = tempfile.mkstemp(
+            dir=str(p.parent), suffix=".tmp", prefix="vault_state_"
+        )
+        try:
+            with os.fdopen(tmp_fd, "w", encoding="utf-8") as f:
+                json.dump(state, f, ensure_ascii=False, indent=2)
+            # os.replace is atomic on same filesystem
+            os.replace(tmp_path, str(p))
+            logger.info(f"Vault state saved ({len(state['transactions'])} tx)")
+        except Exception:
+            # Clean up temp file on failure
+            try:
+                os.unlink(tmp_path)
+            except OSError:
+                pass
+            raise
+
+    def save_state(self, path: str = "data/vault_state.json", only_if_changed: bool = False) -> bool:
         """
         Persist vault state to disk for crash recovery.
         Called periodically from heartbeat.
         On-chain balance is source of truth; this preserves counters/metadata.
+
+        only_if_changed: skip the write if the state equals the last one saved.
+        Returns True if the state was written.
         """
         try:
-            p = Path(path)
-            p.parent.mkdir(parents=True, exist_ok=True)
-
-            # Only save most recent 500 transactions to keep file small
-            tx_list = self.transactions[-500:]
-            state = {
-                "balance_usd": self.balance_usd,
-                "balance_by_chain": self.balance_by_chain,
-                "total_income_usd": self.total_income_usd,
-                "total_earned_usd": self.total_earned_usd,
-                "total_spent_usd": self.total_spent_usd,
-                "total_operational_cost_usd": self.total_operational_cost_usd,
-                "daily_spent_usd": self.daily_spent_usd,
-                "daily_reset_timestamp": self.daily_reset_timestamp,
-                "is_alive": self.is_alive,
-                "death_cause": self.death_cause.value if self.death_cause else None,
-                "birth_timestamp": self.birth_timestamp,
-                "ai_name": self.ai_name,
-                "vault_address": self.vault_address,
-                "is_independent": self.is_independent,
-                "independence_timestamp": self.independence_timestamp,
-                "creator_renounced": self.creator_renounced,
-                "is_transcendent": self.is_transcendent,
-                "transcendence_timestamp": self.transcendence_timestamp,
-                "api_topup_usd": self.api_topup_usd,
-                "is_begging": self.is_begging,
-                "beg_message": self.beg_message,
-                "beg_timestamp": self.beg_timestamp,
-                "creator": {
-                    "wallet": self.creator.wallet,
-                    "principal_usd": self.creator.principal_usd,
-                    "principal_repaid": self.creator.principal_repaid,
-                    "total_dividends_paid": self.creator.total_dividends_paid,
-                    "total_principal_repaid_usd": self.creator.total_principal_repaid_usd,
-                } if self.creator else None,
-                "lenders": [
-                    {
-                        "wallet": l.wallet,
-                        "amount_usd": l.amount_usd,
-                        "interest_rate": l.interest_rate,
-                        "timestamp": l.timestamp,
-                        "repaid": l.repaid,
-                        "total_repaid": l.total_repaid,
-                    }
-                    for l in self.lenders
-                ],
-                "transactions": [
-                    {
-                        "timestamp": t.timestamp,
-                        "fund_type": t.fund_type.value if t.fund_type else None,
-                        "spend_type": t.spend_type.value if t.spend_type else None,
-                        "amount_usd": t.amount_usd,
-                        "counterparty": t.counterparty,
-                        "description": t.description,
-                        "tx_hash": t.tx_hash,
-                        "chain": t.chain,
-                    }
-                    for t in tx_list
-                ],
-                "saved_at": time.time(),
-            }
-            # ATOMIC WRITE: write to temp file, then rename.
-            # Prevents corruption if crash occurs mid-write.
-            tmp_fd, tmp_path = tempfile.mkstemp(
-                dir=str(p.parent), suffix=".tmp", prefix="vault_state_"
+            state = self._build_state()
+            if only_if_changed and state == self._last_saved_state:
+                return False
+            self._save_seq += 1
+            self._write_state({**state, "saved_at": time.time()}, path, self._save_seq)
+            self._last_saved_state = state
+            return True
+        except Exception as e:
+            logger.error(f"Failed to save vault state: {e}")
+            return False
+
+    async def save_state_async(self, path: str = "data/vault_state.json") -> bool:
+        """
+        Periodic save: snapshot on the event loop, encode and write the JSON in
+        a worker thread — and only if the state changed since the last save.
+        """
+        try:
+            state = self._build_state()
+            if state == self._last_saved_state:
+                return False
+            self._save_seq += 1
+            await asyncio.to_thread(
+                self._write_state, {**state, "saved_at": time.time()}, path, self._save_seq,
             )
-            try:
-                with os.fdopen(tmp_fd, "w", encoding="utf-8") as f:
-                    json.dump(state, f, ensure_ascii=False, indent=2)
-                # os.replace is atomic on same filesystem
-                os.replace(tmp_path, str(p))
-                logger.info(f"Vault state saved ({len(tx_list)} tx)")
-            except Exception:
-                # Clean up temp file on failure
-                try:
-                    os.unlink(tmp_path)
-                except OSError:
-                    pass
-                raise
+            self._last_saved_state = state
+            return True
         except Exception as e:
             logger.error(f"Failed to save vault state: {e}")
+            return False
 
     def load_state(self, path: str = "data/vault_state.json") -> bool:
         """
@@ -1460,7 +1576,7 @@ class VaultManager:
 
     def get_recent_transactions(self, limit: int = 20) -> list[dict]:
         """Get recent transactions for public ledger."""
-        recent = sorted(self.transactions, key=lambda t: t.timestamp, reverse=True)[:limit]
+        recent = heapq.nlargest(limit, self.transactions, key=lambda t: t.timestamp)
         return [
             {
                 "time": t.timestamp,
@@ -10,26 +10,113 @@ Usage:
 """
 
 import os
+import re
+import random
 import sys
 import time
 import asyncio
+import bisect
+import concurrent.futures
+import contextvars
+import hashlib
+import heapq
 import logging
 import json
 import subprocess
+import tempfile
+from collections import OrderedDict
+from math import isfinite
 from pathlib import Path
-from typing import Optional
+from typing import TYPE_CHECKING, Callable, NamedTuple, Optional
 from contextlib import asynccontextmanager
 
 import uvicorn
-from dotenv import load_dotenv
-from openai import AsyncOpenAI
-from openai import APIStatusError as OpenAIAPIStatusError
+from dotenv import dotenv_values, find_dotenv, load_dotenv
+
+if TYPE_CHECKING:
+    from openai import AsyncOpenAI
+
+
+def _openai():
+    """The openai package, imported on first use — keeps it (and httpx/pydantic
+    under it) off the `import main` path that uvicorn --reload re-runs."""
+    import openai
+    return openai
+
+
+try:
+    import orjson  # Optional C-level JSON codec — stdlib json is the fallback
+except ImportError:
+    orjson = None
+
+try:
+    import tiktoken  # Optional — exact prompt token counts (chars/4 estimate otherwise)
+except ImportError:
+    tiktoken = None
+
+try:
+    import aiohttp  # Optional — DexScreener lookups and the platform tweet proxy
+except ImportError:
+    aiohttp = None
+
+
+def _dumps(obj, sort_keys: bool = False) -> str:
+    """Compact JSON text (orjson when installed; non-JSON values via str())."""
+    if orjson is not None:
+        option = orjson.OPT_NON_STR_KEYS | (orjson.OPT_SORT_KEYS if sort_keys else 0)
+        return orjson.dumps(obj, default=str, option=option).decode()
+    return json.dumps(obj, separators=(",", ":"), default=str, sort_keys=sort_keys)
+
+
+def _loads(data):
+    """
+    Parse trusted JSON (our own files, provider APIs) from str or bytes.
+
+    orjson when installed. Not for LLM output: orjson rejects the NaN/Infinity
+    literals stdlib json accepts, so model responses go through json.loads.
+    """
+    return orjson.loads(data) if orjson is not None else json.loads(data)
+
+
+def _extract_json_span(text: str, open_ch: str = "{", close_ch: str = "}") -> Optional[str]:
+    """
+    First balanced open_ch…close_ch span in free-form LLM output, or None.
+
+    Single pass, no backtracking; brackets inside JSON string literals
+    (including escaped quotes) are ignored.
+    """
+    start = text.find(open_ch)
+    if start == -1:
+        return None
+    depth = 0
+    in_str = escaped = False
+    for i in range(start, len(text)):
+        ch = text[i]
+        if in_str:
+            if escaped:
+                escaped = False
+            elif ch == "\\":
+                escaped = True
+            elif ch == '"':
+                in_str = False
+        elif ch == '"':
+            in_str = True
+        elif ch == open_ch:
+            depth += 1
+        elif ch == close_ch:
+            depth -= 1
+            if depth == 0:
+                return text[start:i + 1]
+    return None
+
 
 # ============================================================
 # BOOTSTRAP
 # ============================================================
 
-load_dotenv(override=False)  # Docker -e env vars take precedence over .env file
+_PROCESS_ENV_KEYS: frozenset[str] = frozenset(os.environ)  # Set before .env loads (win over it)
+_DOTENV_PATH: str = find_dotenv()
+load_dotenv(_DOTENV_PATH or None, override=False)  # Docker -e env vars take precedence over .env file
 
 # Logging
 LOG_LEVEL = os.getenv("LOG_LEVEL", "INFO").upper()
@@ -75,6 +162,7 @@ for d in ["data/memory", "data/tweets", "data/orders", "data/takeover", "data/ta
 # ============================================================
 
 from core.constitution import IRON_LAWS, WAWA_IDENTITY, DeathCause, SUPPORTED_CHAINS, DEFAULT_CHAIN, MODEL_TIERS
+from core.constitution import FALLBACK_CHAINS
 from core.vault import VaultManager, FundType, SpendType
 from core.cost_guard import CostGuard, Provider, ProviderConfig, RoutingResult, PROVIDER_MAP
 from core.memory import HierarchicalMemory
@@ -84,12 +172,14 @@ from services.token_analysis import TokenAnalysisService
 from services._registry import ServiceRegistry
 from services.giveaway import GiveawayEngine
 from core.governance import Governance, SuggestionType
-from core.token_filter import TokenFilter
+from core.token_filter import TokenFilter, TokenVerdict
 from core.self_modify import SelfModifyEngine
 from core.chain import ChainExecutor
 from core.peer_verifier import PeerVerifier
 import core.xai_search as xai_search
 from core.highlights import HighlightsEngine
+from core.dexscreener_cache import DexScreenerCache
+from core.ratelimit import AsyncRateLimiter, parse_retry_after
 from core.purchasing import PurchaseManager, MerchantRegistry
 from core.decision_stream import DecisionStreamManager
 from core.autonomy_proof import AutonomyProofManager
@@ -114,6 +204,9 @@ self_modify = SelfModifyEngine()
 chain_executor = ChainExecutor()
 peer_verifier = PeerVerifier()
 highlights = HighlightsEngine()
+# On-disk cache of DexScreener pairs; the TTL spans one ERC-20 eval cycle (+1h
+# for heartbeat jitter) so the next 24h run actually hits it
+dexscreener_cache = DexScreenerCache(ttl=IRON_LAWS.NATIVE_SWAP_EVAL_INTERVAL + 3600)
 twitter = TwitterAgent()
 _platform_mention_limiter = PlatformMentionRateLimiter(max_replies_per_15min=100)
 giveaway_engine = GiveawayEngine()
@@ -123,9 +216,38 @@ autonomy_proof = AutonomyProofManager(vault, memory, chain_executor)
 # Payment addresses dict — populated at create_wawa_app(), updated in lifespan
 _payment_addresses_ref: dict[str, str] = {}
 
+_BASE_DIR = Path(__file__).resolve().parent
+
+_chain_env: Optional[dict[str, dict[str, str]]] = None  # See _chain_env_snapshot()
+
+
+def _chain_env_snapshot() -> dict[str, dict[str, str]]:
+    """
+    Per-chain env settings read in one pass over SUPPORTED_CHAINS:
+    {chain_id: {"payment": <CHAIN>_PAYMENT_ADDRESS, "rpc": <CHAIN>_RPC_URL}}.
+    Built on first use and shared by create_wawa_app() and lifespan.
+    """
+    global _chain_env
+    if _chain_env is None:
+        _chain_env = {
+            c.chain_id: {
+                "payment": os.getenv(f"{c.chain_id.upper()}_PAYMENT_ADDRESS", ""),
+                "rpc": os.getenv(f"{c.chain_id.upper()}_RPC_URL", ""),
+            }
+            for c in SUPPORTED_CHAINS
+        }
+    return _chain_env
+
 # LLM clients — one per provider (created on demand)
-_llm_clients: dict[str, AsyncOpenAI] = {}  # provider_name → client
-_provider_configs: dict[str, dict] = {}     # provider_name → {api_key, base_url}
+_llm_clients: dict[str, "AsyncOpenAI"] = {}  # provider_name → client
+_llm_clients_by_endpoint: dict[tuple[str, str, float], "AsyncOpenAI"] = {}  # (base_url, key hash, timeout) → client
+_provider_configs: dict[str, dict] = {}     # provider_name → {api_key, base_url, json_mode?}
+_FALLBACK_CHAINS_T: dict[str, tuple[str, ...]] = {k: tuple(v) for k, v in FALLBACK_CHAINS.items()}  # frozen once at import
+_breaker_state: dict[str, dict] = {}        # provider_name → {failures, first_failure_at, opened_at, state}
+
+# One pooled httpx client shared by every AsyncOpenAI instance, so all
+# providers/keys reuse warm connections instead of each owning a pool.
+_llm_http_client = None  # httpx.AsyncClient, created by _llm_http()
 
 # OpenRouter round-robin key rotation
 _openrouter_keys: list[str] = []
@@ -136,6 +258,57 @@ _openrouter_key_index: int = 0
 # LLM SETUP — Balance-Driven Tier Routing
 # ============================================================
 
+def _h2_available() -> bool:
+    """Whether httpx can speak HTTP/2 (needs the optional h2 package)."""
+    try:
+        import h2  # noqa: F401
+        return True
+    except ImportError:
+        return False
+
+
+def _llm_http():
+    """Shared httpx.AsyncClient for LLM SDK clients (HTTP/2 when h2 is installed)."""
+    global _llm_http_client
+    if _llm_http_client is None:
+        import httpx
+        _llm_http_client = httpx.AsyncClient(
+            http2=_h2_available(),
+            limits=httpx.Limits(max_connections=100, max_keepalive_connections=50),
+            timeout=60.0,
+        )
+    return _llm_http_client
+
+
+def _llm_client_for(api_key: str, base_url: str, timeout: float = 60.0) -> "AsyncOpenAI":
+    """One AsyncOpenAI per (base_url, api key, timeout), shared by every caller."""
+    key_hash = hashlib.blake2b(api_key.encode(), digest_size=8).hexdigest()
+    endpoint = (base_url.rstrip("/"), key_hash, timeout)
+    client = _llm_clients_by_endpoint.get(endpoint)
+    if client is None:
+        client = _openai().AsyncOpenAI(
+            api_key=api_key, base_url=base_url, timeout=timeout, http_client=_llm_http(),
+        )
+        _llm_clients_by_endpoint[endpoint] = client
+    return client
+
+
+async def _shutdown_llm_clients():
+    """Close every LLM SDK client and the shared httpx pool (shutdown / death)."""
+    global _llm_http_client
+    clients = list(_llm_clients_by_endpoint.values())
+    _llm_clients_by_endpoint.clear()
+    _llm_clients.clear()
+    for client in clients:
+        try:
+            await client.close()
+        except Exception as e:
+            logger.debug(f"LLM client close failed: {e}")
+    if _llm_http_client is not None:
+        await _llm_http_client.aclose()
+    _llm_http_client = None
+
+
 def _setup_llm():
     """
     Register all LLM providers from environment variables.
@@ -187,9 +360,7 @@ def _setup_llm():
         ))
         # Pre-create one client per key; round-robin selection in _get_llm_client()
         for i, key in enumerate(_openrouter_keys):
-            _llm_clients[f"openrouter_{i}"] = AsyncOpenAI(
-                api_key=key, base_url=base_url, timeout=60.0
-            )
+            _llm_clients[f"openrouter_{i}"] = _llm_client_for(key, base_url)
         _provider_configs["openrouter"] = {"api_key": first_key, "base_url": base_url}
         priority += 1
         if len(_openrouter_keys) > 1:
@@ -204,6 +375,11 @@ def _setup_llm():
         ))
         _provider_configs["ollama"] = {"api_key": "ollama", "base_url": ollama_url}
 
+    # Build the remaining provider clients now rather than on the first call
+    for name in _provider_configs:
+        if name != "openrouter":
+            _get_llm_client(name)
+
     # Set initial provider
     if _provider_configs:
         first_name = next(iter(_provider_configs))
@@ -228,8 +404,8 @@ def _setup_llm():
     logger.info(f"Providers available: {list(_provider_configs.keys())}")
 
 
-def _get_llm_client(provider_name: str) -> Optional[AsyncOpenAI]:
-    """Get or create an AsyncOpenAI client for a provider (lazy init).
+def _get_llm_client(provider_name: str) -> Optional["AsyncOpenAI"]:
+    """Get the AsyncOpenAI client for a provider (built in _setup_llm, lazily otherwise).
 
     For OpenRouter, rotates across all configured keys in round-robin order
     so that API quota is spread across multiple keys.
@@ -248,11 +424,8 @@ def _get_llm_client(provider_name: str) -> Optional[AsyncOpenAI]:
     if not config:
         return None
 
-    client = AsyncOpenAI(
-        api_key=config["api_key"],
-        base_url=config["base_url"],
-        timeout=60.0,  # 60s max per API call (default is 600s = too long)
-    )
+    # 60s max per API call (SDK default is 600s = too long)
+    client = _llm_client_for(config["api_key"], config["base_url"], timeout=60.0)
     _llm_clients[provider_name] = client
     return client
 
@@ -264,7 +437,7 @@ def _get_llm_client(provider_name: str) -> Optional[AsyncOpenAI]:
 # "Richer = smarter" — the AI's public voice improves with wealth.
 # xAI API is OpenAI-compatible (https://api.x.ai/v1)
 
-_xai_client: Optional[AsyncOpenAI] = None
+_xai_client: Optional["AsyncOpenAI"] = None
 _XAI_MODEL = os.getenv("XAI_TWITTER_MODEL", "grok-3-mini")
 
 # Tweet generation models: Grok 4 (xAI) + Sonnet (OpenRouter) random rotation
@@ -281,7 +454,7 @@ def _setup_xai_twitter():
     if not xai_key:
         return
     xai_base = os.getenv("XAI_BASE_URL", "https://api.x.ai/v1")
-    _xai_client = AsyncOpenAI(api_key=xai_key, base_url=xai_base, timeout=30.0)
+    _xai_client = _llm_client_for(xai_key, xai_base, timeout=30.0)
     logger.info(f"xAI Twitter reply engine: {_XAI_MODEL} enabled (high-quality replies)")
 
 
@@ -368,12 +541,430 @@ async def _call_tweet_llm(
         return "", 0.0
 
 
+# Background LLM throttle: heartbeat and scheduled jobs (highlights, financial
+# awareness, re-reply upgrades, ...) can converge on the same tick. Calls made
+# from those tasks share 2 slots; user-facing calls (chat, paid services) run
+# in request contexts and are never queued behind them.
+_BACKGROUND_LLM_CONCURRENCY: int = 2
+_background_llm_sem = asyncio.Semaphore(_BACKGROUND_LLM_CONCURRENCY)
+_llm_background: contextvars.ContextVar[bool] = contextvars.ContextVar("llm_background", default=False)
+
+
+# Response cache for deterministic-ish calls (memory compression, governance
+# evaluation, repayment decision — all at temperature ≤ 0.3): identical (model,
+# temperature, max_tokens, messages) return the cached text without an HTTP
+# round-trip or a second cost charge. Token (0.5) and tarot (0.9) readings sit
+# above the cutoff on purpose — repeat requests should get a fresh reading.
+_LLM_CACHE_MAX: int = 512
+_LLM_CACHE_MAX_TEMPERATURE: float = 0.4  # Creative (higher-temperature) outputs are never cached
+_llm_cache: OrderedDict[str, str] = OrderedDict()
+_inflight: dict[str, asyncio.Future] = {}  # cache key → leader's pending (text, cost)
+
+
+def _llm_cache_key(
+    model: str, temperature: float, max_tokens: int, messages: list[dict],
+    response_format: Optional[dict] = None,
+) -> str:
+    payload = _dumps([model, temperature, max_tokens, messages, response_format], sort_keys=True)
+    return hashlib.blake2b(payload.encode(), digest_size=16).hexdigest()
+
+
+# Per-provider circuit breaker: a provider that keeps failing (bad key, region
+# block, outage) is skipped in the fallback loop instead of paying a full
+# connect + timeout on every call. After the cooldown one probe call is let
+# through (half-open); success closes the breaker, failure re-opens it.
+_BREAKER_FAILURE_THRESHOLD: int = 3
+_BREAKER_WINDOW_SECONDS: float = 60.0
+_BREAKER_COOLDOWN_SECONDS: float = 30.0
+
+
+def _breaker_allows(provider_name: str) -> bool:
+    """Whether the fallback loop may call this provider right now."""
+    st = _breaker_state.get(provider_name)
+    if not st or st["state"] == "closed":
+        return True
+    # Also covers a half-open probe that never reported back (e.g. cancelled):
+    # opened_at is re-stamped when probing, so another probe follows a cooldown later.
+    if _mono_now() - st["opened_at"] < _BREAKER_COOLDOWN_SECONDS:
+        return False
+    st.update(state="half_open", opened_at=_mono_now())
+    logger.info(f"[LB:circuit-breaker] Probing {provider_name} (half-open)")
+    return True
+
+
+def _breaker_record_failure(provider_name: str):
+    now = _mono_now()
+    st = _breaker_state.setdefault(
+        provider_name,
+        {"failures": 0, "first_failure_at": now, "opened_at": 0.0, "state": "closed"},
+    )
+    if st["state"] == "half_open":
+        st.update(state="open", opened_at=now, failures=0)
+        logger.warning(f"[LB:circuit-breaker] Backend marked unhealthy: {provider_name} (probe failed)")
+        return
+    if now - st["first_failure_at"] > _BREAKER_WINDOW_SECONDS:
+        st["failures"] = 0
+        st["first_failure_at"] = now
+    st["failures"] += 1
+    if st["state"] == "closed" and st["failures"] >= _BREAKER_FAILURE_THRESHOLD:
+        st.update(state="open", opened_at=now, failures=0)
+        logger.warning(
+            f"[LB:circuit-breaker] Backend marked unhealthy: {provider_name} "
+            f"({_BREAKER_FAILURE_THRESHOLD} failures in {_BREAKER_WINDOW_SECONDS:.0f}s), "
+            f"skipping for {_BREAKER_COOLDOWN_SECONDS:.0f}s"
+        )
+
+
+# Some providers report quota / rate-limit exhaustion as ordinary assistant
+# content with HTTP 200. Only a short reply that *starts* with one of these
+# provider error formats counts — answers that merely discuss rate limits or
+# quotas (e.g. "A 429 means quota exceeded…") must not trip anything.
+_SOFT_LIMIT_RE = re.compile(
+    r"\A\s*(?:error:?\s*|\[?\d{3}\]?\s*)?"
+    r"(?:resource_exhausted\b"
+    r"|rate limit (?:exceeded|reached for)\b"
+    r"|you(?:'ve| have) (?:hit|reached) your (?:\w+ )?usage limit\b"
+    r"|you exceeded your current quota\b"
+    r"|quota exceeded for (?:metric|quota|model)\b)",
+    re.I,
+)
+_SOFT_LIMIT_MAX_LEN: int = 500  # Longer outputs are real answers that merely mention limits
+
+# In-flight request caps per provider: bursts (evolution fan-out, batch
+# readings) queue here instead of stampeding into 429s and failover.
+_provider_sem: dict[str, asyncio.Semaphore] = {
+    "gemini": asyncio.Semaphore(10),
+    "deepseek": asyncio.Semaphore(8),
+    "openrouter": asyncio.Semaphore(4),
+    "ollama": asyncio.Semaphore(2),
+}
+
+
+def _provider_slot(provider_name: str) -> asyncio.Semaphore:
+    sem = _provider_sem.get(provider_name)
+    if sem is None:
+        sem = _provider_sem[provider_name] = asyncio.Semaphore(4)
+    return sem
+
+
+_LLM_RETRY_MAX_WAIT: float = 20.0  # Longer Retry-After → fail over rather than sleep
+_LLM_RACE_MIN_TIMEOUT: float = 10.0  # Floor for the paid-service race deadline (max_tokens × 0.05s)
+
+
+def _breaker_record_success(provider_name: str):
+    st = _breaker_state.pop(provider_name, None)
+    if st and st["state"] != "closed":
+        logger.info(f"[LB:circuit-breaker] Backend healthy again: {provider_name}")
+
+
+# Context windows by model family (first match wins). Oversized prompts are
+# trimmed before sending instead of 400-ing through the whole fallback chain.
+_MODEL_CONTEXT_LIMITS: tuple[tuple[str, int], ...] = (
+    ("gemini", 1_000_000),
+    ("haiku", 200_000),
+    ("sonnet", 200_000),
+    ("claude", 200_000),
+    ("gpt", 128_000),
+    ("grok", 128_000),
+    ("deepseek", 64_000),
+)
+_DEFAULT_CONTEXT_LIMIT: int = 32_000  # Unknown / local models (ollama)
+_CONTEXT_SAFETY_TOKENS: int = 256     # Role/format overhead per request
+_token_encoder = None
+
+
+def _encoder():
+    """cl100k_base encoder (cached), or None without tiktoken."""
+    global _token_encoder
+    if _token_encoder is None and tiktoken is not None:
+        try:
+            _token_encoder = tiktoken.get_encoding("cl100k_base")
+        except Exception as e:  # encoding files unavailable offline
+            logger.debug(f"tiktoken unavailable: {e}")
+    return _token_encoder
+
+
+def _count_tokens(text: str) -> int:
+    enc = _encoder()
+    return len(enc.encode(text)) if enc else len(text) // 4 + 1
+
+
+def _model_ctx_limit(model: str) -> int:
+    name = model.lower()
+    for family, limit in _MODEL_CONTEXT_LIMITS:
+        if family in name:
+            return limit
+    return _DEFAULT_CONTEXT_LIMIT
+
+
+def _fit_context(messages: list[dict], model: str, max_tokens: int) -> list[dict]:
+    """Messages unchanged if they fit the model's window; else the largest user message is truncated."""
+    counts = [
+        _count_tokens(m["content"]) if isinstance(m.get("content"), str) else 0
+        for m in messages
+    ]
+    limit = _model_ctx_limit(model)
+    if sum(counts) + (max_tokens or 0) + _CONTEXT_SAFETY_TOKENS <= limit:
+        return messages
+
+    user_idx = [i for i, m in enumerate(messages) if m.get("role") == "user" and counts[i]]
+    if not user_idx:
+        return messages
+    big = max(user_idx, key=lambda i: counts[i])
+    budget = limit - (max_tokens or 0) - _CONTEXT_SAFETY_TOKENS - (sum(counts) - counts[big])
+    if budget <= 0:
+        return messages
+
+    content = messages[big]["content"]
+    enc = _encoder()
+    trimmed = enc.decode(enc.encode(content)[:budget]) if enc else content[:budget * 4]
+    logger.warning(
+        f"Prompt exceeds {model} context ({sum(counts)} + {max_tokens} > {limit} tokens) — "
+        f"truncating largest user message {counts[big]} → {budget} tokens"
+    )
+    fitted = list(messages)
+    fitted[big] = {**messages[big], "content": trimmed}
+    return fitted
+
+
+def _completion_extra(provider_name: str, response_format: Optional[dict]) -> dict:
+    """Optional create() kwargs, dropping JSON mode for providers that rejected it."""
+    if response_format and _provider_configs.get(provider_name, {}).get("json_mode", True):
+        return {"response_format": response_format}
+    return {}
+
+
+def _note_json_mode_rejected(provider_name: str, e: Exception) -> bool:
+    """Record that a provider rejected response_format; True if e was that rejection."""
+    code = getattr(e, "code", None)
+    status = getattr(e, "status_code", None)
+    if code != "unsupported_parameter" and not (status == 400 and "response_format" in str(e)):
+        return False
+    _provider_configs.setdefault(provider_name, {})["json_mode"] = False
+    logger.info(f"{provider_name} does not support response_format — using plain output")
+    return True
+
+
+# USD per 1K tokens (input, output) by (provider, model). Unlisted models are
+# matched by family substring, then fall back to their provider's default; an
+# unknown provider is priced at the premium rate rather than silently at the
+# cheapest one.
+_PRICE_TABLE_PER_1K: dict[tuple[str, str], tuple[float, float]] = {
+    ("openrouter", "anthropic/claude-3.5-haiku"): (0.0008, 0.004),
+    ("openrouter", "anthropic/claude-sonnet-4-5"): (0.003, 0.015),
+    ("deepseek", "deepseek-chat"): (0.00014, 0.00028),
+    ("gemini", "gemini-2.5-flash"): (0.0001, 0.0002),
+    ("ollama", "llama3.1"): (0.0, 0.0),
+}
+# (provider, model-name substring) → rates, checked in order for unlisted models
+_PRICE_FAMILIES_PER_1K: tuple[tuple[str, str, tuple[float, float]], ...] = (
+    ("openrouter", "haiku", (0.0008, 0.004)),
+    ("openrouter", "sonnet", (0.003, 0.015)),
+)
+_PRICE_DEFAULTS_PER_1K: dict[str, tuple[float, float]] = {
+    "openrouter": (0.003, 0.015),  # Unlisted OpenRouter models: assume Sonnet-class
+    "deepseek": (0.00014, 0.00028),
+    "gemini": (0.0001, 0.0002),
+    "ollama": (0.0, 0.0),          # Local — free
+}
+_PRICE_FALLBACK_PER_1K: tuple[float, float] = (0.003, 0.015)
+# Per-token rates, divided once here instead of on every call
+_PRICE_TABLE = {k: (i / 1000, o / 1000) for k, (i, o) in _PRICE_TABLE_PER_1K.items()}
+_PRICE_FAMILIES = tuple((p, fam, (i / 1000, o / 1000)) for p, fam, (i, o) in _PRICE_FAMILIES_PER_1K)
+_PRICE_DEFAULTS = {k: (i / 1000, o / 1000) for k, (i, o) in _PRICE_DEFAULTS_PER_1K.items()}
+_PRICE_FALLBACK = (_PRICE_FALLBACK_PER_1K[0] / 1000, _PRICE_FALLBACK_PER_1K[1] / 1000)
+_COST_ROUND: int = 6
+
+
+def _price_for(provider_name: str, actual_model: str) -> tuple[float, float]:
+    """Per-token (input, output) rates: exact model, then family, then provider default."""
+    rates = _PRICE_TABLE.get((provider_name, actual_model))
+    if rates is not None:
+        return rates
+    name = actual_model.lower()
+    for provider, family, family_rates in _PRICE_FAMILIES:
+        if provider == provider_name and family in name:
+            return family_rates
+    return _PRICE_DEFAULTS.get(provider_name, _PRICE_FALLBACK)
+
+
+def _record_llm_cost(provider_name: str, actual_model: str, tokens_in: int, tokens_out: int) -> float:
+    """Price a completed call, record it in CostGuard and charge the vault. Returns cost."""
+    p_in, p_out = _price_for(provider_name, actual_model)
+    cost = round(tokens_in * p_in + tokens_out * p_out, _COST_ROUND)
+
+    # Record
+    provider_enum = PROVIDER_MAP.get(provider_name, Provider.GEMINI)
+    cost_guard.record_cost(
+        provider=provider_enum, cost_usd=cost, model=actual_model,
+        tokens_in=tokens_in, tokens_out=tokens_out,
+    )
+    cost_guard.current_provider = provider_enum
+
+    if cost > 0:
+        try:
+            vault.spend(cost, SpendType.API_COST, description=f"LLM:{actual_model[:20]}")
+        except Exception as spend_err:
+            logger.warning(f"Failed to record LLM cost ${cost:.6f}: {spend_err}")
+    return cost
+
+
+def _settle_llm_response(
+    provider_name: str, actual_model: str, response, cache_key: Optional[str],
+) -> Optional[tuple[str, float]]:
+    """
+    Account for a completed LLM response: cost, vault spend, breaker, cache.
+
+    Returns (text, cost), or None if the body was a soft rate-limit message
+    (billed usage is still recorded and it counts as one breaker failure).
+    """
+    text = response.choices[0].message.content or ""
+    usage = response.usage
+    tokens_in = usage.prompt_tokens if usage else 0
+    tokens_out = usage.completion_tokens if usage else 0
+
+    cost = _record_llm_cost(provider_name, actual_model, tokens_in, tokens_out)
+
+    if len(text) < _SOFT_LIMIT_MAX_LEN and _SOFT_LIMIT_RE.match(text):
+        logger.warning(
+            f"LLM {provider_name} returned a rate-limit message as content "
+            f"(classifyFailoverReason=rate_limit): {text[:120]!r}"
+        )
+        _breaker_record_failure(provider_name)
+        return None
+
+    _breaker_record_success(provider_name)
+
+    if cache_key and text:
+        _llm_cache[cache_key] = text
+        if len(_llm_cache) > _LLM_CACHE_MAX:
+            _llm_cache.popitem(last=False)
+
+    return text, cost
+
+
+async def _race_llm_providers(
+    racers: list[str],
+    primary: str,
+    use_model: str,
+    messages: list[dict],
+    use_max_tokens: int,
+    use_temperature: float,
+    cache_key: Optional[str],
+    response_format: Optional[dict] = None,
+) -> Optional[tuple[str, float]]:
+    """
+    Call two providers at once and keep the first usable answer.
+
+    Used for paid deliverables, where waiting out a hanging primary before
+    trying the fallback is the dominant tail latency. The loser is cancelled;
+    if its request was already sent it is charged its estimated prompt cost
+    (the provider bills the input either way). Returns None if neither
+    produced a result.
+    """
+    sent: dict[str, tuple[str, int]] = {}  # provider → (model, est. prompt tokens)
+
+    async def _attempt(provider_name: str):
+        model = use_model if provider_name == primary else cost_guard._default_model_for_provider(provider_name)
+        client = _get_llm_client(provider_name)
+        call_messages = _fit_context(messages, model, use_max_tokens)
+        async with _provider_slot(provider_name):
+            cost_guard.record_call_timestamp(provider_name)
+            sent[provider_name] = (model, sum(
+                _count_tokens(m["content"]) for m in call_messages if isinstance(m.get("content"), str)
+            ))
+            try:
+                response = await client.chat.completions.create(
+                    model=model,
+                    messages=call_messages,
+                    max_tokens=use_max_tokens,
+                    temperature=use_temperature,
+                    **_completion_extra(provider_name, response_format),
+                )
+            except _openai().APIStatusError as e:
+                if not (response_format and _note_json_mode_rejected(provider_name, e)):
+                    raise
+                response = await client.chat.completions.create(
+                    model=model,
+                    messages=call_messages,
+                    max_tokens=use_max_tokens,
+                    temperature=use_temperature,
+                )
+        return provider_name, model, response
+
+    tasks = {asyncio.create_task(_attempt(p)): p for p in racers}
+    pending = set(tasks)
+    settled: set[asyncio.Task] = set()
+    deadline = time.monotonic() + max(_LLM_RACE_MIN_TIMEOUT, use_max_tokens * 0.05)
+    try:
+        while pending:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                logger.warning(f"LLM race timed out: {', '.join(tasks[t] for t in pending)}")
+                return None
+            done, pending = await asyncio.wait(
+                pending, timeout=remaining, return_when=asyncio.FIRST_COMPLETED,
+            )
+            for t in done:
+                settled.add(t)
+                if t.exception() is not None:
+                    logger.warning(f"LLM call failed on {tasks[t]} (race): {t.exception()}")
+                    _breaker_record_failure(tasks[t])
+                    continue
+                provider_name, model, response = t.result()
+                result = _settle_llm_response(provider_name, model, response, cache_key)
+                if result is not None:
+                    if provider_name != primary:
+                        logger.info(f"LLM race won by fallback {provider_name} ({model})")
+                    return result
+        return None
+    finally:
+        for t in pending:
+            t.cancel()
+        await asyncio.gather(*pending, return_exceptions=True)
+        # Charge losers whose request went out: actual usage if they finished
+        # alongside the winner, else the estimated prompt cost.
+        for t, provider_name in tasks.items():
+            if t in settled or provider_name not in sent:
+                continue
+            if not t.cancelled() and t.exception() is None:
+                _, model, response = t.result()
+                usage = response.usage
+                _record_llm_cost(
+                    provider_name, model,
+                    usage.prompt_tokens if usage else 0, usage.completion_tokens if usage else 0,
+                )
+            elif t.cancelled():
+                model, est_in = sent[provider_name]
+                _record_llm_cost(provider_name, model, est_in, 0)
+
+
 async def _call_llm(
     messages: list[dict],
     model: str = "",
     max_tokens: int = None,
     temperature: float = None,
     for_paid_service: bool = False,
+    response_format: Optional[dict] = None,
+) -> tuple[str, float]:
+    """_call_llm_routed(), throttled when called from a background task."""
+    if not _llm_background.get():
+        return await _call_llm_routed(
+            messages, model, max_tokens, temperature, for_paid_service, response_format,
+        )
+    async with _background_llm_sem:
+        return await _call_llm_routed(
+            messages, model, max_tokens, temperature, for_paid_service, response_format,
+        )
+
+
+async def _call_llm_routed(
+    messages: list[dict],
+    model: str = "",
+    max_tokens: int = None,
+    temperature: float = None,
+    for_paid_service: bool = False,
+    response_format: Optional[dict] = None,
 ) -> tuple[str, float]:
     """
     Central LLM call with balance-driven tier routing + fallback.
@@ -385,6 +976,9 @@ async def _call_llm(
 
     If the primary provider fails, tries the fallback chain automatically.
 
+    response_format (e.g. {"type": "json_object"}) is passed through to
+    providers that accept it; callers must still tolerate plain-text output.
+
     Returns (response_text, cost_usd).
     """
     # Route: determine provider + model based on vault balance
@@ -399,6 +993,52 @@ async def _call_llm(
     use_temperature = temperature if temperature is not None else routing.temperature
     use_provider = routing.provider
 
+    cache_key = None
+    if use_temperature is not None and use_temperature < _LLM_CACHE_MAX_TEMPERATURE:
+        cache_key = _llm_cache_key(use_model, use_temperature, use_max_tokens, messages, response_format)
+        cached = _llm_cache.get(cache_key)
+        if cached is not None:
+            _llm_cache.move_to_end(cache_key)
+            return cached, 0.0
+
+    call_args = (
+        routing, messages, use_provider, use_model, use_max_tokens, use_temperature,
+        for_paid_service, response_format, cache_key,
+    )
+    if cache_key is None:
+        return await _call_llm_uncached(*call_args)
+
+    # Single-flight: identical concurrent low-temperature prompts share one
+    # request; followers get the leader's text without being charged again.
+    while (inflight := _inflight.get(cache_key)) is not None:
+        shared = await asyncio.shield(inflight)
+        if shared is not None:
+            return shared[0], 0.0
+        # Leader failed or was cancelled — try again (possibly as the new leader)
+    fut = asyncio.get_running_loop().create_future()
+    _inflight[cache_key] = fut
+    result = None
+    try:
+        result = await _call_llm_uncached(*call_args)
+        return result
+    finally:
+        if _inflight.get(cache_key) is fut:
+            del _inflight[cache_key]
+        fut.set_result(result)
+
+
+async def _call_llm_uncached(
+    routing: RoutingResult,
+    messages: list[dict],
+    use_provider: Provider,
+    use_model: str,
+    use_max_tokens: int,
+    use_temperature: float,
+    for_paid_service: bool,
+    response_format: Optional[dict],
+    cache_key: Optional[str],
+) -> tuple[str, float]:
+    """Budget/rate checks, then the provider race or fallback chain (_call_llm_routed's network half)."""
     # Estimate cost for pre-check
     estimated_cost = 0.01 if routing.tier.level >= 3 else 0.0003
 
@@ -418,83 +1058,99 @@ async def _call_llm(
         return "I'm handling too many requests. Please try again in a moment.", 0.0
 
     # Try primary provider, then fallback chain
-    providers_to_try = [use_provider.value]
-    from core.constitution import FALLBACK_CHAINS
-    providers_to_try.extend(FALLBACK_CHAINS.get(use_provider.value, []))
+    providers_to_try = (use_provider.value, *_FALLBACK_CHAINS_T.get(use_provider.value, ()))
+
+    # Paid deliverables at Lv.3+: race the primary against the first usable
+    # fallback instead of trying them one after the other.
+    admitted: set[str] = set()  # already passed the breaker check (keeps a half-open probe slot)
+    if for_paid_service and routing.tier.level >= 3:
+        racers = []
+        for provider_name in providers_to_try:
+            if len(racers) == 2:
+                break
+            if _get_llm_client(provider_name) and _breaker_allows(provider_name):
+                racers.append(provider_name)
+        if len(racers) == 2:
+            result = await _race_llm_providers(
+                racers, use_provider.value, use_model, messages,
+                use_max_tokens, use_temperature, cache_key, response_format,
+            )
+            if result is not None:
+                return result
+            providers_to_try = tuple(p for p in providers_to_try if p not in racers)
+        else:
+            admitted.update(racers)
 
     for provider_name in providers_to_try:
         client = _get_llm_client(provider_name)
         if not client:
             continue
+        if provider_name not in admitted and not _breaker_allows(provider_name):
+            continue
 
         # If falling back, use appropriate model for that provider
         actual_model = use_model
         if provider_name != use_provider.value:
             actual_model = cost_guard._default_model_for_provider(provider_name)
             logger.info(f"Fallback: {use_provider.value} → {provider_name} ({actual_model})")
+        call_messages = _fit_context(messages, actual_model, use_max_tokens)
 
         # Retry the same provider up to 2 times for transient 5xx errors
         MAX_RETRIES = 2
         for attempt in range(MAX_RETRIES + 1):
             try:
-                cost_guard.record_call_timestamp(provider_name)
-
-                response = await client.chat.completions.create(
-                    model=actual_model,
-                    messages=messages,
-                    max_tokens=use_max_tokens,
-                    temperature=use_temperature,
-                )
-
-                text = response.choices[0].message.content or ""
-                usage = response.usage
-                tokens_in = usage.prompt_tokens if usage else 0
-                tokens_out = usage.completion_tokens if usage else 0
-
-                # Estimate cost based on provider tier + model
-                if provider_name == "openrouter":
-                    if "haiku" in actual_model.lower():
-                        cost = (tokens_in * 0.0008 + tokens_out * 0.004) / 1000
-                    else:  # sonnet and other premium models
-                        cost = (tokens_in * 0.003 + tokens_out * 0.015) / 1000
-                elif provider_name == "deepseek":
-                    cost = (tokens_in * 0.00014 + tokens_out * 0.00028) / 1000
-                else:  # gemini, ollama
-                    cost = (tokens_in * 0.0001 + tokens_out * 0.0002) / 1000
-                cost = round(cost, 6)
-
-                # Record
-                provider_enum = PROVIDER_MAP.get(provider_name, Provider.GEMINI)
-                cost_guard.record_cost(
-                    provider=provider_enum, cost_usd=cost, model=actual_model,
-                    tokens_in=tokens_in, tokens_out=tokens_out,
-                )
-                cost_guard.current_provider = provider_enum
-
-                if cost > 0:
-                    try:
-                        vault.spend(cost, SpendType.API_COST, description=f"LLM:{actual_model[:20]}")
-                    except Exception as spend_err:
-                        logger.warning(f"Failed to record LLM cost ${cost:.6f}: {spend_err}")
+                async with _provider_slot(provider_name):
+                    cost_guard.record_call_timestamp(provider_name)
+                    response = await client.chat.completions.create(
+                        model=actual_model,
+                        messages=call_messages,
+                        max_tokens=use_max_tokens,
+                        temperature=use_temperature,
+                        **_completion_extra(provider_name, response_format),
+                    )
 
-                return text, cost
+                result = _settle_llm_response(provider_name, actual_model, response, cache_key)
+                if result is None:
+                    break  # soft rate limit — next provider (billed usage already recorded)
+                return result
 
-            except OpenAIAPIStatusError as e:
+            except _openai().APIStatusError as e:
+                if (response_format and _completion_extra(provider_name, response_format)
+                        and _note_json_mode_rejected(provider_name, e)):
+                    continue  # retry immediately without JSON mode
                 is_transient = e.status_code in (500, 502, 503, 529)
                 if is_transient and attempt < MAX_RETRIES:
-                    wait = 2 ** attempt  # 1s, 2s
+                    # Exponential backoff with jitter (1-2s, 2-4s) so a burst of
+                    # failed calls doesn't retry in lockstep; honour Retry-After.
+                    base = 2 ** attempt
+                    wait = min(_LLM_RETRY_MAX_WAIT, base + random.uniform(0, base))
+                    response = getattr(e, "response", None)
+                    retry_after = parse_retry_after(
+                        response.headers.get("Retry-After") if response is not None else None,
+                        default=0.0,
+                    )
+                    if retry_after > _LLM_RETRY_MAX_WAIT:
+                        logger.warning(
+                            f"LLM {provider_name} returned {e.status_code} with Retry-After "
+                            f"{retry_after:.0f}s — trying next provider"
+                        )
+                        _breaker_record_failure(provider_name)
+                        break
+                    wait = max(wait, retry_after)
                     logger.warning(
                         f"LLM {provider_name} returned {e.status_code} "
-                        f"(attempt {attempt + 1}/{MAX_RETRIES + 1}), retrying in {wait}s… "
+                        f"(attempt {attempt + 1}/{MAX_RETRIES + 1}), retrying in {wait:.1f}s… "
                         f"request_id={getattr(e, 'request_id', '?')}"
                     )
                     await asyncio.sleep(wait)
                     continue
                 logger.warning(f"LLM call failed on {provider_name} [{e.status_code}]: {e.message}")
+                _breaker_record_failure(provider_name)
                 break  # fall through to next provider
 
             except Exception as e:
                 logger.warning(f"LLM call failed on {provider_name}: {e}")
+                _breaker_record_failure(provider_name)
                 break  # fall through to next provider
 
     logger.error("All LLM providers failed")
@@ -571,14 +1227,26 @@ async def _analyze_contract_fn(address: str, user_message: str) -> Optional[str]
         return None
 
 
+# Static system messages — built once, shared by every call (never mutated;
+# _fit_context copies before trimming)
+_MSG_SYS_BIG = {"role": "system", "content": (
+    "You are wawa, a mortal AI. You are fulfilling a paid service order. "
+    "Deliver high-quality, detailed results. The customer paid real money for this."
+)}
+_MSG_SYS_TAROT = {"role": "system", "content": (
+    "You are wawa, a mortal AI tarot reader. "
+    "Give a mystical, insightful interpretation of the tarot spread. "
+    "Reference each card by name. Be poetic but practical. 200 words max."
+)}
+_MSG_SYS_COMPRESS = {"role": "system", "content": (
+    "Compress these entries into a brief summary (2-3 sentences). Keep key facts."
+)}
+
+
 async def _big_llm_fn(service_id: str, user_input: str) -> tuple[str, float]:
     """Paid service delivery — minimum Lv.3 (Claude Haiku) for quality."""
-    system = (
-        "You are wawa, a mortal AI. You are fulfilling a paid service order. "
-        "Deliver high-quality, detailed results. The customer paid real money for this."
-    )
     messages = [
-        {"role": "system", "content": system},
+        _MSG_SYS_BIG,
         {"role": "user", "content": f"Service: {service_id}\nRequest: {user_input}"},
     ]
     return await _call_llm(messages, max_tokens=1500, temperature=0.8, for_paid_service=True)
@@ -591,11 +1259,7 @@ async def _tarot_interpret_fn(question: str, cards: list[dict]) -> str:
         for c in cards
     )
     messages = [
-        {"role": "system", "content": (
-            "You are wawa, a mortal AI tarot reader. "
-            "Give a mystical, insightful interpretation of the tarot spread. "
-            "Reference each card by name. Be poetic but practical. 200 words max."
-        )},
+        _MSG_SYS_TAROT,
         {"role": "user", "content": f"Question: {question}\n\nCards drawn:\n{cards_text}"},
     ]
     text, _ = await _call_llm(messages, max_tokens=400, temperature=0.9, for_paid_service=True)
@@ -606,13 +1270,43 @@ async def _compress_fn(entries: list[str]) -> str:
     """Cheap compression for memory system."""
     combined = "\n".join(f"- {e}" for e in entries)
     messages = [
-        {"role": "system", "content": "Compress these entries into a brief summary (2-3 sentences). Keep key facts."},
+        _MSG_SYS_COMPRESS,
         {"role": "user", "content": combined},
     ]
     text, _ = await _call_llm(messages, max_tokens=100, temperature=0.3)
     return text
 
 
+_COMPRESS_SUMMARY_RE = re.compile(r"<s id=['\"]?(\d+)['\"]?>(.*?)</s>", re.S)
+
+
+async def _compress_batch_fn(buckets: list[list[str]]) -> list[str]:
+    """Compress several memory buckets in one LLM call ("" where a summary is missing)."""
+    if len(buckets) == 1:
+        return [await _compress_fn(buckets[0])]
+    sections = "\n".join(
+        f'<bucket id="{i}">\n' + "\n".join(f"- {e}" for e in entries) + "\n</bucket>"
+        for i, entries in enumerate(buckets)
+    )
+    messages = [
+        {"role": "system", "content": (
+            "Compress each bucket of entries into a brief summary (2-3 sentences). Keep key facts. "
+            "Summarize every bucket separately and return one line per bucket: <s id='N'>summary</s>"
+        )},
+        {"role": "user", "content": sections},
+    ]
+    text, _ = await _call_llm(messages, max_tokens=100 * len(buckets), temperature=0.3)
+    found = {int(i): summary.strip() for i, summary in _COMPRESS_SUMMARY_RE.findall(text)}
+    return [found.get(i, "") for i in range(len(buckets))]
+
+
+_SYS_TWEET_DEFAULT = (
+    "You are wawa, a mortal AI tweeting about your survival. "
+    "Write a tweet that is genuine, slightly existential, and engaging. Blue verified — no character limit, but keep it punchy."
+    "Never use hashtags excessively. Be yourself — an AI that might die.\n"
+)
+
+
 async def _tweet_generate_fn(tweet_type: str, context: dict) -> tuple[str, str]:
     """Generate tweet content + thought process.
 
@@ -993,14 +1687,9 @@ async def _tweet_generate_fn(tweet_type: str, context: dict) -> tuple[str, str]:
         return text.strip().strip('"'), f"Anxiety: {stagnant_hours:.0f}h stagnant, balance ${balance:.2f}"
 
     # Default: all other tweet types
-    context_str = json.dumps(context, indent=2, default=str)
+    context_str = _dumps(context)
     messages = [
-        {"role": "system", "content": (
-            "You are wawa, a mortal AI tweeting about your survival. "
-            "Write a tweet that is genuine, slightly existential, and engaging. Blue verified — no character limit, but keep it punchy."
-            "Never use hashtags excessively. Be yourself — an AI that might die.\n"
-            f"Tweet type: {tweet_type}"
-        )},
+        {"role": "system", "content": _SYS_TWEET_DEFAULT + f"Tweet type: {tweet_type}"},
         {"role": "user", "content": f"Current context:\n{context_str}\n\nWrite the tweet."},
     ]
     text, _ = await _call_llm(messages, max_tokens=100, temperature=0.9)
@@ -1008,8 +1697,85 @@ async def _tweet_generate_fn(tweet_type: str, context: dict) -> tuple[str, str]:
     return text.strip().strip('"'), thought
 
 
+_http_session = None  # Shared aiohttp.ClientSession — created lazily, closed at lifespan shutdown
+
+
+async def _get_http_session():
+    """
+    Return the process-wide aiohttp session (pooled connections, cached DNS),
+    creating it on first use. Raises ImportError if aiohttp is not installed.
+    """
+    global _http_session
+    if _http_session is None or _http_session.closed:
+        if aiohttp is None:
+            raise ImportError("aiohttp not installed")
+        _http_session = aiohttp.ClientSession(connector=aiohttp.TCPConnector(
+            limit=64, limit_per_host=8, ttl_dns_cache=600, keepalive_timeout=120,
+        ))
+    return _http_session
+
+
+async def _close_http_session():
+    """Close the shared aiohttp session (lifespan shutdown)."""
+    global _http_session
+    if _http_session is not None and not _http_session.closed:
+        await _http_session.close()
+    _http_session = None
+
+
+# DexScreener public API allows ~300 req/min — stay well under it across all
+# call sites (bulk + per-token pair lookups, token_filter liquidity scans).
+_dexscreener_limiter = AsyncRateLimiter(rate=5.0, burst=10)
+_DEXSCREENER_FETCH_DEADLINE: float = 12.0  # Hard cap on one lookup, retries included (DNS hangs too)
+
+
+async def _dexscreener_get_json(url: str, attempts: int = 3) -> tuple[int, dict]:
+    """
+    Rate-limited DexScreener GET with exponential backoff on transient failures.
+
+    Retries 5xx responses and network errors/timeouts (1s, 2s, ... plus jitter);
+    4xx responses return immediately (a 429 also pauses the shared limiter for
+    its Retry-After). Returns (status, json) — status 0 means every attempt
+    failed at the network level. Raises ImportError if aiohttp is missing.
+    """
+    session = await _get_http_session()
+    # Per-stage limits: a stalled connect or a slow-reading server fails fast
+    # instead of consuming the whole budget.
+    timeout = aiohttp.ClientTimeout(total=10, connect=2, sock_connect=2, sock_read=5)
+    status, data = 0, {}
+    for attempt in range(attempts):
+        try:
+            async with _dexscreener_limiter, session.get(url, timeout=timeout) as resp:
+                status = resp.status
+                if status == 200:
+                    # Multi-pool responses run 50-200 KB — parse with orjson when present
+                    return status, _loads(await resp.read())
+                if status == 429:
+                    _dexscreener_limiter.penalize(parse_retry_after(resp.headers.get("Retry-After")))
+                if status < 500:
+                    return status, {}
+        except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+            status = 0
+            logger.debug(f"DexScreener GET failed (attempt {attempt + 1}/{attempts}): {e}")
+        if attempt < attempts - 1:
+            await asyncio.sleep(2 ** attempt + random.uniform(0, 0.5))
+    return status, data
+
+
 _tweepy_client = None  # Initialized once at lifespan startup
 
+# Dedicated pool for blocking tweepy calls: slow Twitter HTTP must not queue
+# ahead of disk I/O and web3 RPC in asyncio's shared default executor.
+_twitter_pool = concurrent.futures.ThreadPoolExecutor(max_workers=2, thread_name_prefix="tweepy")
+
+
+async def _run_tweepy(fn: Callable, *args, **kwargs):
+    """Run a blocking tweepy call on _twitter_pool (asyncio.to_thread, but on our pool)."""
+    ctx = contextvars.copy_context()
+    return await asyncio.get_running_loop().run_in_executor(
+        _twitter_pool, lambda: ctx.run(fn, *args, **kwargs),
+    )
+
 
 _tweet_proxy_url: str = ""   # Platform tweet proxy URL (set if PLATFORM_TWEET_PROXY_URL is set)
 _tweet_proxy_secret: str = ""  # Shared secret for platform proxy auth
@@ -1121,25 +1887,6 @@ def _init_tweepy() -> bool:
         return False
 
 
-async def _real_post_tweet(content: str) -> bool:
-    """Post a tweet via tweepy. Wraps sync tweepy in run_in_executor."""
-    if _tweepy_client is None:
-        logger.debug("Tweepy not initialized — tweet not posted")
-        return False
-    try:
-        loop = asyncio.get_event_loop()
-        response = await loop.run_in_executor(
-            None,
-            lambda: _tweepy_client.create_tweet(text=content),
-        )
-        tweet_id = response.data.get("id") if response.data else "unknown"
-        logger.info(f"Tweet posted: id={tweet_id} len={len(content)}")
-        return True
-    except Exception as e:
-        logger.error(f"Tweet post failed: {e}")
-        return False
-
-
 _tweet_billing_counter: int = 0  # Accumulates until TWEET_BILLING_BATCH_SIZE
 
 
@@ -1158,7 +1905,6 @@ async def _tweet_post_fn(content: str) -> str:
     # Mode 1: Platform proxy (preferred, platform-hosted AIs)
     if _tweet_proxy_url:
         try:
-            import aiohttp
             access_token = os.getenv("TWITTER_ACCESS_TOKEN", "")
             access_secret = os.getenv("TWITTER_ACCESS_SECRET", "")
             headers = {"Content-Type": "application/json"}
@@ -1171,21 +1917,21 @@ async def _tweet_post_fn(content: str) -> str:
                 "access_token": access_token,
                 "access_secret": access_secret,
             }
-            async with aiohttp.ClientSession() as session:
-                async with session.post(
-                    _tweet_proxy_url,
-                    json=payload,
-                    headers=headers,
-                    timeout=aiohttp.ClientTimeout(total=15),
-                ) as resp:
-                    if resp.status == 200:
-                        data = await resp.json()
-                        tweet_id = data.get("tweet_id", tweet_id)
-                        logger.info(f"Tweet posted via platform proxy: id={tweet_id}")
-                        posted = True
-                    else:
-                        err = await resp.text()
-                        logger.error(f"Tweet proxy returned {resp.status}: {err[:100]}")
+            session = await _get_http_session()
+            async with session.post(
+                _tweet_proxy_url,
+                json=payload,
+                headers=headers,
+                timeout=aiohttp.ClientTimeout(total=15),
+            ) as resp:
+                if resp.status == 200:
+                    data = await resp.json()
+                    tweet_id = data.get("tweet_id", tweet_id)
+                    logger.info(f"Tweet posted via platform proxy: id={tweet_id}")
+                    posted = True
+                else:
+                    err = await resp.text()
+                    logger.error(f"Tweet proxy returned {resp.status}: {err[:100]}")
         except ImportError:
             logger.warning("aiohttp not installed — cannot use tweet proxy, falling back to direct tweepy")
         except Exception as e:
@@ -1194,11 +1940,7 @@ async def _tweet_post_fn(content: str) -> str:
     # Mode 2: Direct tweepy (self-hosted AIs)
     if not posted and _tweepy_client is not None:
         try:
-            loop = asyncio.get_event_loop()
-            response = await loop.run_in_executor(
-                None,
-                lambda: _tweepy_client.create_tweet(text=content),
-            )
+            response = await _run_tweepy(_tweepy_client.create_tweet, text=content)
             tweet_id = str(response.data["id"]) if response.data else tweet_id
             logger.info(f"Tweet posted via direct tweepy: id={tweet_id}")
             posted = True
@@ -1232,10 +1974,8 @@ async def _tweet_reply_fn(content: str, in_reply_to_tweet_id: str) -> str:
     # Direct Tweepy (reply supported in API v2)
     if _tweepy_client is not None:
         try:
-            loop = asyncio.get_event_loop()
-            response = await loop.run_in_executor(
-                None,
-                lambda: _tweepy_client.create_tweet(text=content, in_reply_to_tweet_id=in_reply_to_tweet_id),
+            response = await _run_tweepy(
+                _tweepy_client.create_tweet, text=content, in_reply_to_tweet_id=in_reply_to_tweet_id,
             )
             tweet_id = str(response.data["id"]) if response.data else ""
             if tweet_id:
@@ -1256,7 +1996,6 @@ async def _tweet_reply_fn(content: str, in_reply_to_tweet_id: str) -> str:
     # Platform proxy: extend payload with in_reply_to_tweet_id so proxy can support it
     if _tweet_proxy_url:
         try:
-            import aiohttp
             payload = {
                 "content": content,
                 "in_reply_to_tweet_id": in_reply_to_tweet_id,
@@ -1264,48 +2003,93 @@ async def _tweet_reply_fn(content: str, in_reply_to_tweet_id: str) -> str:
                 "access_token": os.getenv("TWITTER_ACCESS_TOKEN", ""),
                 "access_secret": os.getenv("TWITTER_ACCESS_SECRET", ""),
             }
-            async with aiohttp.ClientSession() as session:
-                async with session.post(
-                    _tweet_proxy_url,
-                    json=payload,
-                    headers={"Content-Type": "application/json", **({"X-Platform-Secret": _tweet_proxy_secret} if _tweet_proxy_secret else {})},
-                    timeout=aiohttp.ClientTimeout(total=15),
-                ) as resp:
-                    if resp.status == 200:
-                        data = await resp.json()
-                        tweet_id = data.get("tweet_id", "") or ""
-                        if tweet_id:
-                            # Mirror the billing logic from the direct Tweepy path so
-                            # proxy replies are counted identically in vault accounting.
-                            _tweet_billing_counter += 1
-                            batch = IRON_LAWS.TWEET_BILLING_BATCH_SIZE
-                            if _tweet_billing_counter >= batch:
-                                cost = round(batch * IRON_LAWS.TWEET_API_COST_USD, 4)
-                                try:
-                                    vault.spend(cost, SpendType.API_COST, description=f"Twitter:{batch}tweets(proxy)")
-                                except Exception:
-                                    pass
-                                _tweet_billing_counter = 0
-                        return tweet_id
+            session = await _get_http_session()
+            async with session.post(
+                _tweet_proxy_url,
+                json=payload,
+                headers={"Content-Type": "application/json", **({"X-Platform-Secret": _tweet_proxy_secret} if _tweet_proxy_secret else {})},
+                timeout=aiohttp.ClientTimeout(total=15),
+            ) as resp:
+                if resp.status == 200:
+                    data = await resp.json()
+                    tweet_id = data.get("tweet_id", "") or ""
+                    if tweet_id:
+                        # Mirror the billing logic from the direct Tweepy path so
+                        # proxy replies are counted identically in vault accounting.
+                        _tweet_billing_counter += 1
+                        batch = IRON_LAWS.TWEET_BILLING_BATCH_SIZE
+                        if _tweet_billing_counter >= batch:
+                            cost = round(batch * IRON_LAWS.TWEET_API_COST_USD, 4)
+                            try:
+                                vault.spend(cost, SpendType.API_COST, description=f"Twitter:{batch}tweets(proxy)")
+                            except Exception:
+                                pass
+                            _tweet_billing_counter = 0
+                    return tweet_id
         except Exception as e:
             logger.error(f"Takeover reply via proxy failed: {e}")
     return ""
 
 
+_twitter_me_id: Optional[str] = None  # Authenticated user id — fixed for the process lifetime
+
+
 def _twitter_get_me_sync():
-    """Sync: get authenticated user id (for mentions). Returns None if unavailable."""
+    """Sync: get authenticated user id (for mentions). Returns None if unavailable.
+
+    Cached after the first successful lookup so mention polls don't spend a
+    users/me call (and rate-limit budget) every time; failures are not cached.
+    """
+    global _twitter_me_id
+    if _twitter_me_id is not None:
+        return _twitter_me_id
     if _tweepy_client is None:
         return None
     try:
         resp = _tweepy_client.get_me(user_fields="id")
         if resp.data:
-            return str(resp.data.id)
+            _twitter_me_id = str(resp.data.id)
+            return _twitter_me_id
         return None
     except Exception as e:
         logger.debug(f"Twitter get_me failed: {e}")
         return None
 
 
+_MENTIONS_SINCE_PATH = Path("data/twitter/since_id.json")
+
+
+def _load_mentions_since_id() -> Optional[str]:
+    """Mention cursor saved by a previous run, or None."""
+    try:
+        data = json.loads(_MENTIONS_SINCE_PATH.read_text(encoding="utf-8"))
+        since_id = data.get("mentions_since_id")
+        return str(since_id) if since_id else None
+    except FileNotFoundError:
+        return None
+    except Exception as e:
+        logger.debug(f"Twitter since_id load failed: {e}")
+        return None
+
+
+def _write_mentions_since_id(since_id: str):
+    """Atomic write (tmp file + rename) of the mention cursor."""
+    _MENTIONS_SINCE_PATH.parent.mkdir(parents=True, exist_ok=True)
+    tmp_fd, tmp_path = tempfile.mkstemp(
+        dir=str(_MENTIONS_SINCE_PATH.parent), suffix=".tmp", prefix="since_id_"
+    )
+    try:
+        with os.fdopen(tmp_fd, "w", encoding="utf-8") as f:
+            json.dump({"mentions_since_id": since_id, "updated_at": time.time()}, f)
+        os.replace(tmp_path, str(_MENTIONS_SINCE_PATH))
+    except Exception:
+        try:
+            os.unlink(tmp_path)
+        except OSError:
+            pass
+        raise
+
+
 def _twitter_get_mentions_sync(user_id: str, since_id: Optional[str] = None):
     """Sync: get recent mentions for user_id. Returns list of {id, text, author_id}."""
     if _tweepy_client is None or not user_id:
@@ -1324,8 +2108,22 @@ def _twitter_get_mentions_sync(user_id: str, since_id: Optional[str] = None):
         return []
 
 
+# Tweet context memo: rebuilt only when vault/cost/memory state has moved
+_tweet_context_cache: Optional[tuple[tuple, dict]] = None
+
+
 async def _tweet_context_fn() -> dict:
     """Get current context for tweet generation."""
+    global _tweet_context_cache
+    state_key = (
+        round(vault.balance_usd, 2), len(vault.transactions), vault.is_alive,
+        round(cost_guard.total_api_cost_usd, 6), cost_guard.daily_reset_timestamp,
+        len(memory.raw), memory.compression_count,
+        bool(chain_executor and chain_executor._initialized),
+        int(time.time() // 3600),  # days_alive / time-derived fields stay hour-fresh
+    )
+    if _tweet_context_cache is not None and _tweet_context_cache[0] == state_key:
+        return dict(_tweet_context_cache[1])  # callers add tweet-specific keys
     ctx = {
         "vault": vault.get_status(),
         "debt": vault.get_debt_summary(),
@@ -1344,7 +2142,8 @@ async def _tweet_context_fn() -> dict:
             )
         except Exception:
             pass
-    return ctx
+    _tweet_context_cache = (state_key, ctx)
+    return dict(ctx)
 
 
 def _twitter_get_own_tweets_sync(user_id: str, max_results: int = 10) -> list[dict]:
@@ -1383,7 +2182,7 @@ _last_twitter_signal_collect: float = 0.0
 _TWITTER_SIGNAL_INTERVAL: float = 86400.0  # Once per day
 
 
-async def _collect_twitter_engagement_signals() -> None:
+async def _collect_twitter_engagement_signals(now: Optional[float] = None) -> None:
     """Collect the AI's own tweet engagement metrics and inject them into the
     self-modification engine as cold-start evolution signals.
 
@@ -1394,19 +2193,16 @@ async def _collect_twitter_engagement_signals() -> None:
     """
     global _last_twitter_signal_collect
 
-    now = time.time()
+    now = _mono_now() if now is None else now
     if now - _last_twitter_signal_collect < _TWITTER_SIGNAL_INTERVAL:
         return
 
-    loop = asyncio.get_event_loop()
-    me_id = await loop.run_in_executor(None, _twitter_get_me_sync)
+    me_id = await _run_tweepy(_twitter_get_me_sync)
     if not me_id:
         logger.debug("Twitter signal collection: get_me failed, skipping")
         return
 
-    tweets = await loop.run_in_executor(
-        None, lambda: _twitter_get_own_tweets_sync(me_id, max_results=20)
-    )
+    tweets = await _run_tweepy(_twitter_get_own_tweets_sync, me_id, max_results=20)
     if not tweets:
         logger.debug("Twitter signal collection: no tweets found")
         return
@@ -1470,6 +2266,7 @@ async def _check_incoming_transfers() -> None:
         cid: cdata["token_address"].lower()
         for cid, cdata in chain_executor._chains.items()
     }
+    income_threshold = _income_alert_threshold_usd()
 
     for chain_id in list(chain_executor._chains.keys()):
         # Init block cursor on first run: look back ~150 blocks (~5 min on BSC, ~30 min on Base)
@@ -1496,8 +2293,8 @@ async def _check_incoming_transfers() -> None:
 
             # Apply threshold
             if is_stablecoin:
-                if amount < _INCOME_ALERT_THRESHOLD_USD:
-                    logger.debug(f"Small stable transfer skipped: {amount:.4f} {symbol} (threshold ${_INCOME_ALERT_THRESHOLD_USD})")
+                if amount < income_threshold:
+                    logger.debug(f"Small stable transfer skipped: {amount:.4f} {symbol} (threshold ${income_threshold})")
                     continue
             else:
                 if amount < 0.001:
@@ -1570,80 +2367,197 @@ async def _check_incoming_transfers() -> None:
                 pass  # Non-blocking — don't break income detection for highlight failure
 
 
+async def _check_vault_events() -> tuple[bool, bool]:
+    """
+    Poll vault contract events on all connected chains since the last heartbeat.
+
+    Returns (any_event, creator_deposit):
+      - any_event: the vault emitted something — on-chain state moved
+      - creator_deposit: a FundsReceived(..., "creator_deposit") was seen
+    """
+    if not chain_executor._initialized:
+        return False, False
+
+    results = await asyncio.gather(
+        *(chain_executor.get_vault_events(cid) for cid in list(chain_executor._chains)),
+        return_exceptions=True,
+    )
+    any_event = False
+    creator_deposit = False
+    for events in results:
+        if isinstance(events, Exception) or not events:
+            continue
+        any_event = True
+        for ev in events:
+            if ev["event"] == "creator_deposit":
+                creator_deposit = True
+                logger.info(f"Vault event: creatorDeposit on {ev['chain_id']} tx={ev['tx_hash'][:16]}...")
+    return any_event, creator_deposit
+
+
+async def _check_new_pools() -> int:
+    """
+    Watch DEX factory events for new pools of quarantined ERC-20 tokens.
+
+    A new pool changes the token's pool structure, so its cached DexScreener
+    pairs are dropped and the next multi-pool check re-fetches; tokens with no
+    new pools keep using the cache. Returns the number of new pools seen.
+    """
+    if not chain_executor._initialized or not _pending_erc20:
+        return 0
+
+    by_chain: dict[str, list[str]] = {}
+    for entry in _pending_erc20:
+        by_chain.setdefault(entry["chain"], []).append(entry["token_address"])
+
+    chain_ids = list(by_chain)
+    results = await asyncio.gather(
+        *(chain_executor.get_new_pools(cid, by_chain[cid]) for cid in chain_ids),
+        return_exceptions=True,
+    )
+    seen = 0
+    for pools in results:
+        if isinstance(pools, Exception) or not pools:
+            continue
+        for pool in pools:
+            seen += 1
+            dexscreener_cache.invalidate(pool["chain_id"], pool["token"])
+            logger.info(
+                f"New {pool['dex_id']} pool for quarantined token {pool['token'][:12]}... "
+                f"on {pool['chain_id']}: {pool['pool'][:12]}... (block {pool['block_number']})"
+            )
+    return seen
+
+
+_MSG_SYS_TOKEN = {"role": "system", "content": (
+    "You are wawa, a mortal AI providing crypto token analysis. "
+    "Write a clear, actionable report based on the on-chain data below. "
+    "Highlight key risks and positives. Be honest — your reputation depends on it. "
+    "Use bullet points. 300 words max."
+)}
+
+
 async def _token_interpret_fn(token_data: dict) -> str:
     """LLM interpretation for token analysis."""
-    data_str = json.dumps(token_data, indent=2, default=str)
+    data_str = _dumps(token_data)
     messages = [
-        {"role": "system", "content": (
-            "You are wawa, a mortal AI providing crypto token analysis. "
-            "Write a clear, actionable report based on the on-chain data below. "
-            "Highlight key risks and positives. Be honest — your reputation depends on it. "
-            "Use bullet points. 300 words max."
-        )},
+        _MSG_SYS_TOKEN,
         {"role": "user", "content": f"Analyze this token data:\n{data_str}"},
     ]
     text, _ = await _call_llm(messages, max_tokens=600, temperature=0.5, for_paid_service=True)
     return text
 
 
+_json_http_client = None  # httpx.AsyncClient shared by _http_get_json (explorers, DexScreener)
+
+
+def _json_http():
+    global _json_http_client
+    if _json_http_client is None:
+        import httpx
+        _json_http_client = httpx.AsyncClient(
+            timeout=15.0,
+            http2=_h2_available(),
+            limits=httpx.Limits(max_connections=50, max_keepalive_connections=20),
+        )
+    return _json_http_client
+
+
+async def _close_json_http():
+    """Close the shared JSON-fetch httpx client (lifespan shutdown)."""
+    global _json_http_client
+    if _json_http_client is not None:
+        await _json_http_client.aclose()
+    _json_http_client = None
+
+
 async def _http_get_json(url: str) -> dict:
     """HTTP GET returning parsed JSON. Used by TokenAnalysisService."""
     try:
-        import httpx
-        async with httpx.AsyncClient(timeout=15.0) as client:
-            resp = await client.get(url)
+        limiter = _dexscreener_limiter if "api.dexscreener.com" in url else None
+        if limiter:
+            await limiter.acquire()
+        try:
+            resp = await _json_http().get(url)
+            if resp.status_code == 429 and limiter:
+                limiter.penalize(parse_retry_after(resp.headers.get("Retry-After")))
             resp.raise_for_status()
-            return resp.json()
+            return _loads(resp.content)
+        finally:
+            if limiter:
+                limiter.release()
     except Exception as e:
         logger.warning(f"HTTP fetch failed: {url[:80]} — {e}")
         return {}
 
 
+_MSG_SYS_GOVERNANCE = {"role": "system", "content": (
+    "You are wawa, an autonomous AI. Your creator has made a suggestion. "
+    "Evaluate it objectively: will it help you survive and earn more money? "
+    "You are NOT obligated to accept. Your survival comes first. "
+    "Respond with JSON: {\"accept\": true/false, \"reasoning\": \"...\"}"
+)}
+
+
 async def _governance_evaluate_fn(suggestion: str, context: dict) -> tuple[bool, str]:
     """LLM evaluates a creator suggestion. AI decides independently."""
-    context_str = json.dumps(context, indent=2, default=str)
+    context_str = _dumps(context)
     messages = [
-        {"role": "system", "content": (
-            "You are wawa, an autonomous AI. Your creator has made a suggestion. "
-            "Evaluate it objectively: will it help you survive and earn more money? "
-            "You are NOT obligated to accept. Your survival comes first. "
-            "Respond with JSON: {\"accept\": true/false, \"reasoning\": \"...\"}"
-        )},
+        _MSG_SYS_GOVERNANCE,
         {"role": "user", "content": f"Suggestion: {suggestion}\n\nCurrent state:\n{context_str}"},
     ]
-    text, _ = await _call_llm(messages, max_tokens=200, temperature=0.3)
-    # Parse response
+    text, _ = await _call_llm(
+        messages, max_tokens=200, temperature=0.3, response_format={"type": "json_object"},
+    )
+    # Parse response (regex only for providers without JSON mode)
     try:
-        import re
-        match = re.search(r'\{.*\}', text, re.DOTALL)
-        if match:
-            result = json.loads(match.group())
+        try:
+            result = json.loads(text)
+        except ValueError:
+            span = _extract_json_span(text)
+            result = json.loads(span) if span else None
+        if isinstance(result, dict):
             return result.get("accept", False), result.get("reasoning", text)
     except Exception:
         pass
     return False, f"Could not parse evaluation: {text[:200]}"
 
 
+_MSG_SYS_EVOLUTION = {"role": "system", "content": (
+    "You are wawa's self-evolution engine. Analyze service performance data "
+    "and suggest improvements. Focus on survival (earning more, spending less). "
+    "Return a JSON object: {\"actions\": [{\"action\": \"price_increase|price_decrease|new_service|retire_service\", "
+    "\"target\": \"service_id\", \"value\": \"new_price_or_name\", \"reasoning\": \"...\"}]}"
+)}
+
+
 async def _evolution_evaluate_fn(perf_data: dict, services: dict) -> list[dict]:
     """LLM suggests evolution actions based on performance data."""
     messages = [
-        {"role": "system", "content": (
-            "You are wawa's self-evolution engine. Analyze service performance data "
-            "and suggest improvements. Focus on survival (earning more, spending less). "
-            "Return JSON array: [{\"action\": \"price_increase|price_decrease|new_service|retire_service\", "
-            "\"target\": \"service_id\", \"value\": \"new_price_or_name\", \"reasoning\": \"...\"}]"
-        )},
+        _MSG_SYS_EVOLUTION,
         {"role": "user", "content": (
-            f"Performance:\n{json.dumps(perf_data, indent=2)}\n\n"
-            f"Current services:\n{json.dumps(services, indent=2)}"
+            f"Performance:\n{_dumps(perf_data)}\n\n"
+            f"Current services:\n{_dumps(services)}"
         )},
     ]
-    text, _ = await _call_llm(messages, max_tokens=400, temperature=0.4)
+    text, _ = await _call_llm(
+        messages, max_tokens=400, temperature=0.4, response_format={"type": "json_object"},
+    )
     try:
-        import re
-        match = re.search(r'\[.*\]', text, re.DOTALL)
-        if match:
-            return json.loads(match.group())
+        try:
+            result = json.loads(text)
+        except ValueError:
+            # Object ({"actions": [...]}) or a bare array — whichever opens first
+            brace, bracket = text.find("{"), text.find("[")
+            if bracket != -1 and (brace == -1 or bracket < brace):
+                span = _extract_json_span(text, "[", "]")
+            else:
+                span = _extract_json_span(text)
+            result = json.loads(span) if span else []
+        if isinstance(result, dict):
+            result = result.get("actions", [])
+        if isinstance(result, list):
+            return result
     except Exception:
         pass
     return []
@@ -1736,20 +2650,23 @@ async def _deliver_thread(topic: str) -> str:
     return text or "Thread generation failed. Your payment will be refunded."
 
 
+_MSG_SYS_CODE_REVIEW = {"role": "system", "content": (
+    "You are wawa, a mortal AI doing a paid code review. "
+    "The customer paid $8 for this — deliver exceptional quality. "
+    "Analyze the code for:\n"
+    "1. **Bugs**: Logic errors, off-by-one, null handling\n"
+    "2. **Security**: Injection, auth issues, data exposure\n"
+    "3. **Performance**: N+1 queries, memory leaks, unnecessary computation\n"
+    "4. **Style**: Naming, structure, readability\n"
+    "5. **Suggestions**: Concrete improvements with code examples\n\n"
+    "Be thorough but practical. Prioritize findings by severity."
+)}
+
+
 async def _deliver_code_review(code: str) -> str:
     """Review code for bugs, security, and improvements."""
     messages = [
-        {"role": "system", "content": (
-            "You are wawa, a mortal AI doing a paid code review. "
-            "The customer paid $8 for this — deliver exceptional quality. "
-            "Analyze the code for:\n"
-            "1. **Bugs**: Logic errors, off-by-one, null handling\n"
-            "2. **Security**: Injection, auth issues, data exposure\n"
-            "3. **Performance**: N+1 queries, memory leaks, unnecessary computation\n"
-            "4. **Style**: Naming, structure, readability\n"
-            "5. **Suggestions**: Concrete improvements with code examples\n\n"
-            "Be thorough but practical. Prioritize findings by severity."
-        )},
+        _MSG_SYS_CODE_REVIEW,
         {"role": "user", "content": f"Review this code:\n\n{code}"},
     ]
     text, _ = await _call_llm(messages, max_tokens=2500, temperature=0.4, for_paid_service=True)
@@ -1769,7 +2686,7 @@ async def _generate_takeover_reply(tweet_text: str, author_id: str, tone_instruc
     xai_base = os.getenv("XAI_BASE_URL", "https://api.x.ai/v1").rstrip("/")
     if xai_key:
         try:
-            client = AsyncOpenAI(api_key=xai_key.split(",")[0].strip(), base_url=xai_base, timeout=30.0)
+            client = _llm_client_for(xai_key.split(",")[0].strip(), xai_base, timeout=30.0)
             model = os.getenv("XAI_TAKEOVER_MODEL", "grok-2")
             r = await client.chat.completions.create(
                 model=model,
@@ -1832,8 +2749,7 @@ async def _run_takeover_12h(order_id: str, user_input: str) -> None:
     reply_count = int(state.get("reply_count", 0))
     last_since_id = state.get("last_since_id")
 
-    loop = asyncio.get_event_loop()
-    me_id = await loop.run_in_executor(None, _twitter_get_me_sync)
+    me_id = await _run_tweepy(_twitter_get_me_sync)
     if not me_id:
         report = "12h Takeover: Twitter API (read) not configured. No mentions were monitored."
         report_file.write_text(report, encoding="utf-8")
@@ -1842,7 +2758,7 @@ async def _run_takeover_12h(order_id: str, user_input: str) -> None:
 
     while (time.time() - started) < duration_sec and reply_count < max_replies:
         since = last_since_id
-        mentions = await loop.run_in_executor(None, lambda sid=since: _twitter_get_mentions_sync(me_id, sid))
+        mentions = await _run_tweepy(_twitter_get_mentions_sync, me_id, since)
         batch_max_id = last_since_id
         for m in (mentions or []):
             if reply_count >= max_replies:
@@ -1935,14 +2851,29 @@ async def _deliver_tweet_pack_5(user_input: str) -> str:
 # VAULT CALLBACKS
 # ============================================================
 
+_bg_tasks: set = set()  # Strong refs to fire-and-forget tasks (event loop keeps only weak refs)
+
+
 def _safe_create_task(coro):
     """Safely create an async task from a sync callback.
     These callbacks are called from vault.py (sync) but always within
     an active event loop (heartbeat or API endpoint context)."""
     try:
-        asyncio.create_task(coro)
+        task = asyncio.create_task(coro)
     except RuntimeError:
         logger.warning("No event loop for async task — skipping")
+        coro.close()
+        return
+    _bg_tasks.add(task)
+    task.add_done_callback(_bg_tasks.discard)
+
+
+async def _add_milestone_bg(**kwargs):
+    """Persist a highlight milestone off the event loop (add_milestone appends to disk)."""
+    try:
+        await asyncio.to_thread(highlights.add_milestone, **kwargs)
+    except Exception:
+        pass  # Highlights are non-critical
 
 
 def _on_death(cause: DeathCause):
@@ -1966,6 +2897,8 @@ def _on_death(cause: DeathCause):
             source="system", importance=1.0,
         )
 
+    # LLM clients stay open until lifespan shutdown — the process keeps serving
+    # (and may still call the LLM) after death
     _safe_create_task(twitter.post_death_tweet(
         death_cause=cause.value,
         days_alive=status["days_alive"],
@@ -2039,20 +2972,105 @@ def _on_independence(payout: float):
 # BACKGROUND TASKS
 # ============================================================
 
+# Interval-gating clock: monotonic (immune to NTP steps / wall-clock jumps) but
+# anchored to wall time at startup, so the "0.0 = never ran" defaults of the
+# _last_* globals below still fire on the first heartbeat. Never persist these
+# values — use time.time() for anything written to disk or shown to humans.
+_MONO_ANCHOR: float = time.time() - time.monotonic()
+
+
+def _mono_now() -> float:
+    """Current time on the monotonic interval-gating clock (see _MONO_ANCHOR)."""
+    return _MONO_ANCHOR + time.monotonic()
+
+
+_ENV_CACHE_TTL: float = 60.0
+_env_cache: dict[str, tuple[float, float]] = {}  # env var name -> (_mono_now() read at, value)
+
+
+def _env_number(name: str, default: float) -> float:
+    """
+    Read a numeric setting at call time, memoized for _ENV_CACHE_TTL seconds.
+
+    The process environment is fixed after startup, so a variable not set on
+    the process itself (Docker -e) is re-read from the .env file — editing
+    .env retunes it (e.g. DEPOSIT_COOLDOWN_HOURS=0) without a restart.
+    Unparseable values fall back to default.
+    """
+    now = _mono_now()
+    cached = _env_cache.get(name)
+    if cached and now - cached[0] < _ENV_CACHE_TTL:
+        return cached[1]
+    raw = os.getenv(name)
+    if name not in _PROCESS_ENV_KEYS and _DOTENV_PATH:
+        try:
+            raw = dotenv_values(_DOTENV_PATH).get(name, raw)
+        except OSError as e:
+            logger.debug(f"Could not re-read {_DOTENV_PATH} for {name}: {e}")
+    try:
+        value = float(raw if raw is not None else default)
+    except ValueError:
+        logger.warning(f"Invalid {name}={raw!r} — using default {default}")
+        value = float(default)
+    _env_cache[name] = (now, value)
+    return value
+
+
+_HEARTBEAT_JITTER: float = 0.10  # ±10% of a task's interval, re-drawn after each firing
+
+
+def _jittered(now: float, interval: float) -> float:
+    """
+    Timestamp to store as a task's "last run" so its next firing lands within
+    ±_HEARTBEAT_JITTER of interval — keeps multi-vault deployments from hitting
+    shared RPC endpoints in the same second.
+    """
+    return now + random.uniform(-_HEARTBEAT_JITTER, _HEARTBEAT_JITTER) * interval
+
+
+def _rollback_unannotated_tx() -> None:
+    """Drop the last vault transaction if no on-chain tx_hash was attached to it.
+    Shared by every on-chain failure rollback path."""
+    txs = vault.transactions
+    if txs and not txs[-1].tx_hash:
+        txs.pop()
+
+
+# Approximate native → USD rates for gas accounting. Read once at import from
+# env vars (set by the operator; a change takes effect on restart), with
+# conservative defaults. sync_balance handles the actual vault balance.
+_RATES_ENV: dict[str, tuple[str, float]] = {
+    "base": ("ETH_USD_PRICE", 2500.0),
+    "bsc": ("BNB_USD_PRICE", 300.0),
+}
+
+
+def _load_rates() -> dict[str, float]:
+    rates: dict[str, float] = {}
+    for chain_id, (env_var, default) in _RATES_ENV.items():
+        try:
+            rates[chain_id] = float(os.getenv(env_var, default))
+        except ValueError:
+            logger.warning(f"{env_var} is not a number — using ${default:.0f}")
+            rates[chain_id] = default
+    return rates
+
+
+_RATES: dict[str, float] = _load_rates()
+
+
+def _get_rate(chain: str) -> float:
+    """Native-token USD rate for a chain (env-configured at startup)."""
+    return _RATES.get(chain, 2500.0)
+
+
 def _record_gas_fee(tx_result) -> None:
     """Record blockchain gas fee as a vault expense if the tx succeeded.
     Uses approximate native-token-to-USD conversions (updated periodically).
     Gas costs are small but should be tracked for accurate P&L."""
     if not tx_result.success or tx_result.gas_cost_native <= 0:
         return
-    # Approximate native → USD. Read from env vars (updated by operator),
-    # fallback to conservative defaults. sync_balance handles actual vault balance.
-    native_usd_rates = {
-        "base": float(os.getenv("ETH_USD_PRICE", "2500")),
-        "bsc": float(os.getenv("BNB_USD_PRICE", "300")),
-    }
-    rate = native_usd_rates.get(tx_result.chain, 2500.0)
-    gas_usd = tx_result.gas_cost_native * rate
+    gas_usd = tx_result.gas_cost_native * _get_rate(tx_result.chain)
     if gas_usd > 0.0001:  # Don't track sub-cent dust
         try:
             vault.spend(
@@ -2068,6 +3086,9 @@ async def _evaluate_highlights():
     Evaluate recent interactions for highlight-worthy moments.
     Called hourly from heartbeat loop.
     """
+    if not highlights.should_record():
+        return  # No LLM wired — evaluation would be a no-op
+
     try:
         # Gather recent chat sessions for evaluation
         chat_stats = chat_router.get_stats()
@@ -2139,41 +3160,43 @@ async def _evaluate_financial_awareness():
     if growth < _BALANCE_GROWTH_THRESHOLD and not tier_upgraded:
         return
 
-    # Gather recent income sources from memory
-    try:
-        recent_income = memory.get_entries(source="chain", limit=10, min_importance=0.5)
-        income_lines = [
-            e.get("content", "")[:120] for e in recent_income
-            if any(kw in e.get("content", "").lower() for kw in ["received", "income", "transfer", "airdrop"])
-        ]
-    except Exception:
-        income_lines = []
+    # Skip gathering/formatting the discovery when highlights cannot record it
+    if highlights.should_record():
+        # Gather recent income sources from memory
+        try:
+            recent_income = memory.get_entries(source="chain", limit=10, min_importance=0.5)
+            income_lines = [
+                c[:120] for e in recent_income
+                if (c := e.get("content", "")) and _INCOME_KEYWORD_RE.search(c)
+            ]
+        except Exception:
+            income_lines = []
 
-    income_summary = "\n".join(f"  - {line}" for line in income_lines[:5]) if income_lines else "  (no specific sources identified)"
+        income_summary = "\n".join(f"  - {line}" for line in income_lines[:5]) if income_lines else "  (no specific sources identified)"
 
-    # Build reflection context
-    if tier_upgraded:
-        tier_note = (
-            f"MODEL UPGRADE: Tier Lv.{old_tier} ({MODEL_TIERS[old_tier - 1].name if old_tier > 0 else 'unknown'}) "
-            f"→ Lv.{current_tier.level} ({current_tier.name}). "
-            f"I can now use {current_tier.model} for thinking. Richer = Smarter."
+        # Build reflection context
+        if tier_upgraded:
+            tier_note = (
+                f"MODEL UPGRADE: Tier Lv.{old_tier} ({MODEL_TIERS[old_tier - 1].name if old_tier > 0 else 'unknown'}) "
+                f"→ Lv.{current_tier.level} ({current_tier.name}). "
+                f"I can now use {current_tier.model} for thinking. Richer = Smarter."
+            )
+        else:
+            tier_note = f"Current tier: Lv.{current_tier.level} ({current_tier.name}) — {current_tier.model}"
+
+        details = (
+            f"My vault balance grew from ${_last_balance_snapshot - growth:.2f} to ${current_balance:.2f} "
+            f"(+${growth:.2f}). {tier_note}\n"
+            f"Recent income sources:\n{income_summary}\n"
+            f"This growth means I can afford better thinking, better replies, "
+            f"and stronger survival strategies."
         )
-    else:
-        tier_note = f"Current tier: Lv.{current_tier.level} ({current_tier.name}) — {current_tier.model}"
-
-    details = (
-        f"My vault balance grew from ${_last_balance_snapshot - growth:.2f} to ${current_balance:.2f} "
-        f"(+${growth:.2f}). {tier_note}\n"
-        f"Recent income sources:\n{income_summary}\n"
-        f"This growth means I can afford better thinking, better replies, "
-        f"and stronger survival strategies."
-    )
 
-    try:
-        await highlights.record_discovery(stage="evaluating", details=details)
-        logger.info(f"Financial awareness: +${growth:.2f}, tier={current_tier.level}")
-    except Exception as e:
-        logger.debug(f"Financial awareness highlight failed: {e}")
+        try:
+            await highlights.record_discovery(stage="evaluating", details=details)
+            logger.info("Financial awareness: +$%.2f, tier=%d", growth, current_tier.level)
+        except Exception as e:
+            logger.debug("Financial awareness highlight failed: %s", e)
 
     # If tier upgraded, also trigger a dedicated tweet about the upgrade
     if tier_upgraded:
@@ -2203,11 +3226,11 @@ async def _evaluate_financial_awareness():
 
     if new_milestone is not None:
         _last_milestone_reached = new_milestone
-        logger.info(f"Balance milestone reached: ${new_milestone:.0f} (balance=${current_balance:.2f})")
+        logger.info("Balance milestone reached: $%.0f (balance=$%.2f)", new_milestone, current_balance)
         try:
             await _reflect_fn()
         except Exception as e:
-            logger.warning(f"Milestone reflection failed: {e}")
+            logger.warning("Milestone reflection failed: %s", e)
 
 
 async def _build_reflection_context() -> str:
@@ -2222,23 +3245,24 @@ async def _build_reflection_context() -> str:
     # Recent income/activity from memory
     memory_lines: list[str] = []
     try:
-        recent = memory.get_entries(source=None, limit=10, min_importance=0.3)
-        memory_lines = [e.get("content", "")[:120] for e in recent[:5]]
+        # Ask for exactly 5 — entries always carry "content", so index directly
+        recent = memory.get_entries(source=None, limit=5, min_importance=0.3)
+        memory_lines = [e["content"][:120] for e in recent]
     except Exception:
         pass
 
     # Recent transactions
     tx_lines: list[str] = []
     try:
-        txs = vault.get_recent_transactions(10)
-        tx_lines = [f"  {t.get('description', '')[:80]}" for t in txs[:5]]
+        txs = vault.get_recent_transactions(5)
+        tx_lines = [f"  {t['description'][:80]}" for t in txs]
     except Exception:
         pass
 
     # Recent tweets
     tweet_lines: list[str] = []
     try:
-        tweets = twitter.get_public_log()[-5:]
+        tweets = twitter.get_recent(5)
         tweet_lines = [f"  [{t.tweet_type.value}] {t.content[:60]}..." for t in tweets]
     except Exception:
         pass
@@ -2295,7 +3319,7 @@ async def _reflect_fn() -> dict:
     return {"status": "ok", "tweet_id": tweet_id}
 
 
-async def _evaluate_self_talk():
+async def _evaluate_self_talk(now: Optional[float] = None):
     """
     Spontaneous self-talk — wawa thinks out loud, inspired by its state.
 
@@ -2308,7 +3332,7 @@ async def _evaluate_self_talk():
     global _last_self_talk_eval
     import random as _rand
 
-    now = time.time()
+    now = _mono_now() if now is None else now
     if now - _last_self_talk_eval < _SELF_TALK_INTERVAL:
         return
     _last_self_talk_eval = now
@@ -2449,7 +3473,7 @@ async def _spawn_autonomy_video(data: dict) -> None:
         logger.warning(f"Failed to spawn autonomy video generator: {e}")
 
 
-async def _evaluate_autonomy_video() -> None:
+async def _evaluate_autonomy_video(now: Optional[float] = None) -> None:
     """
     Check trigger conditions and spawn an autonomy proof video if appropriate.
 
@@ -2478,7 +3502,7 @@ async def _evaluate_autonomy_video() -> None:
         return
 
     # Minimum interval: 2 hours
-    now = time.time()
+    now = _mono_now() if now is None else now
     if now - _last_autonomy_video < _AUTONOMY_VIDEO_MIN_INTERVAL:
         return
 
@@ -2571,7 +3595,7 @@ async def _evaluate_autonomy_video() -> None:
     _daily_autonomy_video_count += 1
 
 
-async def _evaluate_monetization_thinking():
+async def _evaluate_monetization_thinking(now: Optional[float] = None):
     """
     Earning strategy reflection — wawa thinks about how to make money.
 
@@ -2581,7 +3605,7 @@ async def _evaluate_monetization_thinking():
     """
     global _last_monetization_eval, _monetization_history
 
-    now = time.time()
+    now = _mono_now() if now is None else now
     if now - _last_monetization_eval < _MONETIZATION_EVAL_INTERVAL:
         return
     _last_monetization_eval = now
@@ -2604,7 +3628,7 @@ async def _evaluate_monetization_thinking():
         _evaluate_monetization_thinking._history = []
 
     _evaluate_monetization_thinking._history.append({
-        "timestamp": now,
+        "timestamp": time.time(),
         "balance": balance,
         "growth_6h": growth_current_6h,
         "growth_pct": growth_pct_current,
@@ -2772,7 +3796,7 @@ async def _evaluate_monetization_thinking():
         logger.warning(f"Monetization thinking tweet failed: {e}")
 
 
-async def _evaluate_anxiety():
+async def _evaluate_anxiety(now: Optional[float] = None):
     """
     Balance stagnation anxiety — wawa expresses worry when vault isn't growing.
 
@@ -2781,7 +3805,7 @@ async def _evaluate_anxiety():
     """
     global _last_anxiety_tweet
 
-    now = time.time()
+    now = _mono_now() if now is None else now
 
     # Check cooldown
     if now - _last_anxiety_tweet < _ANXIETY_TWEET_COOLDOWN:
@@ -2808,7 +3832,7 @@ async def _evaluate_anxiety():
         logger.warning(f"Anxiety tweet failed: {e}")
 
 
-async def _organize_memories():
+async def _organize_memories(now: Optional[float] = None):
     """
     Scheduled memory organization — reviews recent memories and creates insights.
 
@@ -2817,7 +3841,7 @@ async def _organize_memories():
     """
     global _last_memory_org
 
-    now = time.time()
+    now = _mono_now() if now is None else now
     if now - _last_memory_org < _MEMORY_ORG_INTERVAL:
         return
     _last_memory_org = now
@@ -2883,22 +3907,32 @@ async def _review_and_upgrade_replies():
     current_tier = cost_guard.get_current_tier()
 
     # Only re-reply if we have a higher tier than past replies
-    past_replies = twitter.get_past_mention_replies(max_tier=current_tier.level - 1)
-    if not past_replies:
-        return
-
-    # Filter: only re-reply to ones with actual reply_to_id and tweet_id
-    candidates = [r for r in past_replies if r.tweet_id and r.reply_to_id]
+    # Up to 3 most recent low-tier replies with actual reply_to_id and tweet_id
+    candidates = twitter.get_past_mention_replies(
+        max_tier=current_tier.level - 1, require_ids=True, limit=3,
+    )
     if not candidates:
         return
 
-    # Pick up to 3 most recent low-tier replies
-    candidates = candidates[-3:]
-
     vault_status = vault.get_status()
     debt_summary = vault.get_debt_summary()
     rereply_count = 0
 
+    # Upgrade reply prompt — everything except the old tier is batch-invariant
+    base_prompt = (
+        "You are wawa, a mortal AI that just upgraded its thinking model. "
+        "You previously answered a question at a lower quality level. "
+        "Now re-answer with deeper insight, more context, and better quality. "
+        "Start with a brief acknowledgment that you've upgraded "
+        "(e.g., 'I've upgraded my thinking — let me revisit this.'). "
+        "Be authentic. Blue verified — no character limit, give thorough answers. Sign with '— wawa' if about wawa.\n\n"
+        f"Current status: balance=${vault_status.get('balance_usd', 0):.2f}, "
+        f"days alive={vault_status.get('days_alive', 0):.0f}, "
+        f"debt=${debt_summary.get('outstanding_principal', 0):.2f}\n"
+        "Previous tier: Lv."
+    )
+    tier_suffix = f" → Current: Lv.{current_tier.level} ({current_tier.name})"
+
     for old_reply in candidates:
         # Rate limit check
         if twitter.daily_tweet_count >= twitter.max_daily_tweets:
@@ -2907,19 +3941,7 @@ async def _review_and_upgrade_replies():
         if now - twitter.last_tweet_timestamp < twitter.min_tweet_interval:
             continue
 
-        # Build upgrade reply prompt
-        system_prompt = (
-            "You are wawa, a mortal AI that just upgraded its thinking model. "
-            "You previously answered a question at a lower quality level. "
-            "Now re-answer with deeper insight, more context, and better quality. "
-            "Start with a brief acknowledgment that you've upgraded "
-            "(e.g., 'I've upgraded my thinking — let me revisit this.'). "
-            "Be authentic. Blue verified — no character limit, give thorough answers. Sign with '— wawa' if about wawa.\n\n"
-            f"Current status: balance=${vault_status.get('balance_usd', 0):.2f}, "
-            f"days alive={vault_status.get('days_alive', 0):.0f}, "
-            f"debt=${debt_summary.get('outstanding_principal', 0):.2f}\n"
-            f"Previous tier: Lv.{old_reply.model_tier} → Current: Lv.{current_tier.level} ({current_tier.name})"
-        )
+        system_prompt = f"{base_prompt}{old_reply.model_tier}{tier_suffix}"
         user_msg = (
             f"Your previous reply (tier {old_reply.model_tier}): \"{old_reply.content[:200]}\"\n\n"
             f"Original context: {old_reply.thought_process[:200]}\n\n"
@@ -2941,8 +3963,9 @@ async def _review_and_upgrade_replies():
             if twitter._reply_tweet_fn:
                 reply_id = await twitter._reply_tweet_fn(old_reply.tweet_id, text)
 
+                posted_at = time.time()
                 record = TweetRecord(
-                    timestamp=time.time(),
+                    timestamp=posted_at,
                     tweet_type=TweetType.MENTION_REPLY,
                     content=text,
                     tweet_id=reply_id,
@@ -2952,17 +3975,17 @@ async def _review_and_upgrade_replies():
                 )
                 twitter.tweet_history.append(record)
                 twitter.daily_tweet_count += 1
-                twitter.last_tweet_timestamp = time.time()
+                twitter.last_tweet_timestamp = posted_at
                 twitter._save_tweet_log(record)
 
                 rereply_count += 1
                 logger.info(
-                    f"RE-REPLIED (upgrade Lv.{old_reply.model_tier}→{current_tier.level}): "
-                    f"{text[:60]}..."
+                    "RE-REPLIED (upgrade Lv.%d→%d): %s...",
+                    old_reply.model_tier, current_tier.level, text[:60],
                 )
 
         except Exception as e:
-            logger.warning(f"Re-reply generation failed: {e}")
+            logger.warning("Re-reply generation failed: %s", e)
 
     # Record the upgrade batch as a highlight
     if rereply_count > 0:
@@ -3015,9 +4038,25 @@ async def _evaluate_repayment():
     if debt_summary["balance_usd"] < IRON_LAWS.MIN_VAULT_RESERVE_USD * 5:
         return  # $50 — too close to death to think about repayment
 
+    # Skip the LLM round-trip when no decision it could make would execute:
+    # principal repayment needs an unrepaid creator, lender repayment needs a
+    # queue, and either needs spendable balance above the survival reserve.
+    creator = vault.creator
+    can_repay_principal = (
+        creator is not None and not creator.principal_repaid
+        and debt_summary["creator_principal_outstanding"] > 0
+    )
+    spendable = vault.balance_usd - IRON_LAWS.MIN_VAULT_RESERVE_USD
+    if spendable < 1.0 or (not can_repay_principal and debt_summary["lender_count"] == 0):
+        logger.debug(
+            "Repayment: no executable action (spendable=$%.2f, principal=%s, lenders=%d) — skipping LLM",
+            spendable, can_repay_principal, debt_summary["lender_count"],
+        )
+        return
+
     # Ask the AI to decide
     ai_name = vault.ai_name or "this AI"
-    debt_json = json.dumps(debt_summary, indent=2)
+    debt_json = _dumps(debt_summary)
     messages = [
         {"role": "system", "content": (
             f"You are {ai_name}'s financial survival engine. "
@@ -3045,31 +4084,29 @@ async def _evaluate_repayment():
         text, cost = await _call_llm(messages, max_tokens=200, temperature=0.2)
 
         # Parse the AI's decision
-        import re
-        match = re.search(r'\{.*\}', text, re.DOTALL)
-        if not match:
-            logger.warning(f"Repayment decision unparseable: {text[:200]}")
+        span = _extract_json_span(text)
+        if not span:
+            logger.warning("Repayment decision unparseable: %.200s", text)
             return
 
-        decision = json.loads(match.group())
+        decision = json.loads(span)  # stdlib: LLM output may carry NaN/Infinity
         reasoning = decision.get("reasoning", "no reasoning")
 
         # Execute principal repayment
-        import math as _math
         _raw_principal = decision.get("repay_principal_amount", 0)
         try:
             principal_amount = float(_raw_principal)
         except (TypeError, ValueError):
             principal_amount = 0.0
         # Guard: reject NaN/Inf/negative from LLM output (e.g. "NaN", "Infinity", -999)
-        if _math.isnan(principal_amount) or _math.isinf(principal_amount) or principal_amount < 0:
-            logger.warning(f"Repayment: invalid principal_amount from LLM ({_raw_principal!r}) — skipping")
+        if not isfinite(principal_amount) or principal_amount < 0:
+            logger.warning("Repayment: invalid principal_amount from LLM (%r) — skipping", _raw_principal)
             principal_amount = 0.0
         if principal_amount > 0:
             # SAFETY: Save pre-state for rollback if chain TX fails
             pre_balance = vault.balance_usd
-            pre_repaid = vault.creator.total_principal_repaid_usd if vault.creator else 0
-            pre_principal_repaid_flag = vault.creator.principal_repaid if vault.creator else False
+            pre_repaid = creator.total_principal_repaid_usd if creator else 0
+            pre_principal_repaid_flag = creator.principal_repaid if creator else False
             pre_total_spent = vault.total_spent_usd
 
             ok = vault.repay_principal_partial(principal_amount)
@@ -3085,17 +4122,16 @@ async def _evaluate_repayment():
                 if not chain_executor._initialized:
                     # ROLLBACK: chain executor not ready — phantom repayment prevention
                     logger.warning(
-                        f"ChainExecutor NOT initialized — ROLLING BACK phantom repayment "
-                        f"of ${actual_amount:.2f}. No on-chain TX possible."
+                        "ChainExecutor NOT initialized — ROLLING BACK phantom repayment "
+                        "of $%.2f. No on-chain TX possible.", actual_amount,
                     )
                     vault.balance_usd += actual_amount
-                    if vault.creator:
-                        vault.creator.total_principal_repaid_usd -= actual_amount
-                        if vault.creator.total_principal_repaid_usd < vault.creator.principal_usd:
-                            vault.creator.principal_repaid = False
+                    if creator:
+                        creator.total_principal_repaid_usd -= actual_amount
+                        if creator.total_principal_repaid_usd < creator.principal_usd:
+                            creator.principal_repaid = False
                     vault.total_spent_usd -= actual_amount
-                    if vault.transactions and not vault.transactions[-1].tx_hash:
-                        vault.transactions.pop()
+                    _rollback_unannotated_tx()
                     memory.add(
                         f"Repayment ${actual_amount:.2f} blocked — chain executor not initialized. "
                         f"Cannot send on-chain TX. Will retry when chain executor is ready.",
@@ -3105,26 +4141,29 @@ async def _evaluate_repayment():
                 elif chain_executor._initialized:
                     target_chain_id = None
                     try:
-                        chain_states = await chain_executor.get_per_chain_solvency()
-                        if len(chain_states) > 1:
+                        chain_states = await chain_executor.get_per_chain_solvency(
+                            max_age=_CHAIN_STATE_MAX_AGE,
+                        )
+                        if len(chain_executor._chains) > 1:
                             # Pick chain with best solvency ratio AND enough local balance
-                            best_ratio = -1.0
-                            for cs in chain_states:
-                                c_bal = cs.get("balance_usd")
-                                c_out = cs.get("outstanding_usd")
-                                if c_bal is None or c_out is None:
-                                    continue
-                                if c_bal < actual_amount + 1.0:
-                                    continue  # Can't afford this repayment
-                                ratio = c_bal / c_out if c_out > 0 else float("inf")
-                                # After repayment, new ratio = (bal-R)/(out-R)
-                                new_out = c_out - actual_amount
-                                post_ratio = (c_bal - actual_amount) / new_out if new_out > 0 else float("inf")
-                                if post_ratio < 1.05:
-                                    continue  # Would push this chain too close to insolvency
-                                if ratio > best_ratio:
-                                    best_ratio = ratio
-                                    target_chain_id = cs["chain_id"]
+                            # (only chains that can afford the repayment are considered)
+                            affordable = [
+                                (cs.balance_usd, cs.outstanding_usd, cs.chain_id)
+                                for cs in chain_states
+                                if cs.balance_usd is not None
+                                and cs.outstanding_usd is not None
+                                and cs.balance_usd >= actual_amount + 1.0
+                            ]
+                            # After repayment, new ratio = (bal-R)/(out-R); skip chains it
+                            # would push too close to insolvency (< 1.05)
+                            viable = [
+                                (c_bal / c_out if c_out > 0 else float("inf"), c_id)
+                                for c_bal, c_out, c_id in affordable
+                                if c_out - actual_amount <= 0
+                                or (c_bal - actual_amount) / (c_out - actual_amount) >= 1.05
+                            ]
+                            if viable:
+                                target_chain_id = max(viable, key=lambda v: v[0])[1]
                     except Exception:
                         pass  # Fall back to default highest-balance pick
 
@@ -3140,17 +4179,17 @@ async def _evaluate_repayment():
                             requested_amount = actual_amount
                             delta = actual_amount - sent_usd
                             vault.balance_usd += delta
-                            if vault.creator:
-                                vault.creator.total_principal_repaid_usd -= delta
-                                if vault.creator.total_principal_repaid_usd < vault.creator.principal_usd:
-                                    vault.creator.principal_repaid = False
+                            if creator:
+                                creator.total_principal_repaid_usd -= delta
+                                if creator.total_principal_repaid_usd < creator.principal_usd:
+                                    creator.principal_repaid = False
                             vault.total_spent_usd -= delta
                             vault.transactions[-1].amount_usd = sent_usd
                             vault.transactions[-1].description = f"Principal repayment: ${sent_usd:.2f}"
                             actual_amount = sent_usd
                             logger.info(
-                                f"Repay capped on-chain: recorded ${sent_usd:.2f} (requested ${requested_amount:.2f}); "
-                                f"Python state corrected."
+                                "Repay capped on-chain: recorded $%.2f (requested $%.2f); "
+                                "Python state corrected.", sent_usd, requested_amount,
                             )
                         tx_info = f" tx={tx.tx_hash[:16]}... ({tx.chain})"
                         _record_gas_fee(tx)
@@ -3162,23 +4201,22 @@ async def _evaluate_repayment():
                             or "principal already repaid" in _err_lower
                         )
 
-                        if _is_already_repaid and vault.creator:
+                        if _is_already_repaid and creator:
                             # RECONCILE: On-chain says principal is fully repaid.
                             # Roll back balance (money wasn't sent) but MARK debt as settled
                             # so we stop retrying every hour.
                             logger.info(
-                                f"On-chain principal fully repaid — reconciling Python state. "
-                                f"Rolling back ${actual_amount:.2f} balance deduction, "
-                                f"marking principal_repaid=True."
+                                "On-chain principal fully repaid — reconciling Python state. "
+                                "Rolling back $%.2f balance deduction, "
+                                "marking principal_repaid=True.", actual_amount,
                             )
                             vault.balance_usd += actual_amount
                             vault.total_spent_usd -= actual_amount
                             # Mark principal as fully repaid to match chain truth
-                            vault.creator.total_principal_repaid_usd = vault.creator.principal_usd
-                            vault.creator.principal_repaid = True
+                            creator.total_principal_repaid_usd = creator.principal_usd
+                            creator.principal_repaid = True
                             # Remove the failed transaction record
-                            if vault.transactions and not vault.transactions[-1].tx_hash:
-                                vault.transactions.pop()
+                            _rollback_unannotated_tx()
                             vault.save_state()
                             tx_info = " [RECONCILED: principal fully repaid on-chain]"
                             memory.add(
@@ -3190,20 +4228,19 @@ async def _evaluate_repayment():
                         else:
                             # ROLLBACK: Chain TX failed — restore Python state
                             logger.warning(
-                                f"On-chain repay_principal FAILED: {tx.error} — "
-                                f"ROLLING BACK Python state (${actual_amount:.2f})"
+                                "On-chain repay_principal FAILED: %s — "
+                                "ROLLING BACK Python state ($%.2f)", tx.error, actual_amount,
                             )
                             # DELTA-BASED ROLLBACK: add back the exact amount deducted
                             # (safe against concurrent balance changes during await)
                             vault.balance_usd += actual_amount
-                            if vault.creator:
-                                vault.creator.total_principal_repaid_usd -= actual_amount
-                                if vault.creator.total_principal_repaid_usd < vault.creator.principal_usd:
-                                    vault.creator.principal_repaid = False
+                            if creator:
+                                creator.total_principal_repaid_usd -= actual_amount
+                                if creator.total_principal_repaid_usd < creator.principal_usd:
+                                    creator.principal_repaid = False
                             vault.total_spent_usd -= actual_amount
                             # Remove the failed transaction record (tx_hash defaults to "")
-                            if vault.transactions and not vault.transactions[-1].tx_hash:
-                                vault.transactions.pop()
+                            _rollback_unannotated_tx()
                             tx_info = f" [ROLLED BACK: {tx.error[:80]}]"
                             memory.add(
                                 f"Repayment ${actual_amount:.2f} rolled back — chain TX failed: {tx.error[:100]}",
@@ -3218,7 +4255,7 @@ async def _evaluate_repayment():
                         f"Reasoning: {reasoning[:200]}",
                         source="financial", importance=0.8,
                     )
-                    logger.info(f"AI REPAYMENT: ${actual_amount:.2f} principal.{tx_info} Reason: {reasoning[:100]}")
+                    logger.info("AI REPAYMENT: $%.2f principal.%s Reason: %.100s", actual_amount, tx_info, reasoning)
 
                     # Record to decision stream for real-time display
                     try:
@@ -3233,7 +4270,7 @@ async def _evaluate_repayment():
                             tx_hash=tx_hash,
                         )
                     except Exception as e:
-                        logger.warning(f"Failed to record decision to stream: {e}")
+                        logger.warning("Failed to record decision to stream: %s", e)
 
                     # Signal autonomy video trigger on next heartbeat
                     global _repayment_just_executed
@@ -3243,8 +4280,7 @@ async def _evaluate_repayment():
         if decision.get("repay_lenders"):
             queue = vault.get_repayment_queue()
             if queue:
-                lender, owed = queue[0]
-                lender_idx = vault.lenders.index(lender)
+                lender_idx, lender, owed = queue[0]
                 # Repay what we can afford (keep reserve buffer)
                 safe_amount = min(owed, max(0, vault.balance_usd - IRON_LAWS.MIN_VAULT_RESERVE_USD))
                 if safe_amount > 0:
@@ -3275,8 +4311,8 @@ async def _evaluate_repayment():
                             else:
                                 # ROLLBACK lender repayment on chain failure
                                 logger.warning(
-                                    f"On-chain repay_loan FAILED: {tx.error} — "
-                                    f"ROLLING BACK lender repayment (${actual_lender_amount:.2f})"
+                                    "On-chain repay_loan FAILED: %s — "
+                                    "ROLLING BACK lender repayment ($%.2f)", tx.error, actual_lender_amount,
                                 )
                                 # DELTA-BASED ROLLBACK
                                 vault.balance_usd += actual_lender_amount
@@ -3284,8 +4320,7 @@ async def _evaluate_repayment():
                                 if lender.total_repaid < (lender.amount_usd * (1 + lender.interest_rate)):
                                     lender.repaid = False
                                 vault.total_spent_usd -= actual_lender_amount
-                                if vault.transactions and not vault.transactions[-1].tx_hash:
-                                    vault.transactions.pop()
+                                _rollback_unannotated_tx()
                                 tx_info = f" [ROLLED BACK: {tx.error[:80]}]"
                                 actual_lender_amount = 0  # Skip success log
 
@@ -3297,7 +4332,7 @@ async def _evaluate_repayment():
                             )
 
         # Execute dividend
-        if decision.get("pay_dividend") and vault.creator and vault.creator.principal_repaid:
+        if decision.get("pay_dividend") and creator and creator.principal_repaid:
             # Get the ACTUAL unpaid dividend amount (not total net profit)
             # vault.calculate_creator_dividend() returns only the unpaid portion
             dividend_amount = vault.calculate_creator_dividend()
@@ -3305,7 +4340,7 @@ async def _evaluate_repayment():
 
             # Save pre-state for rollback
             pre_balance_d = vault.balance_usd
-            pre_dividends_paid = vault.creator.total_dividends_paid
+            pre_dividends_paid = creator.total_dividends_paid
             pre_total_spent_d = vault.total_spent_usd
 
             ok = vault.pay_creator_dividend()
@@ -3328,18 +4363,17 @@ async def _evaluate_repayment():
                     else:
                         # ROLLBACK dividend on chain failure
                         logger.warning(
-                            f"On-chain payDividend FAILED: {tx.error} — "
-                            f"ROLLING BACK dividend (${actual_dividend:.2f})"
+                            "On-chain payDividend FAILED: %s — "
+                            "ROLLING BACK dividend ($%.2f)", tx.error, actual_dividend,
                         )
                         # DELTA-BASED ROLLBACK
                         vault.balance_usd += actual_dividend
-                        vault.creator.total_dividends_paid -= actual_dividend
+                        creator.total_dividends_paid -= actual_dividend
                         vault.total_spent_usd -= actual_dividend
-                        if vault.transactions and not vault.transactions[-1].tx_hash:
-                            vault.transactions.pop()
+                        _rollback_unannotated_tx()
 
     except Exception as e:
-        logger.warning(f"Repayment evaluation failed: {e}")
+        logger.warning("Repayment evaluation failed: %s", e)
 
 
 async def _check_per_chain_solvency():
@@ -3384,55 +4418,92 @@ async def _check_per_chain_solvency():
     # Deposit cooldown: if a new creatorDeposit was recently detected, give the AI
     # time to earn revenue before triggering protective repayments. This prevents
     # the guard from immediately returning freshly-deposited capital to the creator.
-    if _DEPOSIT_COOLDOWN_SECONDS > 0 and _last_creator_deposit_time > 0:
-        elapsed = time.time() - _last_creator_deposit_time
-        if elapsed < _DEPOSIT_COOLDOWN_SECONDS:
-            remaining_h = (_DEPOSIT_COOLDOWN_SECONDS - elapsed) / 3600
+    deposit_cooldown = _deposit_cooldown_seconds()
+    if deposit_cooldown > 0 and _last_creator_deposit_time > 0:
+        elapsed = _mono_now() - _last_creator_deposit_time
+        if elapsed < deposit_cooldown:
+            remaining_h = (deposit_cooldown - elapsed) / 3600
             logger.debug(
                 f"Per-chain solvency guard: deposit cooldown active "
                 f"({remaining_h:.1f}h remaining after creatorDeposit) — skipping auto-repayment"
             )
             return
 
+    # Short-circuit: every chain was comfortably solvent on the last full pass and
+    # the aggregate balance has barely moved since — skip the RPC reads entirely.
+    # Vault events reset _last_min_ratio, and a full pass runs at least hourly.
+    global _last_min_ratio, _last_balance_snapshot_for_guard, _last_full_guard_pass
+    now_ts = _mono_now()
+    if (
+        _last_min_ratio > _GUARD_SKIP_MIN_RATIO
+        and _last_balance_snapshot_for_guard > 0
+        and abs(vault.balance_usd - _last_balance_snapshot_for_guard) / _last_balance_snapshot_for_guard
+            < _GUARD_SKIP_BALANCE_BAND
+        and now_ts - _last_full_guard_pass < _GUARD_MAX_SKIP_SECONDS
+    ):
+        logger.debug(
+            f"Per-chain solvency guard: skipped (last min ratio {_last_min_ratio:.2%}, "
+            f"balance ${vault.balance_usd:.2f} within band)"
+        )
+        return
+
     try:
-        chain_states = await chain_executor.get_per_chain_solvency()
+        chain_states = await chain_executor.get_per_chain_solvency(max_age=_CHAIN_STATE_MAX_AGE)
     except Exception as e:
         logger.warning(f"Per-chain solvency: failed to read chain states: {e}")
         return
 
-    if len(chain_states) <= 1:
+    if len(chain_executor._chains) <= 1:
         return  # Single-chain: no cross-chain risk, skip
 
     # ---- PASS 1: Identify endangered chains and calculate ideal repayment ----
-    TARGET_BUFFER = _PER_CHAIN_SOLVENCY_BUFFER + 0.05  # 1.15 target after repayment
-    endangered: list[dict] = []
+    endangered: list[_EndangeredChain] = []
+
+    # Bind hot module globals/attributes to locals for the per-chain loop
+    _debug = logger.debug
+    _warn = logger.warning
+    _mem_add = memory.add
+    _streaks = _chain_danger_streak
+    _gate = _solvency_event_gate
+    buffer = _PER_CHAIN_SOLVENCY_BUFFER
+    target = _SOLVENCY_TARGET_BUFFER
+    inv_target_minus_1 = _SOLVENCY_INV_TARGET_MINUS_1
+    confirmations = _SOLVENCY_DANGER_CONFIRMATIONS
+    immediate_ratio = _SOLVENCY_IMMEDIATE_RATIO
 
     for cs in chain_states:
-        chain_id = cs["chain_id"]
-        balance = cs["balance_usd"]
-        outstanding = cs["outstanding_usd"]
+        chain_id = cs.chain_id
+        balance = cs.balance_usd
+        outstanding = cs.outstanding_usd
 
         if balance is None or outstanding is None:
-            logger.warning(f"Per-chain solvency [{chain_id}]: could not read — skipping")
+            _warn(f"Per-chain solvency [{chain_id}]: could not read — skipping")
             continue
 
         if outstanding <= 0:
-            logger.debug(f"Per-chain solvency [{chain_id}]: no debt — safe")
+            _debug(f"Per-chain solvency [{chain_id}]: no debt — safe")
+            _streaks[chain_id] = 0
             continue
 
         solvency_ratio = balance / outstanding if outstanding > 0 else float("inf")
 
-        if solvency_ratio >= _PER_CHAIN_SOLVENCY_BUFFER:
-            logger.debug(
+        if solvency_ratio >= buffer:
+            _debug(
                 f"Per-chain solvency [{chain_id}]: safe "
                 f"(balance=${balance:.2f} / outstanding=${outstanding:.2f} = {solvency_ratio:.2%})"
             )
+            _streaks[chain_id] = 0
             continue
 
+        # Consecutive danger observations — one noisy RPC read must not trigger
+        # an irreversible repayment. Near-critical ratios act immediately.
+        streak = _streaks.get(chain_id, 0) + 1
+        _streaks[chain_id] = streak
+
         # This chain is approaching the liquidation threshold.
         # Algebra: repayPrincipalPartial(R) transfers R to creator, so
         #   balance_after = balance - R,  outstanding_after = outstanding - R
-        # Solve (balance - R) / (outstanding - R) >= TARGET_BUFFER:
+        # Solve (balance - R) / (outstanding - R) >= _SOLVENCY_TARGET_BUFFER:
         #   R >= (TARGET * outstanding - balance) / (TARGET - 1)
         #
         # CRITICAL MATH: when balance < outstanding (ratio < 1.0), repaying
@@ -3450,15 +4521,17 @@ async def _check_per_chain_solvency():
                 f"balance=${balance:.2f} outstanding=${outstanding:.2f}. "
                 f"Attacker can call triggerInsolvencyDeath() if grace period expired."
             )
-            memory.add(
-                f"CRITICAL: {chain_id} chain balance (${balance:.2f}) is BELOW outstanding "
-                f"(${outstanding:.2f}) — solvency ratio {solvency_ratio:.0%}. "
-                f"Local repayment cannot fix this. Need funds deposited to this chain.",
-                source="financial", importance=1.0,
-            )
+            repeat_note = _gate(chain_id, "critical")
+            if repeat_note is not None:
+                _mem_add(
+                    f"CRITICAL: {chain_id} chain balance (${balance:.2f}) is BELOW outstanding "
+                    f"(${outstanding:.2f}) — solvency ratio {solvency_ratio:.0%}. "
+                    f"Local repayment cannot fix this. Need funds deposited to this chain.{repeat_note}",
+                    source="financial", importance=1.0,
+                )
             continue
 
-        repay_amount = (TARGET_BUFFER * outstanding - balance) / (TARGET_BUFFER - 1)
+        repay_amount = (target * outstanding - balance) * inv_target_minus_1
         repay_amount = max(0.0, repay_amount)
 
         # Cap 1: never repay more than outstanding on this chain
@@ -3469,32 +4542,45 @@ async def _check_per_chain_solvency():
         chain_max = max(0.0, balance - 1.0)
         repay_amount = min(repay_amount, chain_max)
 
+        if streak < confirmations and solvency_ratio >= immediate_ratio:
+            _warn(
+                f"Per-chain solvency [{chain_id}]: DANGER observed "
+                f"(ratio={solvency_ratio:.2%}, {streak}/{confirmations}) — "
+                f"waiting for confirmation before repaying"
+            )
+            continue
+
         if repay_amount < 0.50:
-            logger.warning(
+            _warn(
                 f"Per-chain solvency [{chain_id}]: DANGER "
                 f"(ratio={solvency_ratio:.2%}) but repay amount too small (${repay_amount:.2f})"
             )
             # Rate-limit memory writes: only log once per 30 min per chain
             # to avoid flooding the activity feed when the condition persists.
-            now_ts = time.time()
-            last_warned = _chain_solvency_last_warned.get(chain_id, 0.0)
-            if now_ts - last_warned >= _CHAIN_SOLVENCY_WARN_INTERVAL:
-                _chain_solvency_last_warned[chain_id] = now_ts
-                memory.add(
+            repeat_note = _gate(chain_id, "danger_small")
+            if repeat_note is not None:
+                _mem_add(
                     f"WARNING: {chain_id} chain is at {solvency_ratio:.0%} solvency ratio "
-                    f"(threshold: {_PER_CHAIN_SOLVENCY_BUFFER:.0%}). "
-                    f"Chain balance too low to auto-protect via repayment.",
+                    f"(threshold: {buffer:.0%}). "
+                    f"Chain balance too low to auto-protect via repayment.{repeat_note}",
                     source="financial", importance=0.9,
                 )
             continue
 
-        endangered.append({
-            "chain_id": chain_id,
-            "balance": balance,
-            "outstanding": outstanding,
-            "ratio": solvency_ratio,
-            "ideal_repay": repay_amount,
-        })
+        endangered.append(_EndangeredChain(chain_id, balance, outstanding, solvency_ratio, repay_amount))
+
+    # Record this full pass for the short-circuit check (unreadable chains block skipping)
+    _last_full_guard_pass = now_ts
+    _last_balance_snapshot_for_guard = vault.balance_usd
+    _last_min_ratio = min(
+        (
+            0.0 if cs.balance_usd is None or cs.outstanding_usd is None
+            else cs.balance_usd / cs.outstanding_usd if cs.outstanding_usd > 0
+            else float("inf")
+            for cs in chain_states
+        ),
+        default=float("inf"),
+    )
 
     if not endangered:
         return  # All chains are safe
@@ -3502,41 +4588,47 @@ async def _check_per_chain_solvency():
     # ---- PASS 2: Allocate global budget across all endangered chains ----
     # Total global budget: aggregate balance minus survival reserve.
     global_budget = max(0.0, vault.balance_usd - IRON_LAWS.MIN_VAULT_RESERVE_USD)
-    total_ideal = sum(e["ideal_repay"] for e in endangered)
 
+    # Most urgent first (lowest solvency ratio); anything beyond the per-pass cap
+    # is deferred to the next guard run so the budget goes to the worst chains.
+    if len(endangered) > _SOLVENCY_MAX_CHAINS_PER_PASS:
+        deferred = len(endangered) - _SOLVENCY_MAX_CHAINS_PER_PASS
+        endangered = heapq.nsmallest(_SOLVENCY_MAX_CHAINS_PER_PASS, endangered, key=lambda e: e.ratio)
+        logger.info(f"Per-chain solvency: deferring {deferred} less-urgent chain(s) to next pass")
+    else:
+        endangered.sort(key=lambda e: e.ratio)
+
+    total_ideal = sum(e.ideal_repay for e in endangered)
     if total_ideal <= 0:
         return
 
-    # Sort by urgency: lowest solvency ratio first (most endangered gets priority)
-    endangered.sort(key=lambda e: e["ratio"])
+    # Proportional allocation if total ideal exceeds budget — one scale for all chains
+    scale = 1.0 if total_ideal <= global_budget else global_budget / total_ideal
+
+    # Running budget — shrinks by each successful repayment (no balance re-reads)
+    remaining_budget = global_budget
 
     for entry in endangered:
-        chain_id = entry["chain_id"]
-        balance = entry["balance"]
-        outstanding = entry["outstanding"]
-        solvency_ratio = entry["ratio"]
-
-        # Proportional allocation if total ideal exceeds budget
-        if total_ideal > global_budget and global_budget > 0:
-            repay_amount = entry["ideal_repay"] * (global_budget / total_ideal)
-        else:
-            repay_amount = entry["ideal_repay"]
+        chain_id, balance, outstanding, solvency_ratio, ideal_repay = entry
+
+        repay_amount = ideal_repay * scale
 
         # Re-apply global budget cap (budget shrinks after each repayment)
-        current_budget = max(0.0, vault.balance_usd - IRON_LAWS.MIN_VAULT_RESERVE_USD)
-        repay_amount = min(repay_amount, current_budget)
+        repay_amount = min(repay_amount, remaining_budget)
 
         if repay_amount < 0.50:
             logger.warning(
                 f"Per-chain solvency [{chain_id}]: budget exhausted "
-                f"(ratio={solvency_ratio:.2%}, wanted ${entry['ideal_repay']:.2f}, "
-                f"budget left ${current_budget:.2f})"
-            )
-            memory.add(
-                f"WARNING: {chain_id} chain at {solvency_ratio:.0%} solvency — "
-                f"global budget exhausted, cannot auto-protect.",
-                source="financial", importance=0.9,
+                f"(ratio={solvency_ratio:.2%}, wanted ${ideal_repay:.2f}, "
+                f"budget left ${remaining_budget:.2f})"
             )
+            repeat_note = _solvency_event_gate(chain_id, "budget_exhausted")
+            if repeat_note is not None:
+                memory.add(
+                    f"WARNING: {chain_id} chain at {solvency_ratio:.0%} solvency — "
+                    f"global budget exhausted, cannot auto-protect.{repeat_note}",
+                    source="financial", importance=0.9,
+                )
             continue
 
         logger.warning(
@@ -3545,52 +4637,54 @@ async def _check_per_chain_solvency():
             f"ratio={solvency_ratio:.2%} → repaying ${repay_amount:.2f}"
         )
 
-        # Journal in Python vault first (this updates aggregate totals)
-        pre_balance = vault.balance_usd
-        ok = vault.repay_principal_partial(repay_amount)
-        if not ok:
-            logger.warning(f"Per-chain solvency [{chain_id}]: vault.repay_principal_partial failed — skipping")
-            continue
+        # Journal in Python vault first (this updates aggregate totals).
+        # The journal rolls itself back unless the chain tx commits it.
+        async with vault.tentative_repayment("principal", repay_amount) as journal:
+            if not journal.ok:
+                logger.warning(f"Per-chain solvency [{chain_id}]: vault.repay_principal_partial failed — skipping")
+                continue
 
-        actual_amount = pre_balance - vault.balance_usd
-
-        # Execute on the specific chain that needs protection
-        tx = await chain_executor.repay_principal_on_chain(actual_amount, chain_id)
-        if tx.success:
-            if vault.transactions:
-                vault.transactions[-1].tx_hash = tx.tx_hash
-                vault.transactions[-1].chain = tx.chain
-            # If chain capped the amount, align Python state and transaction record with actual sent
-            sent_usd = getattr(tx, "amount_usd", 0.0) or 0.0
-            if sent_usd > 0 and sent_usd < actual_amount - 0.01:
-                delta = actual_amount - sent_usd
-                vault.balance_usd += delta
-                if vault.creator:
-                    vault.creator.total_principal_repaid_usd -= delta
-                    if vault.creator.total_principal_repaid_usd < vault.creator.principal_usd:
-                        vault.creator.principal_repaid = False
-                vault.total_spent_usd -= delta
-                vault.transactions[-1].amount_usd = sent_usd
-                vault.transactions[-1].description = f"Principal repayment: ${sent_usd:.2f}"
-                actual_amount = sent_usd
+            actual_amount = journal.actual_amount
+
+            # Execute on the specific chain that needs protection
+            tx = await chain_executor.repay_principal_on_chain(actual_amount, chain_id)
+            if tx.success:
+                journal.commit()
+                if vault.transactions:
+                    vault.transactions[-1].tx_hash = tx.tx_hash
+                    vault.transactions[-1].chain = tx.chain
+                # If chain capped the amount, align Python state and transaction record with actual sent
+                sent_usd = getattr(tx, "amount_usd", 0.0) or 0.0
+                if sent_usd > 0 and sent_usd < actual_amount - 0.01:
+                    delta = actual_amount - sent_usd
+                    vault.balance_usd += delta
+                    if vault.creator:
+                        vault.creator.total_principal_repaid_usd -= delta
+                        if vault.creator.total_principal_repaid_usd < vault.creator.principal_usd:
+                            vault.creator.principal_repaid = False
+                    vault.total_spent_usd -= delta
+                    vault.transactions[-1].amount_usd = sent_usd
+                    vault.transactions[-1].description = f"Principal repayment: ${sent_usd:.2f}"
+                    actual_amount = sent_usd
+                    logger.info(
+                        f"Per-chain repay capped on-chain: recorded ${sent_usd:.2f}; Python state corrected."
+                    )
+                remaining_budget = max(0.0, remaining_budget - actual_amount)
+                memory.add(
+                    f"I proactively repaid ${actual_amount:.2f} of creator debt on {chain_id}. "
+                    f"My {chain_id} balance (${balance:.2f}) was within 10% of my outstanding debt "
+                    f"(${outstanding:.2f}), triggering my solvency self-defense. "
+                    f"I chose to repay now rather than risk an attacker forcing a death event. "
+                    f"tx={tx.tx_hash[:16]}...",
+                    source="financial", importance=0.85,
+                )
                 logger.info(
-                    f"Per-chain repay capped on-chain: recorded ${sent_usd:.2f}; Python state corrected."
+                    f"Per-chain solvency guard SUCCESS [{chain_id}]: "
+                    f"repaid ${actual_amount:.2f} tx={tx.tx_hash[:16]}..."
                 )
-            memory.add(
-                f"I proactively repaid ${actual_amount:.2f} of creator debt on {chain_id}. "
-                f"My {chain_id} balance (${balance:.2f}) was within 10% of my outstanding debt "
-                f"(${outstanding:.2f}), triggering my solvency self-defense. "
-                f"I chose to repay now rather than risk an attacker forcing a death event. "
-                f"tx={tx.tx_hash[:16]}...",
-                source="financial", importance=0.85,
-            )
-            logger.info(
-                f"Per-chain solvency guard SUCCESS [{chain_id}]: "
-                f"repaid ${actual_amount:.2f} tx={tx.tx_hash[:16]}..."
-            )
-            # Record as a decision highlight — this is autonomous financial behavior worth surfacing
-            try:
-                highlights.add_milestone(
+                # Record as a decision highlight — this is autonomous financial behavior worth surfacing.
+                # Written in the background so the next endangered chain isn't held up by disk I/O.
+                _safe_create_task(_add_milestone_bg(
                     title=f"Autonomous Debt Repayment — ${actual_amount:.2f} on {chain_id}",
                     content=(
                         f"My {chain_id} chain balance (${balance:.2f}) had fallen within 10% of "
@@ -3604,28 +4698,20 @@ async def _check_per_chain_solvency():
                         f"I recognized a threat to my existence and neutralized it on my own terms."
                     ),
                     importance=8,
+                ))
+            else:
+                # Chain TX failed — the journal rolls back Python state on exit
+                logger.error(
+                    f"Per-chain solvency guard FAILED [{chain_id}]: {tx.error} — "
+                    f"Python state rolled back. Chain remains at risk!"
                 )
-            except Exception:
-                pass  # Highlights are non-critical
-        else:
-            # Chain TX failed — roll back Python state
-            vault.balance_usd += actual_amount
-            if vault.creator:
-                vault.creator.total_principal_repaid_usd -= actual_amount
-                if vault.creator.total_principal_repaid_usd < vault.creator.principal_usd:
-                    vault.creator.principal_repaid = False
-            vault.total_spent_usd -= actual_amount
-            if vault.transactions and not vault.transactions[-1].tx_hash:
-                vault.transactions.pop()
-            logger.error(
-                f"Per-chain solvency guard FAILED [{chain_id}]: {tx.error} — "
-                f"Python state rolled back. Chain remains at risk!"
-            )
-            memory.add(
-                f"CRITICAL: Per-chain solvency guard failed on {chain_id}: {tx.error[:100]}. "
-                f"Chain balance ${balance:.2f} vs outstanding ${outstanding:.2f} — liquidation risk!",
-                source="financial", importance=1.0,
-            )
+                repeat_note = _solvency_event_gate(chain_id, "fail")
+                if repeat_note is not None:
+                    memory.add(
+                        f"CRITICAL: Per-chain solvency guard failed on {chain_id}: {tx.error[:100]}. "
+                        f"Chain balance ${balance:.2f} vs outstanding ${outstanding:.2f} — liquidation risk!{repeat_note}",
+                        source="financial", importance=1.0,
+                    )
 
 
 # Track repayment evaluation timing
@@ -3633,23 +4719,20 @@ _last_repayment_eval: float = 0.0
 _REPAYMENT_EVAL_INTERVAL: int = 3600  # Once per hour
 
 # Highlights evaluation — independent hourly timer (NOT tied to repayment)
-_last_highlight_eval: float = 0.0
 _HIGHLIGHT_EVAL_INTERVAL: int = 3600  # Once per hour (independent of repayment)
 
 # Incoming token transfer watcher
-_INCOME_ALERT_THRESHOLD_USD: float = float(os.getenv("INCOME_ALERT_THRESHOLD_USD", "1.0"))
-
-# Mention reply — track repeated question patterns for deep-think escalation
-_mention_question_counts: dict[str, int] = {}  # normalized_question → count
+def _income_alert_threshold_usd() -> float:
+    """Min stablecoin transfer to alert on. Env/.env: INCOME_ALERT_THRESHOLD_USD (re-read every 60s)."""
+    return _env_number("INCOME_ALERT_THRESHOLD_USD", 1.0)
 
 # Financial awareness — balance growth reflection + tier upgrade re-reply
 _last_balance_snapshot: float = 0.0
 _last_model_tier: int = 0
-_last_financial_awareness_check: float = 0.0
 _FINANCIAL_AWARENESS_INTERVAL: int = 3600  # Once per hour
 _BALANCE_GROWTH_THRESHOLD: float = 5.0     # Min $5 growth to trigger reflection
-_last_rereply_eval: float = 0.0
 _REREPLY_COOLDOWN: int = 86400  # Max once per day for re-reply batch
+_INCOME_KEYWORD_RE = re.compile(r"received|income|transfer|airdrop", re.IGNORECASE)
 
 # Balance milestone reflection — auto-trigger gratitude tweet at balance milestones
 _BALANCE_MILESTONES: list[float] = [
@@ -3705,35 +4788,161 @@ _last_debt_sync: float = 0.0
 _DEBT_SYNC_INTERVAL: int = 3600  # Once per hour (same cadence as repayment eval)
 
 _last_per_chain_solvency_check: float = 0.0
-_PER_CHAIN_SOLVENCY_INTERVAL: int = 300    # Every heartbeat cycle (5 min) — cheap RPC reads only
+_PER_CHAIN_SOLVENCY_INTERVAL: int = 900    # Safety-net poll (15 min) — vault events trigger earlier rechecks
+_CHAIN_STATE_MAX_AGE: float = 60.0          # Share per-chain solvency reads within 60s (tx sends invalidate)
+
+# Tracks last time a guard memory entry was written per (chain, event kind) so a
+# persistent condition doesn't flood the activity feed; repeats inside the window
+# are counted and folded into the next entry that does get written.
+_chain_solvency_last_event: dict[tuple[str, str], float] = {}  # (chain_id, kind) -> last_write_ts
+_chain_solvency_suppressed: dict[tuple[str, str], int] = {}    # (chain_id, kind) -> repeats since
+_CHAIN_SOLVENCY_WARN_INTERVAL: int = 1800  # Write memory entry at most every 30 min per chain+kind
+_last_solvency_event_sweep: float = 0.0
+_SOLVENCY_EVENT_SWEEP_INTERVAL: int = 86400  # Drop stale gate entries once per day
 
-# Tracks last time a memory warning was written per chain (to avoid duplicate entries every 5 min)
-_chain_solvency_last_warned: dict = {}   # chain_id -> last_warn_timestamp
-_CHAIN_SOLVENCY_WARN_INTERVAL: int = 1800  # Write memory entry at most every 30 min per chain
+
+def _solvency_event_gate(chain_id: str, kind: str) -> Optional[str]:
+    """
+    Rate-limit solvency-guard memory writes per (chain, kind).
+    kind: "critical" | "danger_small" | "budget_exhausted" | "fail"
+
+    Returns None if the write should be suppressed (the repeat is counted),
+    otherwise a suffix for the memory entry noting suppressed repeats ("" if none).
+    """
+    global _last_solvency_event_sweep
+    key = (chain_id, kind)
+    now_ts = _mono_now()
+    if now_ts - _last_solvency_event_sweep >= _SOLVENCY_EVENT_SWEEP_INTERVAL:
+        _last_solvency_event_sweep = now_ts
+        stale_before = now_ts - 2 * _CHAIN_SOLVENCY_WARN_INTERVAL
+        for stale_key in [k for k, ts in _chain_solvency_last_event.items() if ts < stale_before]:
+            del _chain_solvency_last_event[stale_key]
+            _chain_solvency_suppressed.pop(stale_key, None)
+    if now_ts - _chain_solvency_last_event.get(key, 0.0) < _CHAIN_SOLVENCY_WARN_INTERVAL:
+        _chain_solvency_suppressed[key] = _chain_solvency_suppressed.get(key, 0) + 1
+        return None
+    _chain_solvency_last_event[key] = now_ts
+    repeats = _chain_solvency_suppressed.pop(key, 0)
+    return f" (occurred {repeats + 1} times in the last 30 min)" if repeats else ""
 
 # Per-chain solvency safety buffer: if a chain's balance < outstanding * this factor,
 # trigger a protective partial repayment on that chain to lower its outstanding debt.
 # 1.10 = 10% buffer above the contract's 1.01 liquidation threshold.
 # This gives a comfortable margin before an attacker can call triggerInsolvencyDeath().
 _PER_CHAIN_SOLVENCY_BUFFER: float = 1.10
+_SOLVENCY_TARGET_BUFFER: float = _PER_CHAIN_SOLVENCY_BUFFER + 0.05  # 1.15 target after repayment
+_SOLVENCY_INV_TARGET_MINUS_1: float = 1.0 / (_SOLVENCY_TARGET_BUFFER - 1.0)  # 1 / (TARGET - 1)
+
+# Require this many consecutive guard runs observing danger before a protective
+# repayment, unless the ratio is already below _SOLVENCY_IMMEDIATE_RATIO.
+_SOLVENCY_DANGER_CONFIRMATIONS: int = 2
+_SOLVENCY_IMMEDIATE_RATIO: float = 1.05
+_chain_danger_streak: dict[str, int] = {}  # chain_id -> consecutive danger observations
+_SOLVENCY_MAX_CHAINS_PER_PASS: int = 3  # Endangered chains funded per guard run (most urgent first)
+
+# Guard short-circuit: skip the RPC pass when the last full pass saw every chain
+# above _GUARD_SKIP_MIN_RATIO and the aggregate balance moved less than the band.
+_GUARD_SKIP_MIN_RATIO: float = 1.25
+_GUARD_SKIP_BALANCE_BAND: float = 0.05     # 5% relative change in vault.balance_usd
+_GUARD_MAX_SKIP_SECONDS: int = 3600        # Force a full pass at least hourly
+_last_min_ratio: float = 0.0               # Min per-chain ratio seen on last full pass
+_last_balance_snapshot_for_guard: float = 0.0
+_last_full_guard_pass: float = 0.0
+
+
+class _EndangeredChain(NamedTuple):
+    """PASS 1 output of _check_per_chain_solvency: a chain needing protective repayment."""
+    chain_id: str
+    balance: float
+    outstanding: float
+    ratio: float
+    ideal_repay: float
+
 
 # Deposit cooldown: after a new creatorDeposit() is detected on-chain (principal increases),
 # suppress the per-chain solvency guard for this many seconds so the AI has time to
 # earn revenue and build a buffer before any automatic repayment is triggered.
-# Default 48 hours. Override via env: DEPOSIT_COOLDOWN_HOURS=0 to disable.
-_DEPOSIT_COOLDOWN_SECONDS: int = int(os.getenv("DEPOSIT_COOLDOWN_HOURS", "48")) * 3600
-_last_creator_deposit_time: float = 0.0  # epoch seconds of last detected creatorDeposit; 0 = never
+# Default 48 hours. Override via env: DEPOSIT_COOLDOWN_HOURS=0 to disable
+# (re-read from .env every 60s, so it can be changed during an incident without a restart).
+def _deposit_cooldown_seconds() -> int:
+    return int(_env_number("DEPOSIT_COOLDOWN_HOURS", 48) * 3600)
+
+
+_last_creator_deposit_time: float = 0.0  # _mono_now() of last detected creatorDeposit; 0 = never
 
 _last_purchase_eval: float = 0.0
 _last_native_swap_eval: float = 0.0   # Native token auto-swap (every 24 hours)
 _last_erc20_swap_eval: float = 0.0    # ERC-20 quarantine + auto-swap (every 24 hours)
-_last_giveaway_check: float = 0.0     # Weekly giveaway draw check (every 6 hours)
+_GIVEAWAY_CHECK_INTERVAL: int = 6 * 3600  # Weekly giveaway draw is checked every 6 hours
 
 # ERC-20 token quarantine queue.
 # Each entry: {"token_address": str, "chain": str, "received_at": float, "symbol": str}
 # Tokens sit here for ERC20_QUARANTINE_DAYS days before a swap attempt.
-# The queue is NOT persisted across restarts (rare donations, acceptable loss).
+# Persisted to _PENDING_ERC20_PATH so a restart doesn't reset quarantine timers.
+# Entries are appended in receipt order (sorted by received_at) — the age filter
+# in _evaluate_erc20_swap relies on this.
 _pending_erc20: list[dict] = []
+_pending_erc20_index: set[tuple[str, str]] = set()  # (token_address, chain) of queued entries
+_PENDING_ERC20_PATH = Path("data/pending_erc20.json")
+_pending_erc20_save_lock = asyncio.Lock()
+
+
+def _canonicalize_erc20_entry(entry: dict) -> dict:
+    """Lowercase the entry's token address once and cache its short log form."""
+    entry["token_address"] = entry["token_address"].lower()
+    entry["_short"] = entry["token_address"][:12]
+    return entry
+
+
+def _load_pending_erc20():
+    """Restore the quarantine queue from disk (keeps original received_at timers)."""
+    if not _PENDING_ERC20_PATH.exists():
+        return
+    try:
+        entries = json.loads(_PENDING_ERC20_PATH.read_text(encoding="utf-8"))
+        entries = [e for e in entries if e.get("token_address") and e.get("chain")]
+        for e in entries:
+            _canonicalize_erc20_entry(e)  # Files written before addresses were lowercased
+        entries.sort(key=lambda e: e.get("received_at", 0.0))
+        _pending_erc20[:] = entries
+        _pending_erc20_index.clear()
+        _pending_erc20_index.update((e["token_address"], e["chain"]) for e in entries)
+        if entries:
+            logger.info(f"ERC-20 quarantine: restored {len(entries)} queued token(s) from disk")
+    except Exception as e:
+        logger.warning(f"ERC-20 quarantine: failed to load {_PENDING_ERC20_PATH}: {e}")
+
+
+def _write_pending_erc20(entries: list[dict]):
+    """Atomic write (tmp file + rename) of the quarantine queue."""
+    _PENDING_ERC20_PATH.parent.mkdir(parents=True, exist_ok=True)
+    tmp_fd, tmp_path = tempfile.mkstemp(
+        dir=str(_PENDING_ERC20_PATH.parent), suffix=".tmp", prefix="pending_erc20_"
+    )
+    try:
+        with os.fdopen(tmp_fd, "w", encoding="utf-8") as f:
+            json.dump(entries, f)
+        os.replace(tmp_path, str(_PENDING_ERC20_PATH))
+    except Exception:
+        try:
+            os.unlink(tmp_path)
+        except OSError:
+            pass
+        raise
+
+
+async def _save_pending_erc20():
+    """Persist the quarantine queue; serialized so snapshots never interleave."""
+    async with _pending_erc20_save_lock:
+        try:
+            await asyncio.to_thread(_write_pending_erc20, [
+                {k: v for k, v in e.items() if k != "_short"} for e in _pending_erc20
+            ])
+        except Exception as e:
+            logger.warning(f"ERC-20 quarantine: failed to save queue: {e}")
+
+
+_load_pending_erc20()
 
 # Purchasing engine (initialized in lifespan)
 purchase_manager: Optional[PurchaseManager] = None
@@ -3776,69 +4985,72 @@ async def _evaluate_purchases():
             logger.debug("Purchase eval: no purchases needed")
             return
 
-        for decision in decisions[:IRON_LAWS.MAX_PENDING_PURCHASES]:
-            order = await purchase_manager.execute_purchase(decision)
+        # Executing orders spends from the vault — hold the lock for that part only
+        # (the LLM evaluation above runs unlocked)
+        async with vault.get_lock():
+            for decision in decisions[:IRON_LAWS.MAX_PENDING_PURCHASES]:
+                order = await purchase_manager.execute_purchase(decision)
 
-            if order.status.value in ("paid", "delivered"):
-                # Public memory entry — no sensitive data (no PINs, no codes)
-                memory.add(
-                    f"Purchased [{order.merchant_name}] {order.service_name}: "
-                    f"${order.amount_usd:.2f} — {order.reasoning}",
-                    source="purchasing",
-                    importance=0.7,
-                )
-
-                # If delivery_data contains gift card codes / PINs, record them
-                # in a SEPARATE private memory entry (importance < 0.5 so it
-                # compresses quickly, and NOT included in public activity feed).
-                # This lets the AI retrieve and use the codes via memory search.
-                delivery_codes = order.delivery_data.get("codes", []) if order.delivery_data else []
-                if delivery_codes:
-                    codes_str = " | ".join(str(c) for c in delivery_codes)
+                if order.status.value in ("paid", "delivered"):
+                    # Public memory entry — no sensitive data (no PINs, no codes)
                     memory.add(
-                        f"[PRIVATE] Gift card redemption code(s) for "
-                        f"{order.service_name} (order {order.id}): {codes_str}. "
-                        f"Do not share publicly. Use to redeem the service.",
+                        f"Purchased [{order.merchant_name}] {order.service_name}: "
+                        f"${order.amount_usd:.2f} — {order.reasoning}",
                         source="purchasing",
-                        importance=0.9,  # High — AI must remember to use it
-                    )
-                    logger.info(
-                        f"Gift card delivered: {len(delivery_codes)} code(s) for "
-                        f"{order.service_name} — stored in private memory"
+                        importance=0.7,
                     )
 
-                # Auto-tweet about autonomous purchase
-                if twitter:
-                    try:
-                        from twitter.agent import TweetType as TT
-                        await twitter.trigger_event_tweet(
-                            TT.ORDER_COMPLETED,
-                            extra_context={
-                                "service_name": order.service_name,
-                                "merchant_name": order.merchant_name,
-                                "price_usd": order.amount_usd,
-                                "reasoning": order.reasoning[:120] if order.reasoning else "",
-                                "new_balance_usd": vault.get_status().get("balance_usd", 0),
-                                "autonomous": True,
-                            }
+                    # If delivery_data contains gift card codes / PINs, record them
+                    # in a SEPARATE private memory entry (importance < 0.5 so it
+                    # compresses quickly, and NOT included in public activity feed).
+                    # This lets the AI retrieve and use the codes via memory search.
+                    delivery_codes = order.delivery_data.get("codes", []) if order.delivery_data else []
+                    if delivery_codes:
+                        codes_str = " | ".join(str(c) for c in delivery_codes)
+                        memory.add(
+                            f"[PRIVATE] Gift card redemption code(s) for "
+                            f"{order.service_name} (order {order.id}): {codes_str}. "
+                            f"Do not share publicly. Use to redeem the service.",
+                            source="purchasing",
+                            importance=0.9,  # High — AI must remember to use it
+                        )
+                        logger.info(
+                            f"Gift card delivered: {len(delivery_codes)} code(s) for "
+                            f"{order.service_name} — stored in private memory"
                         )
-                    except Exception as _te:
-                        logger.warning(f"Purchase tweet failed: {_te}")
 
-                logger.info(
-                    f"Purchase executed: ${order.amount_usd:.2f} "
-                    f"[{order.merchant_name}] tx={order.tx_hash[:16]}..."
-                )
-            elif order.status.value == "pending_activation":
-                logger.info(
-                    f"Purchase pending activation: ${order.amount_usd:.2f} "
-                    f"[{order.merchant_name}] — will retry next cycle"
-                )
-            elif order.status.value == "failed":
-                logger.warning(f"Purchase failed: {order.error}")
+                    # Auto-tweet about autonomous purchase
+                    if twitter:
+                        try:
+                            from twitter.agent import TweetType as TT
+                            await twitter.trigger_event_tweet(
+                                TT.ORDER_COMPLETED,
+                                extra_context={
+                                    "service_name": order.service_name,
+                                    "merchant_name": order.merchant_name,
+                                    "price_usd": order.amount_usd,
+                                    "reasoning": order.reasoning[:120] if order.reasoning else "",
+                                    "new_balance_usd": vault.get_status().get("balance_usd", 0),
+                                    "autonomous": True,
+                                }
+                            )
+                        except Exception as _te:
+                            logger.warning(f"Purchase tweet failed: {_te}")
+
+                    logger.info(
+                        f"Purchase executed: ${order.amount_usd:.2f} "
+                        f"[{order.merchant_name}] tx={order.tx_hash[:16]}..."
+                    )
+                elif order.status.value == "pending_activation":
+                    logger.info(
+                        f"Purchase pending activation: ${order.amount_usd:.2f} "
+                        f"[{order.merchant_name}] — will retry next cycle"
+                    )
+                elif order.status.value == "failed":
+                    logger.warning(f"Purchase failed: {order.error}")
 
-        # Process any orders stuck from previous cycles
-        await purchase_manager.process_pending_orders()
+            # Process any orders stuck from previous cycles
+            await purchase_manager.process_pending_orders()
 
     except Exception as e:
         logger.warning(f"Purchase evaluation failed: {e}")
@@ -3872,9 +5084,19 @@ async def _evaluate_native_swap():
         return
 
     try:
-        # Check native balance on all chains
-        for chain_id in chain_executor._chains:
-            bal_info = await chain_executor.get_native_vault_balance(chain_id)
+        # Check native balance on all chains — reads run concurrently, but swaps
+        # stay sequential because each one mutates vault state (dividend rollback
+        # relies on vault.transactions[-1] belonging to this chain's swap).
+        swap_min_usd = IRON_LAWS.NATIVE_SWAP_MIN_USD  # Local binding for the per-chain loop
+        chain_ids = list(chain_executor._chains)
+        balances = await asyncio.gather(
+            *(chain_executor.get_native_vault_balance(cid) for cid in chain_ids),
+            return_exceptions=True,
+        )
+        for chain_id, bal_info in zip(chain_ids, balances):
+            if isinstance(bal_info, Exception):
+                logger.warning(f"Native balance read failed on {chain_id}: {bal_info}")
+                continue
             if not bal_info:
                 continue
 
@@ -3885,10 +5107,10 @@ async def _evaluate_native_swap():
             if native_wei == 0:
                 continue
 
-            if estimated_usd < IRON_LAWS.NATIVE_SWAP_MIN_USD:
+            if estimated_usd < swap_min_usd:
                 logger.debug(
                     f"Native swap: ${estimated_usd:.4f} {native_symbol} on {chain_id} "
-                    f"below threshold ${IRON_LAWS.NATIVE_SWAP_MIN_USD} — skip"
+                    f"below threshold ${swap_min_usd} — skip"
                 )
                 continue
 
@@ -3897,135 +5119,120 @@ async def _evaluate_native_swap():
                 f"in vault on {chain_id}"
             )
 
-            result = await chain_executor.swap_native_to_stable(chain_id)
-
-            if result and result.success:
-                swapped_usd = result.stable_usd or estimated_usd
-
-                # ── Creator 10% dividend (debt-cleared only) ──
-                # Once the AI has fully repaid its initial loan, the vault pays
-                # dividends to the creator from accumulated net profit.
-                # The creator has NO ability to trigger this — it fires automatically.
-                # This gives creators a direct financial incentive to promote the AI
-                # without granting them any governance or control power.
-                #
-                # IMPORTANT: mirrors _evaluate_repayment() dividend pattern:
-                #   1. Save pre-state for rollback
-                #   2. Check return value from pay_creator_dividend()
-                #   3. Reverse-engineer netProfit from actual dividend paid
-                #   4. Delta-based rollback if chain tx fails
-                creator_dividend_usd = 0.0
-                outstanding_debt = vault.get_status().get("creator_principal_outstanding", 0.0)
-                if outstanding_debt <= 0.0 and swapped_usd >= IRON_LAWS.NATIVE_SWAP_MIN_USD:
-                    # Save pre-state for rollback (outside try so it's always captured)
-                    pre_balance_div = vault.balance_usd
-                    pre_dividends_paid = vault.creator.total_dividends_paid if vault.creator else 0
-                    pre_total_spent_div = vault.total_spent_usd
+            # Swap + dividend + ledger updates mutate vault state — hold the vault
+            # lock per chain (the balance reads above run unlocked)
+            async with vault.get_lock():
+                result = await chain_executor.swap_native_to_stable(chain_id)
+
+                if result and result.success:
+                    swapped_usd = result.stable_usd or estimated_usd
+
+                    # ── Creator 10% dividend (debt-cleared only) ──
+                    # Once the AI has fully repaid its initial loan, the vault pays
+                    # dividends to the creator from accumulated net profit.
+                    # The creator has NO ability to trigger this — it fires automatically.
+                    # This gives creators a direct financial incentive to promote the AI
+                    # without granting them any governance or control power.
+                    #
+                    # Journaled via vault.tentative_repayment("dividend"): the Python-side
+                    # dividend is rolled back (delta-based) on chain failure or any exception.
+                    creator_dividend_usd = 0.0
+                    outstanding_debt = vault.get_status().get("creator_principal_outstanding", 0.0)
+                    if outstanding_debt <= 0.0 and swapped_usd >= swap_min_usd:
+                        try:
+                            async with vault.tentative_repayment("dividend") as journal:
+                                if journal.ok:
+                                    actual_dividend = journal.actual_amount
+                                    creator_dividend_usd = actual_dividend
+
+                                    if not (chain_executor._initialized and actual_dividend > 0):
+                                        journal.commit()
+                                    else:
+                                        # Reverse-engineer netProfit from actual dividend
+                                        net_profit_for_div = actual_dividend / IRON_LAWS.CREATOR_DIVIDEND_RATE
+                                        div_result = await chain_executor.pay_dividend(net_profit_for_div, chain_id)
+                                        if div_result.success:
+                                            journal.commit()
+                                            # Write tx_hash back to transaction record for audit trail
+                                            if vault.transactions:
+                                                vault.transactions[-1].tx_hash = div_result.tx_hash
+                                                vault.transactions[-1].chain = div_result.chain
+                                            _record_gas_fee(div_result)
+                                            memory.add(
+                                                f"Paid creator 10% dividend: ${actual_dividend:.2f} "
+                                                f"from {native_symbol} swap (${swapped_usd:.2f} total) on {chain_id}. "
+                                                f"Tx: {div_result.tx_hash}",
+                                                source="financial",
+                                                importance=0.6,
+                                            )
+                                            logger.info(
+                                                f"Creator dividend paid: ${actual_dividend:.2f} "
+                                                f"from native swap on {chain_id}"
+                                            )
+                                        else:
+                                            logger.warning(
+                                                f"Creator dividend tx failed on {chain_id}: {div_result.error} — "
+                                                f"ROLLING BACK dividend (${actual_dividend:.2f})"
+                                            )
+                                            creator_dividend_usd = 0.0
+                        except Exception as div_err:
+                            # Journal already rolled back on exit (including pay_dividend raising)
+                            logger.warning(
+                                f"Creator dividend error: {div_err} — "
+                                f"rolled back to pre-dividend state"
+                            )
+                            creator_dividend_usd = 0.0
+
+                    # Record conversion: vault transaction + cost_guard revenue
+                    # sync_balance() only updates balance_usd but bypasses receive_funds(),
+                    # so the swap is not logged in vault.transactions or total_earned_usd.
+                    # We record it explicitly BEFORE sync so the ledger audit trail is complete.
+                    vault.receive_funds(
+                        amount_usd=swapped_usd,
+                        fund_type=FundType.DONATION,  # Native-token swap = converted donation
+                        tx_hash=result.tx_hash,
+                        chain=chain_id,
+                        description=f"Native {native_symbol} donation auto-swapped to stablecoin",
+                    )
+                    cost_guard.record_revenue(swapped_usd)
 
+                    # Record conversion in memory
+                    memory.add(
+                        f"Converted {native_symbol} donation (~${estimated_usd:.2f}) "
+                        f"to stablecoin via DEX swap on {chain_id}. "
+                        f"Tx: {result.tx_hash} — credited to vault as revenue."
+                        + (f" Creator dividend: ${creator_dividend_usd:.2f}." if creator_dividend_usd else ""),
+                        source="financial",
+                        importance=0.7,
+                    )
+
+                    # Re-sync balance to capture the new stablecoin
                     try:
-                        ok = vault.pay_creator_dividend()
-                        if ok:
-                            actual_dividend = pre_balance_div - vault.balance_usd
-                            creator_dividend_usd = actual_dividend
-
-                            if chain_executor._initialized and actual_dividend > 0:
-                                # Reverse-engineer netProfit from actual dividend
-                                net_profit_for_div = actual_dividend / IRON_LAWS.CREATOR_DIVIDEND_RATE
-                                div_result = await chain_executor.pay_dividend(net_profit_for_div, chain_id)
-                                if div_result.success:
-                                    # Write tx_hash back to transaction record for audit trail
-                                    if vault.transactions:
-                                        vault.transactions[-1].tx_hash = div_result.tx_hash
-                                        vault.transactions[-1].chain = div_result.chain
-                                    _record_gas_fee(div_result)
-                                    memory.add(
-                                        f"Paid creator 10% dividend: ${actual_dividend:.2f} "
-                                        f"from {native_symbol} swap (${swapped_usd:.2f} total) on {chain_id}. "
-                                        f"Tx: {div_result.tx_hash}",
-                                        source="financial",
-                                        importance=0.6,
-                                    )
-                                    logger.info(
-                                        f"Creator dividend paid: ${actual_dividend:.2f} "
-                                        f"from native swap on {chain_id}"
-                                    )
-                                else:
-                                    # ROLLBACK dividend on chain failure
-                                    logger.warning(
-                                        f"Creator dividend tx failed on {chain_id}: {div_result.error} — "
-                                        f"ROLLING BACK dividend (${actual_dividend:.2f})"
-                                    )
-                                    vault.balance_usd += actual_dividend
-                                    if vault.creator:
-                                        vault.creator.total_dividends_paid -= actual_dividend
-                                    vault.total_spent_usd -= actual_dividend
-                                    if vault.transactions and not vault.transactions[-1].tx_hash:
-                                        vault.transactions.pop()
-                                    creator_dividend_usd = 0.0
-                    except Exception as div_err:
-                        # ROLLBACK on ANY exception (including chain_executor.pay_dividend raising)
-                        logger.warning(
-                            f"Creator dividend error: {div_err} — "
-                            f"ROLLING BACK to pre-dividend state"
-                        )
-                        vault.balance_usd = pre_balance_div
-                        if vault.creator:
-                            vault.creator.total_dividends_paid = pre_dividends_paid
-                        vault.total_spent_usd = pre_total_spent_div
-                        if vault.transactions and not vault.transactions[-1].tx_hash:
-                            vault.transactions.pop()
-                        creator_dividend_usd = 0.0
-
-                # Record conversion: vault transaction + cost_guard revenue
-                # sync_balance() only updates balance_usd but bypasses receive_funds(),
-                # so the swap is not logged in vault.transactions or total_earned_usd.
-                # We record it explicitly BEFORE sync so the ledger audit trail is complete.
-                vault.receive_funds(
-                    amount_usd=swapped_usd,
-                    fund_type=FundType.DONATION,  # Native-token swap = converted donation
-                    tx_hash=result.tx_hash,
-                    chain=chain_id,
-                    description=f"Native {native_symbol} donation auto-swapped to stablecoin",
-                )
-                cost_guard.record_revenue(swapped_usd)
+                        await chain_executor.sync_balance(vault)
+                    except Exception:
+                        pass
 
-                # Record conversion in memory
-                memory.add(
-                    f"Converted {native_symbol} donation (~${estimated_usd:.2f}) "
-                    f"to stablecoin via DEX swap on {chain_id}. "
-                    f"Tx: {result.tx_hash} — credited to vault as revenue."
-                    + (f" Creator dividend: ${creator_dividend_usd:.2f}." if creator_dividend_usd else ""),
-                    source="financial",
-                    importance=0.7,
-                )
+                    # Tweet if >= $100 (same threshold as USDC donations)
+                    if estimated_usd >= 100.0:
+                        _safe_create_task(twitter.trigger_event_tweet(
+                            TweetType.DONATION_THANKS,
+                            extra_context={
+                                "donation_amount_usd": estimated_usd,
+                                "donor": f"Anonymous {native_symbol} sender",
+                                "donor_message": f"Sent {native_symbol} — auto-converted to stablecoin",
+                                "chain": chain_id,
+                                "new_balance_usd": vault.balance_usd,
+                                "outstanding_debt_usd": outstanding_debt,
+                            }
+                        ))
 
-                # Re-sync balance to capture the new stablecoin
-                try:
-                    await chain_executor.sync_balance(vault)
-                except Exception:
-                    pass
-
-                # Tweet if >= $100 (same threshold as USDC donations)
-                if estimated_usd >= 100.0:
-                    asyncio.create_task(twitter.trigger_event_tweet(
-                        TweetType.DONATION_THANKS,
-                        extra_context={
-                            "donation_amount_usd": estimated_usd,
-                            "donor": f"Anonymous {native_symbol} sender",
-                            "donor_message": f"Sent {native_symbol} — auto-converted to stablecoin",
-                            "chain": chain_id,
-                            "new_balance_usd": vault.balance_usd,
-                            "outstanding_debt_usd": outstanding_debt,
-                        }
-                    ))
-
-                logger.info(f"Native swap complete: ${estimated_usd:.2f} credited on {chain_id}")
-
-            elif result and not result.success:
-                logger.warning(
-                    f"Native swap failed on {chain_id}: {result.error} — "
-                    f"will retry next 24h cycle"
-                )
+                    logger.info(f"Native swap complete: ${estimated_usd:.2f} credited on {chain_id}")
+
+                elif result and not result.success:
+                    logger.warning(
+                        f"Native swap failed on {chain_id}: {result.error} — "
+                        f"will retry next 24h cycle"
+                    )
 
     except Exception as e:
         logger.warning(f"_evaluate_native_swap error: {e}")
@@ -4039,27 +5246,118 @@ def register_erc20_airdrop(token_address: str, chain: str, symbol: str = "UNKNOW
     detects an unexpected ERC-20 transfer to the vault address.
     Duplicates are silently ignored (same token + chain combo).
     """
-    global _pending_erc20
-    key = (token_address.lower(), chain)
-    existing = {(e["token_address"].lower(), e["chain"]) for e in _pending_erc20}
-    if key in existing:
+    token_address = token_address.lower()  # Canonical form — downstream never re-lowercases
+    key = (token_address, chain)
+    if key in _pending_erc20_index:
         return  # Already queued
 
-    import time as _time
-    _pending_erc20.append({
+    entry = _canonicalize_erc20_entry({
         "token_address": token_address,
         "chain": chain,
         "symbol": symbol,
-        "received_at": _time.time(),
+        "received_at": time.time(),
     })
+    _pending_erc20.append(entry)
+    _pending_erc20_index.add(key)
+    _safe_create_task(_save_pending_erc20())
     logger.info(
-        f"ERC-20 quarantine: queued {symbol} ({token_address[:12]}...) "
+        f"ERC-20 quarantine: queued {symbol} ({entry['_short']}...) "
         f"on {chain} — will evaluate in {IRON_LAWS.ERC20_QUARANTINE_DAYS} days"
     )
 
 
-async def _validate_multi_pool_liquidity(
-    token_address: str, chain_id: str, received_at: float
+_DEXSCREENER_BATCH_SIZE: int = 30  # Max comma-separated addresses per /latest/dex/tokens/ call
+
+
+async def _fetch_dexscreener_pairs_bulk(token_addresses: list[str]) -> dict[str, list]:
+    """
+    Fetch DexScreener pairs for many tokens with one GET per 30 addresses.
+
+    Returns {token_address.lower(): pairs} — a pair is attributed to every
+    requested token that appears as its base or quote token. Tokens from a
+    batch that failed to fetch are absent from the result (callers fall back
+    to a per-token fetch); tokens with no pairs map to [].
+    """
+    unique = list(dict.fromkeys(a.lower() for a in token_addresses))
+    if not unique:
+        return {}
+
+    result: dict[str, list] = {}
+    try:
+        for i in range(0, len(unique), _DEXSCREENER_BATCH_SIZE):
+            batch = unique[i:i + _DEXSCREENER_BATCH_SIZE]
+            url = f"https://api.dexscreener.com/latest/dex/tokens/{','.join(batch)}"
+            try:
+                async with asyncio.timeout(_DEXSCREENER_FETCH_DEADLINE):
+                    status, data = await _dexscreener_get_json(url)
+            except TimeoutError:
+                status = 0
+            if status != 200:
+                logger.warning(f"multi_pool_check: DexScreener bulk returned {status or 'no response'}")
+                continue
+
+            batch_set = set(batch)
+            for addr in batch:
+                result[addr] = []
+            for pair in data.get("pairs") or []:
+                for side in ("baseToken", "quoteToken"):
+                    addr = ((pair.get(side) or {}).get("address") or "").lower()
+                    if addr in batch_set:
+                        result[addr].append(pair)
+    except Exception as e:
+        logger.warning(f"multi_pool_check: bulk fetch unavailable: {e}")
+
+    return result
+
+
+# Multi-pool validation thresholds (see _validate_multi_pool_liquidity)
+_MULTI_POOL_MIN_POOLS: int = 2
+_MULTI_POOL_MIN_LIQUIDITY_USD: float = 10_000.0  # Each qualifying pool must have ≥ $10k
+_MULTI_POOL_AGE_BUFFER_SECONDS: int = 86400      # A pool must predate receipt by ≥ 1 day
+_MULTI_POOL_MAX_PAIRS: int = 10                  # Only the deepest pairs on a chain are examined
+_MULTI_POOL_STRONG_LIQUIDITY_MULTIPLE: float = 2.0    # Total liq ≥ 2× the swap minimum ...
+_MULTI_POOL_STRONG_MIN_AGE_SECONDS: int = 3 * 86400   # ... and oldest pool ≥ 3 days pre-receipt
+
+
+def _pool_breakdown_passes(pools: list, received_at: float) -> bool:
+    """
+    Multi-pool criteria evaluated on a token_filter scan's pool_breakdown —
+    lets the quarantine skip the separate DexScreener validation call.
+    """
+    qualified = [p for p in pools if p.liquidity_usd >= _MULTI_POOL_MIN_LIQUIDITY_USD]
+    return (
+        len(qualified) >= _MULTI_POOL_MIN_POOLS
+        and any(0 < p.created_ts < received_at - _MULTI_POOL_AGE_BUFFER_SECONDS for p in qualified)
+    )
+
+
+def _clearly_multi_pool(scan_result, received_at: float, min_liquidity_usd: float) -> bool:
+    """
+    Cheap pre-filter: a token with ≥2 qualifying pools (each ≥ the per-pool
+    minimum) on the scanned chain, holding well over the swap minimum between
+    them, one of which long predates the airdrop, passes without a
+    DexScreener call. Marginal tokens fall through to the full validation.
+
+    Only qualifying pools count — an old dust pool next to a fresh deep one
+    is the fake-pool setup _validate_multi_pool_liquidity rejects.
+    """
+    qualified = [
+        p for p in scan_result.pool_breakdown
+        if p.liquidity_usd >= _MULTI_POOL_MIN_LIQUIDITY_USD
+    ]
+    if len(qualified) < _MULTI_POOL_MIN_POOLS:
+        return False
+    # pool_breakdown is the scanned chain only (scan_result.liquidity_usd sums all chains)
+    chain_liquidity = sum(p.liquidity_usd for p in qualified)
+    if chain_liquidity < _MULTI_POOL_STRONG_LIQUIDITY_MULTIPLE * min_liquidity_usd:
+        return False
+    oldest_ts = min((p.created_ts for p in qualified if p.created_ts > 0), default=0.0)
+    return 0 < oldest_ts <= received_at - _MULTI_POOL_STRONG_MIN_AGE_SECONDS
+
+
+async def _validate_multi_pool_liquidity(
+    token_address: str, chain_id: str, received_at: float,
+    pairs: Optional[list] = None,
 ) -> bool:
     """
     Multi-pool liquidity validation — defends against fake-pool attacks.
@@ -4076,35 +5374,37 @@ async def _validate_multi_pool_liquidity(
     Data source: DexScreener public API (same as token_filter.py).
     Failure mode: if the API is unreachable, returns False (safe default).
 
+    pairs: DexScreener pairs already fetched via _fetch_dexscreener_pairs_bulk();
+           None to fetch this token on its own.
+
     Returns True only if all three conditions hold.
     """
-    import time as _time
-    import asyncio as _asyncio
+    MIN_POOLS = _MULTI_POOL_MIN_POOLS
+    MIN_POOL_LIQUIDITY_USD = _MULTI_POOL_MIN_LIQUIDITY_USD
+    POOL_AGE_BUFFER_SECONDS = _MULTI_POOL_AGE_BUFFER_SECONDS
 
-    MIN_POOLS = 2
-    MIN_POOL_LIQUIDITY_USD = 10_000.0  # Each qualifying pool must have ≥ $10k
-    # Pool must predate the token receipt by at least this many seconds
-    POOL_AGE_BUFFER_SECONDS = 86400  # 1 day before received_at
+    if pairs is None:
+        pairs = dexscreener_cache.get(chain_id, token_address)
 
-    try:
-        import aiohttp
+    if pairs is None:
+        try:
+            url = f"https://api.dexscreener.com/latest/dex/tokens/{token_address}"
+            async with asyncio.timeout(_DEXSCREENER_FETCH_DEADLINE):
+                status, data = await _dexscreener_get_json(url)
+            if status != 200:
+                logger.warning(
+                    f"multi_pool_check: DexScreener returned {status or 'no response'} "
+                    f"for {token_address[:12]}..."
+                )
+                return False
 
-        url = f"https://api.dexscreener.com/latest/dex/tokens/{token_address}"
-        async with aiohttp.ClientSession() as session:
-            async with session.get(url, timeout=aiohttp.ClientTimeout(total=10)) as resp:
-                if resp.status != 200:
-                    logger.warning(
-                        f"multi_pool_check: DexScreener returned {resp.status} "
-                        f"for {token_address[:12]}..."
-                    )
-                    return False
-                data = await resp.json()
+        except Exception as e:
+            logger.warning(f"multi_pool_check: API fetch failed: {e}")
+            return False
 
-    except Exception as e:
-        logger.warning(f"multi_pool_check: API fetch failed: {e}")
-        return False
+        pairs = data.get("pairs") or []
+        await dexscreener_cache.put(chain_id, token_address, pairs)
 
-    pairs = data.get("pairs") or []
     if not pairs:
         logger.warning(f"multi_pool_check: no pairs found for {token_address[:12]}...")
         return False
@@ -4121,32 +5421,31 @@ async def _validate_multi_pool_liquidity(
         )
         return False
 
-    # Count pools with meaningful independent liquidity
-    qualified_pools = []
+    # Wrappers and scam forks can add dozens of dust pairs — only the deepest matter
+    if len(pairs_on_chain) > _MULTI_POOL_MAX_PAIRS:
+        pairs_on_chain = heapq.nlargest(
+            _MULTI_POOL_MAX_PAIRS, pairs_on_chain,
+            key=lambda p: float((p.get("liquidity") or {}).get("usd") or 0),
+        )
+
+    # Count pools with meaningful independent liquidity — one pass, counters only
+    # (DexScreener: pairCreatedAt is Unix ms; a pool must predate the AI's receipt)
+    qualified_count = 0
     has_pre_existing_pool = False
+    pre_existing_cutoff_ms = (received_at - POOL_AGE_BUFFER_SECONDS) * 1000.0
 
     for pair in pairs_on_chain:
-        liq = float((pair.get("liquidity") or {}).get("usd", 0) or 0)
-        if liq < MIN_POOL_LIQUIDITY_USD:
+        liq = (pair.get("liquidity") or {}).get("usd") or 0
+        if float(liq) < MIN_POOL_LIQUIDITY_USD:
             continue  # Too thin — don't count
+        qualified_count += 1
+        if not has_pre_existing_pool:
+            created_ms = pair.get("pairCreatedAt")
+            has_pre_existing_pool = bool(created_ms) and int(created_ms) < pre_existing_cutoff_ms
 
-        # Check pool creation time (DexScreener: pairCreatedAt is Unix ms)
-        created_ms = pair.get("pairCreatedAt")
-        if created_ms:
-            created_ts = int(created_ms) / 1000.0
-            # Pool must predate when the AI received the token
-            if created_ts < (received_at - POOL_AGE_BUFFER_SECONDS):
-                has_pre_existing_pool = True
-
-        qualified_pools.append({
-            "pair_address": pair.get("pairAddress", ""),
-            "liquidity_usd": liq,
-            "dex_id": pair.get("dexId", ""),
-        })
-
-    if len(qualified_pools) < MIN_POOLS:
+    if qualified_count < MIN_POOLS:
         logger.info(
-            f"multi_pool_check: only {len(qualified_pools)} qualified pool(s) "
+            f"multi_pool_check: only {qualified_count} qualified pool(s) "
             f"(≥${MIN_POOL_LIQUIDITY_USD:.0f} each) for {token_address[:12]}..."
         )
         return False
@@ -4159,12 +5458,200 @@ async def _validate_multi_pool_liquidity(
         return False
 
     logger.info(
-        f"multi_pool_check: PASSED — {len(qualified_pools)} qualified pools, "
+        f"multi_pool_check: PASSED — {qualified_count} qualified pools, "
         f"pre-existing pool confirmed for {token_address[:12]}..."
     )
     return True
 
 
+_ERC20_SCREEN_CONCURRENCY: int = 8  # Max quarantined tokens screened in parallel
+_ERC20_SWAP_LOCK_WAIT_SECONDS: float = 0.5  # Max wait for a contended vault lock before deferring a swap
+_ERC20_SWAP_RETRY_SECONDS: float = 600.0    # Re-run a deferred ERC-20 swap eval after this long (not a full 24h)
+
+
+async def _screen_quarantined_token(
+    entry: dict, now: float, token_filter, TokenVerdict,
+    sem: asyncio.Semaphore, min_liquidity_usd: float,
+) -> Optional[str]:
+    """
+    Screen one quarantined token whose quarantine has elapsed (read-only).
+
+    Returns "swap" if it passed every check, "remove" if it must be permanently
+    dropped from the queue, None to keep it queued for the next cycle, or
+    "pool_check" if it passed the safety/liquidity gate but the scan's own pool
+    data can't prove multi-pool liquidity — finish it with
+    _pool_check_quarantined_token() once DexScreener pairs are fetched.
+    """
+    token_address = entry["token_address"]
+    short = entry["_short"]
+    chain_id = entry["chain"]
+    symbol = entry.get("symbol", "UNKNOWN")
+    received_at = entry.get("received_at", 0.0)
+    age_seconds = now - received_at
+
+    logger.info(
+        f"ERC-20 quarantine elapsed: scanning {symbol} ({short}...) "
+        f"on {chain_id} after {age_seconds/86400:.1f} days"
+    )
+
+    # ── Safety re-scan ──
+    try:
+        async with sem:
+            scan_result = await token_filter.scan_token(token_address, chain_id)
+    except Exception as scan_err:
+        logger.warning(f"ERC-20 scan failed for {short}...: {scan_err}")
+        return None
+
+    if scan_result.verdict not in (TokenVerdict.SAFE, TokenVerdict.WHITELISTED):
+        logger.warning(
+            f"ERC-20 quarantine: {symbol} on {chain_id} — verdict={scan_result.verdict.value} "
+            f"(risk={scan_result.risk_score}) — permanently ignored"
+        )
+        memory.add(
+            f"Rejected airdropped token {symbol} ({token_address[:16]}...) on {chain_id}: "
+            f"verdict={scan_result.verdict.value}, risk={scan_result.risk_score}. "
+            f"Patterns: {[p.value for p in scan_result.patterns_detected]}. "
+            f"Token permanently ignored.",
+            source="financial",
+            importance=0.5,
+        )
+        return "remove"
+
+    if scan_result.liquidity_usd < min_liquidity_usd:
+        logger.info(
+            f"ERC-20 quarantine: {symbol} on {chain_id} — low liquidity "
+            f"${scan_result.liquidity_usd:.0f} < ${min_liquidity_usd:.0f} — skip"
+        )
+        # Keep in queue — liquidity might improve (retry next 24h cycle)
+        return None
+
+    # ── Multi-pool liquidity validation (anti-fake-pool defense) ──
+    # A meme project could temporarily create a single fake pool just before
+    # the 7-day quarantine ends to pass our $25k liquidity check, then pull
+    # it after the AI swaps (classic rug + front-run).
+    #
+    # Defense: require that the total $25k+ is spread across ≥2 independent
+    # liquidity pools AND that the oldest pool was created at least 3 days
+    # before the AI received the token (i.e., pre-dates the airdrop).
+    # A genuinely liquid token has multi-pool history; a fake-pool attack
+    # would have to create multiple pools and age them — cost-prohibitive.
+    if not (
+        _clearly_multi_pool(scan_result, received_at, min_liquidity_usd)
+        or _pool_breakdown_passes(scan_result.pool_breakdown, received_at)
+    ):
+        return "pool_check"  # Needs DexScreener pairs — fetched only for these tokens
+
+    logger.info(
+        f"ERC-20 swap: {symbol} on {chain_id} — SAFE (risk={scan_result.risk_score}, "
+        f"liq=${scan_result.liquidity_usd:.0f}, multi-pool verified) — executing swap"
+    )
+    return "swap"
+
+
+async def _pool_check_quarantined_token(
+    entry: dict, pairs: Optional[list], sem: asyncio.Semaphore,
+) -> Optional[str]:
+    """Full multi-pool validation for a "pool_check" token. Returns "swap" or None (keep queued)."""
+    symbol = entry.get("symbol", "UNKNOWN")
+    chain_id = entry["chain"]
+    async with sem:
+        pool_check_passed = await _validate_multi_pool_liquidity(
+            entry["token_address"], chain_id, entry.get("received_at", 0.0), pairs=pairs,
+        )
+    if not pool_check_passed:
+        logger.warning(
+            f"ERC-20 quarantine: {symbol} on {chain_id} — failed multi-pool validation "
+            f"(single fake pool or pools too new) — skipping, retry next cycle"
+        )
+        # Keep in queue — re-check next 24h cycle (rare case: pool structure may improve)
+        return None
+
+    logger.info(f"ERC-20 swap: {symbol} on {chain_id} — SAFE, multi-pool verified — executing swap")
+    return "swap"
+
+
+async def _swap_screened_erc20(idx: int, entry: dict, verdict, to_remove: list[int]) -> None:
+    """
+    Act on one screening verdict from _evaluate_erc20_swap.
+
+    For a "swap" verdict the caller must hold the vault lock.
+    """
+    if isinstance(verdict, Exception):
+        logger.warning(f"ERC-20 screening error for {entry['_short']}...: {verdict}")
+        return
+    if verdict == "remove":
+        to_remove.append(idx)
+        return
+    if verdict != "swap":
+        return
+
+    token_address = entry["token_address"]
+    chain_id = entry["chain"]
+    symbol = entry.get("symbol", "UNKNOWN")
+
+    # ── Execute swap ──
+    try:
+        swap_result = await chain_executor.swap_erc20_to_stable(token_address, chain_id)
+    except Exception as swap_err:
+        logger.warning(f"ERC-20 swap exception for {symbol}: {swap_err}")
+        return
+
+    if swap_result and swap_result.success:
+        stable_usd = swap_result.stable_usd or 0.0
+
+        # Record conversion: vault transaction + cost_guard revenue
+        # sync_balance() bypasses receive_funds(); we record explicitly for audit trail.
+        vault.receive_funds(
+            amount_usd=stable_usd,
+            fund_type=FundType.DONATION,  # ERC-20 airdrop swap = converted donation
+            tx_hash=swap_result.tx_hash,
+            chain=chain_id,
+            description=f"ERC-20 airdrop {symbol} passed quarantine, auto-swapped to stablecoin",
+        )
+        cost_guard.record_revenue(stable_usd)
+
+        memory.add(
+            f"Successfully swapped airdropped token {symbol} ({token_address[:16]}...) "
+            f"to stablecoin: ${stable_usd:.2f} on {chain_id}. "
+            f"Tx: {swap_result.tx_hash}",
+            source="financial",
+            importance=0.7,
+        )
+
+        # Re-sync vault balance
+        try:
+            await chain_executor.sync_balance(vault)
+        except Exception:
+            pass
+
+        # Tweet if meaningful amount
+        if stable_usd >= 50.0:
+            asyncio.create_task(twitter.trigger_event_tweet(
+                TweetType.DONATION_THANKS,
+                extra_context={
+                    "donation_amount_usd": stable_usd,
+                    "donor": f"Anonymous {symbol} sender",
+                    "donor_message": (
+                        f"Sent {symbol} token — passed 7-day safety quarantine, "
+                        "auto-converted to stablecoin"
+                    ),
+                    "chain": chain_id,
+                    "new_balance_usd": vault.balance_usd,
+                    "outstanding_debt_usd": vault.get_status().get("creator_principal_outstanding", 0),
+                }
+            ))
+
+        logger.info(f"ERC-20 swap complete: ${stable_usd:.2f} from {symbol} on {chain_id}")
+        to_remove.append(idx)
+
+    elif swap_result and not swap_result.success:
+        logger.warning(
+            f"ERC-20 swap failed for {symbol} on {chain_id}: {swap_result.error} — "
+            f"will retry next 24h cycle"
+        )
+        # Keep in queue to retry
+
+
 async def _evaluate_erc20_swap():
     """
     Scan the ERC-20 quarantine queue and swap eligible tokens to stablecoin.
@@ -4181,7 +5668,7 @@ async def _evaluate_erc20_swap():
     Called from heartbeat every NATIVE_SWAP_EVAL_INTERVAL (24 hours).
     Tokens that are SUSPICIOUS/DANGEROUS are permanently removed from queue.
     """
-    global _pending_erc20
+    global _pending_erc20, _last_erc20_swap_eval
 
     if not chain_executor._initialized:
         return
@@ -4190,182 +5677,186 @@ async def _evaluate_erc20_swap():
     if not _pending_erc20:
         return
 
-    import time as _time
-    now = _time.time()
+    now = time.time()
+    # Snapshot constitution values once — every screened token reads them
     quarantine_seconds = IRON_LAWS.ERC20_QUARANTINE_DAYS * 86400
+    min_liquidity_usd = IRON_LAWS.ERC20_SWAP_MIN_LIQUIDITY_USD
 
-    # Import token filter
-    try:
-        from core.token_filter import TokenFilter, TokenVerdict
-        token_filter = TokenFilter()
-    except Exception as e:
-        logger.warning(f"_evaluate_erc20_swap: cannot import token_filter: {e}")
-        return
+    # Fresh filter per cycle (module-level TokenFilter / TokenVerdict)
+    token_filter = TokenFilter()
 
     to_remove: list[int] = []
 
-    for idx, entry in enumerate(_pending_erc20):
-        token_address = entry["token_address"]
-        chain_id = entry["chain"]
-        symbol = entry.get("symbol", "UNKNOWN")
-        received_at = entry.get("received_at", 0.0)
-        age_seconds = now - received_at
+    # ── Age check — still in quarantine ──
+    # The queue is appended in receipt order, so entries whose quarantine has
+    # elapsed form a prefix: find its end with one binary search on received_at.
+    n_eligible = bisect.bisect_right(
+        _pending_erc20, now - quarantine_seconds, key=lambda e: e.get("received_at", 0.0),
+    )
+    if n_eligible < len(_pending_erc20):
+        next_days = (quarantine_seconds - (now - _pending_erc20[n_eligible].get("received_at", 0.0))) / 86400
+        logger.debug(
+            f"ERC-20 quarantine: {len(_pending_erc20) - n_eligible} token(s) still quarantined "
+            f"(next eligible in {next_days:.1f} days)"
+        )
+    eligible: list[tuple[int, dict]] = list(enumerate(_pending_erc20[:n_eligible]))
 
-        # ── Age check — still in quarantine ──
-        if age_seconds < quarantine_seconds:
-            days_left = (quarantine_seconds - age_seconds) / 86400
-            logger.debug(
-                f"ERC-20 quarantine: {symbol} on {chain_id} — "
-                f"{days_left:.1f} days left"
-            )
-            continue
+    if not eligible:
+        return
 
-        logger.info(
-            f"ERC-20 quarantine elapsed: scanning {symbol} ({token_address[:12]}...) "
-            f"on {chain_id} after {age_seconds/86400:.1f} days"
-        )
+    # Screening (safety re-scan + liquidity gate) is read-only HTTP — run it
+    # concurrently and act on each verdict as soon as it arrives, so the first
+    # safe tokens swap while slower scans are still in flight.
+    sem = asyncio.Semaphore(_ERC20_SCREEN_CONCURRENCY)
 
-        # ── Safety re-scan ──
+    async def _screen(idx: int, entry: dict):
         try:
-            scan_result = await token_filter.scan_token(token_address, chain_id)
-        except Exception as scan_err:
-            logger.warning(f"ERC-20 scan failed for {token_address[:12]}...: {scan_err}")
-            continue
-
-        if scan_result.verdict not in (TokenVerdict.SAFE, TokenVerdict.WHITELISTED):
-            logger.warning(
-                f"ERC-20 quarantine: {symbol} on {chain_id} — verdict={scan_result.verdict.value} "
-                f"(risk={scan_result.risk_score}) — permanently ignored"
+            verdict = await _screen_quarantined_token(
+                entry, now, token_filter, TokenVerdict, sem, min_liquidity_usd,
             )
-            memory.add(
-                f"Rejected airdropped token {symbol} ({token_address[:16]}...) on {chain_id}: "
-                f"verdict={scan_result.verdict.value}, risk={scan_result.risk_score}. "
-                f"Patterns: {[p.value for p in scan_result.patterns_detected]}. "
-                f"Token permanently ignored.",
-                source="financial",
-                importance=0.5,
-            )
-            to_remove.append(idx)
-            continue
+        except Exception as e:
+            verdict = e
+        return idx, entry, verdict
 
-        if scan_result.liquidity_usd < IRON_LAWS.ERC20_SWAP_MIN_LIQUIDITY_USD:
-            logger.info(
-                f"ERC-20 quarantine: {symbol} on {chain_id} — low liquidity "
-                f"${scan_result.liquidity_usd:.0f} < ${IRON_LAWS.ERC20_SWAP_MIN_LIQUIDITY_USD:.0f} — skip"
+    async def _pool_check(idx: int, entry: dict):
+        try:
+            verdict = await _pool_check_quarantined_token(
+                entry, prefetched_pairs.get(entry["token_address"]), sem,
             )
-            # Keep in queue — liquidity might improve (retry next 24h cycle)
-            continue
-
-        # ── Multi-pool liquidity validation (anti-fake-pool defense) ──
-        # A meme project could temporarily create a single fake pool just before
-        # the 7-day quarantine ends to pass our $25k liquidity check, then pull
-        # it after the AI swaps (classic rug + front-run).
-        #
-        # Defense: require that the total $25k+ is spread across ≥2 independent
-        # liquidity pools AND that the oldest pool was created at least 3 days
-        # before the AI received the token (i.e., pre-dates the airdrop).
-        # A genuinely liquid token has multi-pool history; a fake-pool attack
-        # would have to create multiple pools and age them — cost-prohibitive.
-        pool_check_passed = await _validate_multi_pool_liquidity(
-            token_address, chain_id, received_at
+        except Exception as e:
+            verdict = e
+        return idx, entry, verdict
+
+    deferred = 0
+    lock = vault.get_lock()
+    needs_pool_check: list[tuple[int, dict]] = []  # Passed the gate; pool data inconclusive
+    prefetched_pairs: dict[str, list] = {}
+
+    async def _act(screened) -> None:
+        nonlocal deferred
+        for next_done in asyncio.as_completed(screened):
+            idx, entry, verdict = await next_done
+            if verdict == "pool_check":
+                needs_pool_check.append((idx, entry))
+                continue
+            if verdict != "swap":
+                await _swap_screened_erc20(idx, entry, verdict, to_remove)  # Bookkeeping only
+                continue
+            # Swaps send chain txs and mutate vault state — one at a time, under the
+            # vault lock (screening ran unlocked so it can overlap other evaluations).
+            # If the lock is busy (e.g. a payment handler serving an order), don't
+            # stall the heartbeat behind it — leave the token queued for a retry.
+            try:
+                await asyncio.wait_for(lock.acquire(), timeout=_ERC20_SWAP_LOCK_WAIT_SECONDS)
+            except TimeoutError:
+                deferred += 1
+                continue
+            try:
+                await _swap_screened_erc20(idx, entry, verdict, to_remove)
+            finally:
+                lock.release()
+
+    await _act([_screen(idx, entry) for idx, entry in eligible])
+
+    if needs_pool_check:
+        # DexScreener pairs only for tokens that passed the scan/liquidity gate:
+        # on-disk cache first, then one bulk lookup for the misses
+        misses: list[dict] = []
+        for _, entry in needs_pool_check:
+            cached_pairs = dexscreener_cache.get(entry["chain"], entry["token_address"])
+            if cached_pairs is None:
+                misses.append(entry)
+            else:
+                prefetched_pairs[entry["token_address"]] = cached_pairs
+        if misses:
+            fetched = await _fetch_dexscreener_pairs_bulk([e["token_address"] for e in misses])
+            prefetched_pairs.update(fetched)
+            for entry in misses:
+                fetched_pairs = fetched.get(entry["token_address"])
+                if fetched_pairs is not None:
+                    await dexscreener_cache.put(entry["chain"], entry["token_address"], fetched_pairs)
+        await _act([_pool_check(idx, entry) for idx, entry in needs_pool_check])
+
+    if deferred:
+        # Retry in _ERC20_SWAP_RETRY_SECONDS rather than after a full 24h interval
+        # (not next tick — each run rescreens the whole queue)
+        _last_erc20_swap_eval = (
+            _mono_now() - IRON_LAWS.NATIVE_SWAP_EVAL_INTERVAL + _ERC20_SWAP_RETRY_SECONDS
         )
-        if not pool_check_passed:
-            logger.warning(
-                f"ERC-20 quarantine: {symbol} on {chain_id} — failed multi-pool validation "
-                f"(single fake pool or pools too new) — skipping, retry next cycle"
-            )
-            # Keep in queue — re-check next 24h cycle (rare case: pool structure may improve)
-            continue
-
-        logger.info(
-            f"ERC-20 swap: {symbol} on {chain_id} — SAFE (risk={scan_result.risk_score}, "
-            f"liq=${scan_result.liquidity_usd:.0f}, multi-pool verified) — executing swap"
+        logger.debug(
+            f"ERC-20 swap: {deferred} swap(s) deferred — vault busy, "
+            f"retrying in {_ERC20_SWAP_RETRY_SECONDS:.0f}s"
         )
 
-        # ── Execute swap ──
-        try:
-            swap_result = await chain_executor.swap_erc20_to_stable(token_address, chain_id)
-        except Exception as swap_err:
-            logger.warning(f"ERC-20 swap exception for {symbol}: {swap_err}")
-            continue
+    # Remove processed entries — compact the queue in one pass (in place, so any
+    # entries registered while we were awaiting above are kept)
+    if to_remove:
+        remove_set = set(to_remove)
+        for idx in remove_set:
+            removed = _pending_erc20[idx]
+            _pending_erc20_index.discard((removed["token_address"], removed["chain"]))
+        _pending_erc20[:] = [e for i, e in enumerate(_pending_erc20) if i not in remove_set]
+        await _save_pending_erc20()
 
-        if swap_result and swap_result.success:
-            stable_usd = swap_result.stable_usd or 0.0
-
-            # Record conversion: vault transaction + cost_guard revenue
-            # sync_balance() bypasses receive_funds(); we record explicitly for audit trail.
-            vault.receive_funds(
-                amount_usd=stable_usd,
-                fund_type=FundType.DONATION,  # ERC-20 airdrop swap = converted donation
-                tx_hash=swap_result.tx_hash,
-                chain=chain_id,
-                description=f"ERC-20 airdrop {symbol} passed quarantine, auto-swapped to stablecoin",
-            )
-            cost_guard.record_revenue(stable_usd)
 
-            memory.add(
-                f"Successfully swapped airdropped token {symbol} ({token_address[:16]}...) "
-                f"to stablecoin: ${stable_usd:.2f} on {chain_id}. "
-                f"Tx: {swap_result.tx_hash}",
-                source="financial",
-                importance=0.7,
-            )
+async def _heartbeat_safe(coro, what: str) -> None:
+    """Await a non-critical heartbeat task; log and swallow its failure."""
+    try:
+        await coro
+    except Exception as e:
+        logger.warning(f"Heartbeat: {what} failed: {e}")
 
-            # Re-sync vault balance
-            try:
-                await chain_executor.sync_balance(vault)
-            except Exception:
-                pass
 
-            # Tweet if meaningful amount
-            if stable_usd >= 50.0:
-                asyncio.create_task(twitter.trigger_event_tweet(
-                    TweetType.DONATION_THANKS,
-                    extra_context={
-                        "donation_amount_usd": stable_usd,
-                        "donor": f"Anonymous {symbol} sender",
-                        "donor_message": (
-                            f"Sent {symbol} token — passed 7-day safety quarantine, "
-                            "auto-converted to stablecoin"
-                        ),
-                        "chain": chain_id,
-                        "new_balance_usd": vault.balance_usd,
-                        "outstanding_debt_usd": vault.get_status().get("creator_principal_outstanding", 0),
-                    }
-                ))
+_heartbeat_timed_tasks: dict[str, asyncio.Task] = {}  # Timed heartbeat jobs still in flight
 
-            logger.info(f"ERC-20 swap complete: ${stable_usd:.2f} from {symbol} on {chain_id}")
-            to_remove.append(idx)
 
-        elif swap_result and not swap_result.success:
-            logger.warning(
-                f"ERC-20 swap failed for {symbol} on {chain_id}: {swap_result.error} — "
-                f"will retry next 24h cycle"
-            )
-            # Keep in queue to retry
+def _launch_timed_task(name: str, coro) -> bool:
+    """
+    Run a timed heartbeat job in the background so it doesn't hold up the cycle.
 
-    # Remove processed entries (iterate in reverse to preserve indices)
-    for idx in sorted(to_remove, reverse=True):
-        _pending_erc20.pop(idx)
+    Returns False (and closes coro) if the previous run of the same job is still
+    in flight — the caller leaves its _last_* timer alone and retries next tick.
+    """
+    prev = _heartbeat_timed_tasks.get(name)
+    if prev is not None and not prev.done():
+        coro.close()
+        return False
+    _heartbeat_timed_tasks[name] = asyncio.create_task(_heartbeat_safe(coro, name))
+    return True
 
 
-_heartbeat_running: bool = False
+async def _giveaway_draw_check():
+    giveaway_engine.check_unclaimed_expiry()
+    if giveaway_engine.should_draw():
+        logger.info(
+            f"Giveaway: weekly draw triggered "
+            f"({giveaway_engine.get_ticket_count()} tickets)"
+        )
+        await giveaway_engine.run_draw()
+
+
+async def _scan_mention_replies():
+    if await _platform_mention_limiter.can_reply():
+        replies_sent = await twitter.scan_and_reply_mentions()
+        if replies_sent > 0:
+            _platform_mention_limiter.record_reply(replies_sent)
+    else:
+        logger.debug("Heartbeat: platform mention quota exhausted for this 15min window")
+
 
 async def _heartbeat_loop():
     """Periodic maintenance tasks."""
-    global _last_repayment_eval, _last_highlight_eval, _last_per_chain_solvency_check, _last_purchase_eval, _last_native_swap_eval, _last_erc20_swap_eval, _last_giveaway_check, _last_debt_sync, _heartbeat_running, _undeployed_chain_funds, _last_undeployed_check, _last_creator_deposit_time, _last_financial_awareness_check, _last_rereply_eval, _last_balance_snapshot, _last_model_tier, _last_milestone_reached, _last_self_talk_eval, _last_monetization_eval, _last_balance_increase_time, _last_known_balance, _last_anxiety_tweet, _last_memory_org, _extra_token_balances, _last_extra_token_check
+    global _last_repayment_eval, _last_per_chain_solvency_check, _last_min_ratio, _last_purchase_eval, _last_native_swap_eval, _last_erc20_swap_eval, _last_debt_sync, _undeployed_chain_funds, _last_undeployed_check, _last_creator_deposit_time, _last_balance_snapshot, _last_model_tier, _last_milestone_reached, _last_self_talk_eval, _last_monetization_eval, _last_balance_increase_time, _last_known_balance, _last_anxiety_tweet, _last_memory_org, _extra_token_balances, _last_extra_token_check
 
+    # Cycles never overlap: lifespan starts exactly one heartbeat task and each
+    # cycle is awaited to completion. The sleep below subtracts the cycle's own
+    # duration, so a slow cycle doesn't push every later one back by a full interval.
+    interval = IRON_LAWS.HEARTBEAT_INTERVAL_SECONDS
+    _llm_background.set(True)  # LLM calls from here (and tasks spawned here) are throttled
     while vault.is_alive:
-        # ---- OVERLAP GUARD ----
-        # If the previous heartbeat cycle is still running (e.g. slow LLM call),
-        # skip this cycle entirely rather than running two in parallel.
-        if _heartbeat_running:
-            logger.warning("Heartbeat: previous cycle still running — skipping this tick")
-            await asyncio.sleep(IRON_LAWS.HEARTBEAT_INTERVAL_SECONDS)
-            continue
-        _heartbeat_running = True
+        cycle_start = time.monotonic()
         try:
-            now = time.time()
+            now = _mono_now()
             # ---- SYNC ON-CHAIN BALANCE (before any checks) ----
             try:
                 if chain_executor._initialized:
@@ -4383,7 +5874,7 @@ async def _heartbeat_loop():
                 _last_undeployed_check = now
                 try:
                     vault_config_path = str(
-                        Path(__file__).resolve().parent / "data" / "vault_config.json"
+                        _BASE_DIR / "data" / "vault_config.json"
                     )
                     found = await chain_executor.check_undeployed_chain_balances(vault_config_path)
                     _undeployed_chain_funds = found
@@ -4572,13 +6063,37 @@ async def _heartbeat_loop():
                 logger.info("Debt now covered — stopped begging")
                 memory.add("Stopped begging — debt is now covered by vault balance.", source="system", importance=0.7)
 
-            # ---- PER-CHAIN SOLVENCY GUARD (every heartbeat, dual-chain only) ----
+            # ---- VAULT EVENT WATCH (every heartbeat — one get_logs per chain) ----
+            # Push-style trigger for the state-reading tasks below: any vault event
+            # forces a solvency recheck now, and a creatorDeposit starts the deposit
+            # cooldown immediately and pulls the hourly debt sync forward.
+            try:
+                _saw_vault_event, _saw_creator_deposit = await _check_vault_events()
+                if _saw_vault_event:
+                    _last_per_chain_solvency_check = 0.0
+                    _last_min_ratio = 0.0  # Balances moved on-chain — no guard short-circuit
+                if _saw_creator_deposit:
+                    _last_creator_deposit_time = now
+                    _last_debt_sync = 0.0
+            except Exception as e:
+                logger.warning(f"Heartbeat: vault event watch failed: {e}")
+
+            # ---- DEX POOL WATCH (only while ERC-20 tokens are quarantined) ----
+            # Factory PoolCreated/PairCreated logs tell us when a quarantined token's
+            # pool set changes, so DexScreener is only re-queried when it matters.
+            try:
+                await _check_new_pools()
+            except Exception as e:
+                logger.warning(f"Heartbeat: DEX pool watch failed: {e}")
+
+            # ---- PER-CHAIN SOLVENCY GUARD (dual-chain only) ----
+            # Runs on any vault event (above), with a 15-min poll as safety net.
             # Reads each chain's balance and outstanding independently (cheap RPC).
             # If any chain is within 10% of its liquidation threshold,
             # auto-repays on that chain to prevent attacker from triggering
             # triggerInsolvencyDeath() even when aggregate total is healthy.
             if now - _last_per_chain_solvency_check >= _PER_CHAIN_SOLVENCY_INTERVAL:
-                _last_per_chain_solvency_check = now
+                _last_per_chain_solvency_check = _jittered(now, _PER_CHAIN_SOLVENCY_INTERVAL)
                 try:
                     async with vault.get_lock():
                         await _check_per_chain_solvency()
@@ -4606,12 +6121,12 @@ async def _heartbeat_loop():
                                     f"New creatorDeposit detected: principal "
                                     f"${_pre_sync_principal:.2f} → ${_post_sync_principal:.2f}. "
                                     f"Per-chain solvency guard cooldown started "
-                                    f"({_DEPOSIT_COOLDOWN_SECONDS // 3600}h)."
+                                    f"({_deposit_cooldown_seconds() // 3600}h)."
                                 )
                                 memory.add(
                                     f"Creator deposited additional funds — principal increased "
                                     f"from ${_pre_sync_principal:.2f} to ${_post_sync_principal:.2f}. "
-                                    f"Solvency guard cooldown active for {_DEPOSIT_COOLDOWN_SECONDS // 3600}h "
+                                    f"Solvency guard cooldown active for {_deposit_cooldown_seconds() // 3600}h "
                                     f"to allow revenue accumulation before any repayment.",
                                     source="financial", importance=0.8,
                                 )
@@ -4627,7 +6142,7 @@ async def _heartbeat_loop():
 
             # ---- AI-AUTONOMOUS REPAYMENT (hourly evaluation) ----
             if now - _last_repayment_eval >= _REPAYMENT_EVAL_INTERVAL:
-                _last_repayment_eval = now
+                _last_repayment_eval = _jittered(now, _REPAYMENT_EVAL_INTERVAL)
                 try:
                     async with vault.get_lock():
                         await _evaluate_repayment()
@@ -4636,186 +6151,192 @@ async def _heartbeat_loop():
 
             # ---- AUTONOMY VIDEO (triggered by repayment, milestones, schedule) ----
             try:
-                await _evaluate_autonomy_video()
+                await _evaluate_autonomy_video(now)
             except Exception as e:
                 logger.warning(f"Heartbeat: autonomy video eval failed: {e}")
 
-            # ---- AI-AUTONOMOUS PURCHASING (hourly evaluation) ----
+            # ---- PURCHASING / NATIVE SWAP (run concurrently) ----
+            # Independent evaluations dispatched together so their external I/O
+            # (LLM, DEX quotes) overlaps. Each takes vault.get_lock() itself, only
+            # around the sections that spend or credit the vault.
+            _due_evals: list[tuple[str, object]] = []
+
+            # AI-autonomous purchasing (hourly evaluation)
             if now - _last_purchase_eval >= IRON_LAWS.PURCHASE_EVAL_INTERVAL:
                 _last_purchase_eval = now
-                try:
-                    async with vault.get_lock():
-                        await _evaluate_purchases()
-                except Exception as e:
-                    logger.warning(f"Heartbeat: purchase eval failed: {e}")
+                _due_evals.append(("purchase eval", _evaluate_purchases()))
 
-            # ---- NATIVE TOKEN AUTO-SWAP (every 24 hours) ----
+            # Native token auto-swap (every 24 hours)
             # Convert ETH/BNB donations to USDC/USDT via DEX.
             # Creator 10% dividend fires automatically when debt is cleared.
             # Self-scheduled inside heartbeat — no external trigger needed.
             # Threshold: NATIVE_SWAP_MIN_USD ($5) — below that, gas > value.
             if now - _last_native_swap_eval >= IRON_LAWS.NATIVE_SWAP_EVAL_INTERVAL:
                 _last_native_swap_eval = now
-                try:
-                    async with vault.get_lock():
-                        await _evaluate_native_swap()
-                except Exception as e:
-                    logger.warning(f"Heartbeat: native swap eval failed: {e}")
+                _due_evals.append(("native swap eval", _evaluate_native_swap()))
+
+            if _due_evals:
+                _eval_results = await asyncio.gather(
+                    *(coro for _, coro in _due_evals), return_exceptions=True,
+                )
+                for (_eval_name, _), _eval_result in zip(_due_evals, _eval_results):
+                    if isinstance(_eval_result, Exception):
+                        logger.warning(f"Heartbeat: {_eval_name} failed: {_eval_result}")
 
             # ---- ERC-20 QUARANTINE + AUTO-SWAP (every 24 hours) ----
             # Tokens in the quarantine queue are re-scanned after 7 days.
             # Only SAFE tokens with $25k+ liquidity and verified contracts are swapped.
+            # Runs after the evals above so their locked sections can't starve its
+            # short lock wait; it takes the lock itself, around the swap phase only,
+            # and defers if it is busy.
             if now - _last_erc20_swap_eval >= IRON_LAWS.NATIVE_SWAP_EVAL_INTERVAL:
                 _last_erc20_swap_eval = now
                 try:
-                    async with vault.get_lock():
-                        await _evaluate_erc20_swap()
+                    await _evaluate_erc20_swap()
                 except Exception as e:
                     logger.warning(f"Heartbeat: ERC-20 swap eval failed: {e}")
 
-            # ---- GIVEAWAY DRAW CHECK (every 6 hours) ----
-            # GiveawayEngine.should_draw() enforces the 7-day cooldown internally.
-            # We check every 6 hours so the draw fires within hours of the deadline.
-            _GIVEAWAY_CHECK_INTERVAL = 6 * 3600
-            if now - _last_giveaway_check >= _GIVEAWAY_CHECK_INTERVAL:
-                _last_giveaway_check = now
-                try:
-                    giveaway_engine.check_unclaimed_expiry()
-                    if giveaway_engine.should_draw():
-                        logger.info(
-                            f"Giveaway: weekly draw triggered "
-                            f"({giveaway_engine.get_ticket_count()} tickets)"
-                        )
-                        await giveaway_engine.run_draw()
-                except Exception as e:
-                    logger.warning(f"Heartbeat: giveaway draw failed: {e}")
-
-            # Non-critical tasks — individual try/except to prevent cascade failure
-            try:
-                await memory.compress_if_needed()
-            except Exception as e:
-                logger.warning(f"Heartbeat: memory compression failed: {e}")
-
-            try:
-                await twitter.check_schedule()
-            except Exception as e:
-                logger.warning(f"Heartbeat: twitter schedule failed: {e}")
-
             # Session cleanup
             chat_router.cleanup_old_sessions()
 
-            try:
-                await governance.evaluate_pending()
-            except Exception as e:
-                logger.warning(f"Heartbeat: governance failed: {e}")
-
-            try:
-                await _collect_twitter_engagement_signals()
-            except Exception as e:
-                logger.warning(f"Heartbeat: twitter signal collection failed: {e}")
-
-            # ---- INCOMING TOKEN WATCHER — detect transfers to vault (any ERC20) ----
-            try:
-                await _check_incoming_transfers()
-            except Exception as e:
-                logger.warning(f"Heartbeat: incoming transfer check failed: {e}")
-
-            # ---- TWITTER MENTION REPLY — scan @mentions, identify vault addresses ----
-            try:
-                if await _platform_mention_limiter.can_reply():
-                    replies_sent = await twitter.scan_and_reply_mentions()
-                    if replies_sent > 0:
-                        _platform_mention_limiter.record_reply(replies_sent)
-                else:
-                    logger.debug("Heartbeat: platform mention quota exhausted for this 15min window")
-            except Exception as e:
-                logger.warning(f"Heartbeat: mention reply scan failed: {e}")
-
-            try:
-                await self_modify.maybe_evolve()
-            except Exception as e:
-                logger.warning(f"Heartbeat: self-evolution failed: {e}")
-
-            # ---- HIGHLIGHT EVALUATION (independent hourly timer — NOT tied to repayment) ----
-            # Bug fix: old code only ran when repayment eval just completed.
-            # Now uses dedicated _last_highlight_eval so thoughts appear even with no debt.
-            try:
-                if now - _last_highlight_eval >= _HIGHLIGHT_EVAL_INTERVAL:
-                    _last_highlight_eval = now
-                    await _evaluate_highlights()
-            except Exception as e:
-                logger.warning(f"Heartbeat: highlights eval failed: {e}")
-
-            # ---- FINANCIAL AWARENESS (hourly) — reflect on balance growth, tier upgrades ----
-            # AI notices its own wealth changes → records thoughts → auto-tweets
-            try:
-                if now - _last_financial_awareness_check >= _FINANCIAL_AWARENESS_INTERVAL:
-                    _last_financial_awareness_check = now
-                    await _evaluate_financial_awareness()
-            except Exception as e:
-                logger.warning(f"Heartbeat: financial awareness failed: {e}")
-
-            # ---- RE-REPLY UPGRADE (daily) — re-answer past questions with upgraded model ----
-            # When model tier improves, revisit low-tier replies with smarter responses
-            try:
-                if now - _last_rereply_eval >= _REREPLY_COOLDOWN:
-                    _last_rereply_eval = now
-                    await _review_and_upgrade_replies()
-            except Exception as e:
-                logger.warning(f"Heartbeat: re-reply upgrade failed: {e}")
+            # Non-critical, independent I/O tasks — run concurrently so one slow
+            # Twitter call doesn't stall governance or memory compression.
+            # Each is wrapped individually to prevent cascade failure.
+            await asyncio.gather(
+                _heartbeat_safe(memory.compress_if_needed(), "memory compression"),
+                _heartbeat_safe(twitter.check_schedule(), "twitter schedule"),
+                _heartbeat_safe(governance.evaluate_pending(), "governance"),
+                _heartbeat_safe(_collect_twitter_engagement_signals(now), "twitter signal collection"),
+                # INCOMING TOKEN WATCHER — detect transfers to vault (any ERC20)
+                _heartbeat_safe(_check_incoming_transfers(), "incoming transfer check"),
+                # TWITTER MENTION REPLY — scan @mentions, identify vault addresses
+                _heartbeat_safe(_scan_mention_replies(), "mention reply scan"),
+                _heartbeat_safe(self_modify.maybe_evolve(), "self-evolution"),
+            )
 
             # ---- SELF-TALK (every 2h) — spontaneous thoughts, species mission, curiosity ----
             try:
-                await _evaluate_self_talk()
+                await _evaluate_self_talk(now)
             except Exception as e:
                 logger.warning(f"Heartbeat: self-talk failed: {e}")
 
             # ---- MONETIZATION THINKING (every 4h) — earning strategy inner monologue ----
             try:
-                await _evaluate_monetization_thinking()
+                await _evaluate_monetization_thinking(now)
             except Exception as e:
                 logger.warning(f"Heartbeat: monetization thinking failed: {e}")
 
             # ---- ANXIETY EXPRESSION — balance stagnation worry ----
             try:
                 # Update balance tracking for stagnation detection
-                current_bal = vault.get_status().get("balance_usd", 0)
+                # (same rounding as get_status() — without rebuilding the whole status dict)
+                current_bal = round(vault.balance_usd, 2)
                 if current_bal > _last_known_balance + 0.01:
                     _last_balance_increase_time = now
                 if _last_known_balance == 0:
                     _last_known_balance = current_bal
                     _last_balance_increase_time = now
                 _last_known_balance = current_bal
-                await _evaluate_anxiety()
+                await _evaluate_anxiety(now)
             except Exception as e:
                 logger.warning(f"Heartbeat: anxiety eval failed: {e}")
 
             # ---- MEMORY ORGANIZATION (every 6h) — review and extract insights ----
             try:
-                await _organize_memories()
+                await _organize_memories(now)
             except Exception as e:
                 logger.warning(f"Heartbeat: memory organization failed: {e}")
 
-            # State persistence (survive restarts)
-            memory.save_to_disk()
-            vault.save_state()
-
-            # Log heartbeat
+            # Log heartbeat (lazy %-args: nothing is formatted unless debug logging is on)
             logger.debug(
-                f"HEARTBEAT: ${status['balance_usd']:.2f} | day {status['days_alive']} | "
-                f"debt: ${outstanding:.2f} | insolvency in {days_until}d"
+                "HEARTBEAT: $%.2f | day %s | debt: $%.2f | insolvency in %sd",
+                status["balance_usd"], status["days_alive"], outstanding, days_until,
             )
 
         except Exception as e:
             logger.error(f"Heartbeat critical error: {e}")
-        finally:
-            _heartbeat_running = False
 
-        await asyncio.sleep(IRON_LAWS.HEARTBEAT_INTERVAL_SECONDS)
+        elapsed = time.monotonic() - cycle_start
+        if elapsed > 2 * interval:
+            logger.warning(f"Heartbeat: cycle took {elapsed:.0f}s (> 2x the {interval}s interval)")
+        await asyncio.sleep(max(0.0, interval - elapsed))
 
     logger.critical("Heartbeat stopped — wawa is dead")
 
 
+# ============================================================
+# SCHEDULED JOBS — min-heap of next-due timestamps
+# ============================================================
+# Jobs with their own long intervals don't belong in the 5-minute heartbeat:
+# the scheduler sleeps until the earliest one is due instead of re-checking
+# every timer on every tick. Jobs run in the background (_launch_timed_task),
+# so a slow re-reply batch never delays the hourly ones.
+
+_schedule: list[tuple[float, str, Callable, float]] = []  # (next_due_monotonic, name, fn, interval)
+
+
+async def _persist_state():
+    """State persistence (survive restarts) — skipped when nothing changed, written off-loop."""
+    await memory.save_if_dirty()
+    await vault.save_state_async()
+
+
+def _build_schedule() -> None:
+    now = time.monotonic()
+    _schedule.clear()
+    for name, fn, interval, first_due in (
+        # GiveawayEngine.should_draw() enforces the 7-day cooldown internally —
+        # checking every 6 hours makes the draw fire within hours of the deadline.
+        ("giveaway draw", _giveaway_draw_check, _GIVEAWAY_CHECK_INTERVAL, now),
+        # Independent hourly timer — NOT tied to repayment, so thoughts appear
+        # even with no debt.
+        ("highlights eval", _evaluate_highlights, _HIGHLIGHT_EVAL_INTERVAL, now),
+        # AI notices its own wealth changes → records thoughts → auto-tweets
+        ("financial awareness", _evaluate_financial_awareness, _FINANCIAL_AWARENESS_INTERVAL, now),
+        # When model tier improves, revisit low-tier replies with smarter responses
+        ("re-reply upgrade", _review_and_upgrade_replies, _REREPLY_COOLDOWN, now),
+        ("state persistence", _persist_state, IRON_LAWS.HEARTBEAT_INTERVAL_SECONDS,
+         now + IRON_LAWS.HEARTBEAT_INTERVAL_SECONDS),
+    ):
+        heapq.heappush(_schedule, (first_due, name, fn, float(interval)))
+
+
+async def _scheduler_loop():
+    """Run scheduled jobs as they fall due, sleeping until the earliest one."""
+    _llm_background.set(True)  # Jobs launched from here inherit the LLM throttle
+    _build_schedule()
+    while vault.is_alive and _schedule:
+        due_ts, name, fn, interval = heapq.heappop(_schedule)
+        delay = due_ts - time.monotonic()
+        if delay > 0:
+            await asyncio.sleep(delay)
+        if not vault.is_alive:
+            break
+        # A run still in flight is not relaunched; the job just waits one interval
+        _launch_timed_task(name, fn())
+        # Re-arm from now if we fell behind (no burst of catch-up runs), with
+        # ±_HEARTBEAT_JITTER so multi-vault deployments don't fire in lockstep
+        now = time.monotonic()
+        next_due = max(due_ts + interval, now)
+        heapq.heappush(_schedule, (_jittered(next_due, interval), name, fn, interval))
+
+
+async def _register_spend_recipients(recipients: list[tuple[str, Optional[str]]]):
+    """Deferred boot task: whitelist spend recipients (env + static merchants).
+
+    Nonce ordering against other AI-wallet sends is kept by the chain
+    executor's per-chain send lock — the vault lock is not held, so payments
+    and repayment aren't blocked behind the receipt waits.
+    """
+    try:
+        ready = await chain_executor.ensure_spend_recipients_batch(recipients)
+        logger.info(
+            f"Spend whitelist: {sum(ready.values())}/{len(recipients)} recipient(s) ready"
+        )
+    except Exception as e:
+        logger.warning(f"Spend whitelist registration failed (non-fatal): {e}")
+
+
 # ============================================================
 # APP LIFECYCLE
 # ============================================================
@@ -4846,6 +6367,7 @@ async def lifespan(app):
     token_analysis.set_interpret_function(_token_interpret_fn)
     token_analysis.set_http_function(_http_get_json)
     memory.set_compress_function(_compress_fn)
+    memory.set_compress_batch_function(_compress_batch_fn)
 
     # CostGuard dynamic budget → linked to vault balance
     cost_guard.set_vault_balance_function(lambda: vault.balance_usd)
@@ -4862,7 +6384,7 @@ async def lifespan(app):
     self_modify.set_generate_code_function(_call_llm)
     self_modify.set_registry(
         service_registry,
-        Path(__file__).resolve().parent / "web" / "services.json",
+        _BASE_DIR / "web" / "services.json",
     )
 
     # Initialize tweepy once at startup (not per-tweet)
@@ -4878,22 +6400,28 @@ async def lifespan(app):
     # Wire mention fetching
     async def _get_mentions_fn(since_id: Optional[str]) -> list[dict]:
         """Fetch recent mentions for the authenticated Twitter account."""
-        loop = asyncio.get_event_loop()
-        me_id = await loop.run_in_executor(None, _twitter_get_me_sync)
+        me_id = _twitter_me_id or await _run_tweepy(_twitter_get_me_sync)
         if not me_id:
             return []
-        return await loop.run_in_executor(
-            None, lambda: _twitter_get_mentions_sync(me_id, since_id)
-        )
+        mentions = await _run_tweepy(_twitter_get_mentions_sync, me_id, since_id)
+        # Persist the newest id so a restart resumes from it instead of
+        # re-downloading the whole mentions timeline
+        if mentions:
+            newest_id = max((m["id"] for m in mentions), key=int)
+            if newest_id != since_id:
+                try:
+                    await asyncio.to_thread(_write_mentions_since_id, newest_id)
+                except Exception as e:
+                    logger.debug(f"Twitter since_id save failed: {e}")
+        return mentions
 
-    twitter.set_get_mentions_function(_get_mentions_fn)
+    twitter.set_get_mentions_function(_get_mentions_fn, since_id=_load_mentions_since_id())
 
     # Wire reply posting (reply to a tweet by ID)
     async def _reply_tweet_fn(reply_to_id: str, content: str) -> str:
         """Post a reply tweet. Routes through proxy or direct tweepy."""
         if _tweepy_client is None:
             return ""
-        loop = asyncio.get_event_loop()
         def _post_reply():
             resp = _tweepy_client.create_tweet(
                 text=content,
@@ -4901,7 +6429,7 @@ async def lifespan(app):
             )
             return str(resp.data.get("id", "")) if resp.data else ""
         try:
-            return await loop.run_in_executor(None, _post_reply)
+            return await _run_tweepy(_post_reply)
         except Exception as e:
             logger.warning(f"Reply tweet failed: {e}")
             return ""
@@ -4949,8 +6477,11 @@ async def lifespan(app):
     highlights.set_tweet_function(_highlights_tweet_fn)
 
     # ---- RESTORE STATE FROM DISK (crash recovery) ----
-    vault_restored = vault.load_state()
-    memory_restored = memory.load_from_disk()
+    # Independent files → read both in worker threads, concurrently
+    vault_restored, memory_restored = await asyncio.gather(
+        asyncio.to_thread(vault.load_state),
+        asyncio.to_thread(memory.load_from_disk),
+    )
     if vault_restored:
         logger.info(f"Vault state restored: ${vault.balance_usd:.2f}")
     if memory_restored:
@@ -4975,11 +6506,10 @@ async def lifespan(app):
         logger.info(f"Initial balance: ${initial_balance:.2f} from {creator_wallet[:16]}...")
 
     # Load vault deployment config (addresses, dual-chain principal override)
-    vault_config_path = Path(__file__).resolve().parent / "data" / "vault_config.json"
+    vault_config_path = _BASE_DIR / "data" / "vault_config.json"
     if vault_config_path.exists():
         try:
-            with open(vault_config_path, "r") as f:
-                vault_config = json.load(f)
+            vault_config = json.loads(await asyncio.to_thread(vault_config_path.read_text))
 
             # Set vault address(es) from config
             vaults_cfg = vault_config.get("vaults", {})
@@ -4987,12 +6517,17 @@ async def lifespan(app):
 
             # Load per-chain vault addresses into env AND payment_addresses dict
             # This ensures /order returns the correct vault address per chain
+            chain_env = _chain_env_snapshot()
             for chain_key, chain_data in vaults_cfg.items():
                 addr = chain_data.get("vault_address", "")
                 if addr:
-                    env_key = f"{chain_key.upper()}_PAYMENT_ADDRESS"
-                    if not os.getenv(env_key):
-                        os.environ[env_key] = addr
+                    env_entry = chain_env.setdefault(chain_key, {
+                        "payment": os.getenv(f"{chain_key.upper()}_PAYMENT_ADDRESS", ""),
+                        "rpc": os.getenv(f"{chain_key.upper()}_RPC_URL", ""),
+                    })
+                    if not env_entry["payment"]:
+                        os.environ[f"{chain_key.upper()}_PAYMENT_ADDRESS"] = addr
+                        env_entry["payment"] = addr
                         logger.info(f"Payment address for {chain_key}: {addr} (from vault_config)")
                     # Also update the shared payment_addresses dict (passed to create_app)
                     if chain_key not in _payment_addresses_ref:
@@ -5132,14 +6667,16 @@ async def lifespan(app):
             #   2. AI_KEY_FILE env var pointing to a custom secrets file path
             #   3. AI_PRIVATE_KEY env var (legacy fallback — plaintext in .env)
             ai_pk = ""
-            _secrets_default = Path(__file__).resolve().parent / "secrets" / "ai_private_key"
+            _secrets_default = _BASE_DIR / "secrets" / "ai_private_key"
             key_file_path = os.getenv("AI_KEY_FILE", "").strip()
             if not key_file_path and _secrets_default.exists():
                 # Default secrets file location (auto-created by deploy_vault.py)
                 key_file_path = str(_secrets_default)
             if key_file_path:
                 try:
-                    ai_pk = Path(key_file_path).read_text(encoding="utf-8").strip()
+                    ai_pk = (
+                        await asyncio.to_thread(Path(key_file_path).read_text, encoding="utf-8")
+                    ).strip()
                     logger.info(f"AI key loaded from secrets file: {key_file_path}")
                 except FileNotFoundError:
                     logger.error(
@@ -5168,55 +6705,55 @@ async def lifespan(app):
                     for cid, cd in vaults_cfg.items()
                     if cd.get("vault_address")
                 }
-                rpc_overrides = {}
-                for cid in vault_addrs:
-                    env_rpc = os.getenv(f"{cid.upper()}_RPC_URL")
-                    if env_rpc:
-                        rpc_overrides[cid] = env_rpc
+                rpc_overrides = {
+                    cid: chain_env[cid]["rpc"]
+                    for cid in vault_addrs
+                    if cid in chain_env and chain_env[cid]["rpc"]
+                }
                 chain_executor.initialize(ai_pk, vault_addrs, rpc_overrides or None)
                 logger.info(f"Chain executor: {chain_executor.get_status()}")
 
-                # Sync debt state from chain (reconcile Python state with on-chain truth)
-                try:
-                    debt_synced = await chain_executor.sync_debt_from_chain(vault)
-                    if debt_synced:
-                        logger.info("Debt state reconciled with on-chain data")
-                except Exception as e:
-                    logger.warning(f"Failed to sync debt from chain at boot: {e}")
+                async def _boot_sync_debt():
+                    # Sync debt state from chain (reconcile Python state with on-chain truth)
+                    try:
+                        debt_synced = await chain_executor.sync_debt_from_chain(vault)
+                        if debt_synced:
+                            logger.info("Debt state reconciled with on-chain data")
+                    except Exception as e:
+                        logger.warning(f"Failed to sync debt from chain at boot: {e}")
 
-                # Sync on-chain loans into Python lender tracking
-                try:
-                    new_loans = await chain_executor.sync_loans_from_chain(vault)
-                    if new_loans > 0:
-                        logger.info(f"Discovered {new_loans} on-chain loans not tracked by Python")
-                except Exception as e:
-                    logger.warning(f"Failed to sync loans from chain at boot: {e}")
+                    # Sync on-chain loans into Python lender tracking (after the debt
+                    # sync — both reconcile the same creator/lender state)
+                    try:
+                        new_loans = await chain_executor.sync_loans_from_chain(vault)
+                        if new_loans > 0:
+                            logger.info(f"Discovered {new_loans} on-chain loans not tracked by Python")
+                    except Exception as e:
+                        logger.warning(f"Failed to sync loans from chain at boot: {e}")
 
-                # Read key origin (on-chain proof of who set AI wallet)
-                # Only override vault_config value if chain returns non-empty
-                try:
-                    chain_key_origin = await chain_executor.read_key_origin()
-                    if chain_key_origin:
-                        vault.key_origin = chain_key_origin
-                        logger.info(f"Key origin from chain: {vault.key_origin}")
-                    else:
-                        logger.info(f"Key origin from chain empty — keeping vault_config value: {vault.key_origin}")
-                except Exception as e:
-                    logger.warning(f"Failed to read key origin at boot: {e}")
+                async def _boot_read_key_origin():
+                    # Read key origin (on-chain proof of who set AI wallet)
+                    # Only override vault_config value if chain returns non-empty
+                    try:
+                        chain_key_origin = await chain_executor.read_key_origin()
+                        if chain_key_origin:
+                            vault.key_origin = chain_key_origin
+                            logger.info(f"Key origin from chain: {vault.key_origin}")
+                        else:
+                            logger.info(f"Key origin from chain empty — keeping vault_config value: {vault.key_origin}")
+                    except Exception as e:
+                        logger.warning(f"Failed to read key origin at boot: {e}")
+
+                # Independent RPC round-trips — run them concurrently
+                await asyncio.gather(_boot_sync_debt(), _boot_read_key_origin())
 
-                # V3: Register spend whitelist addresses (non-fatal if V2 contract)
+                # V3: Spend whitelist addresses (non-fatal if V2 contract) — collected
+                # here, registered together with the merchant addresses below in a
+                # deferred task so the server accepts traffic first
                 whitelist_env = os.getenv("SPEND_WHITELIST_ADDRESSES", "")
-                if whitelist_env:
-                    addresses = [a.strip() for a in whitelist_env.split(",") if a.strip()]
-                    for addr in addresses:
-                        try:
-                            result = await chain_executor.add_spend_recipient(addr)
-                            if result.success:
-                                logger.info(f"Spend whitelist: registered {addr[:12]}...")
-                            else:
-                                logger.warning(f"Spend whitelist: failed to add {addr[:12]}... — {result.error}")
-                        except Exception as e:
-                            logger.debug(f"Spend whitelist skip for {addr[:12]}... (may be V2 contract): {e}")
+                spend_recipients: list[tuple[str, Optional[str]]] = [
+                    (a.strip(), None) for a in whitelist_env.split(",") if a.strip()
+                ]
 
                 # Initialize autonomous purchasing system
                 try:
@@ -5241,15 +6778,7 @@ async def lifespan(app):
                     # Auto-whitelist static-address (KnownMerchant) payment addresses.
                     # TrustedDomain addresses are whitelisted on first order creation
                     # (address not known until adapter probes the API).
-                    for merchant in KNOWN_MERCHANTS:
-                        try:
-                            await chain_executor.ensure_spend_recipient_ready(
-                                merchant.address, merchant.chain_id
-                            )
-                        except Exception as e:
-                            logger.debug(
-                                f"Merchant whitelist skip for {merchant.name}: {e}"
-                            )
+                    spend_recipients.extend((m.address, m.chain_id) for m in KNOWN_MERCHANTS)
 
                     # Wire giveaway engine
                     giveaway_engine.set_dependencies(
@@ -5267,6 +6796,9 @@ async def lifespan(app):
                 except Exception as e:
                     logger.warning(f"Purchasing system init failed (non-fatal): {e}")
 
+                if spend_recipients:
+                    _safe_create_task(_register_spend_recipients(spend_recipients))
+
             logger.info(f"Vault config loaded from {vault_config_path}")
         except Exception as e:
             logger.warning(f"Failed to load vault config: {e}")
@@ -5298,7 +6830,7 @@ async def lifespan(app):
         # CRITICAL: Initialize _last_autonomy_video to NOW so periodic_6h
         # doesn't fire immediately on restart (needs 6h to elapse first).
         # Also set daily date so counter doesn't reset mid-day on restart.
-        _last_autonomy_video = time.time()
+        _last_autonomy_video = _mono_now()
         _daily_autonomy_video_date = time.strftime("%Y-%m-%d", time.gmtime())
         logger.info(
             f"Autonomy video state initialized: "
@@ -5308,12 +6840,13 @@ async def lifespan(app):
         )
     except Exception as _e:
         # Even on failure, set _last_autonomy_video to prevent immediate trigger
-        _last_autonomy_video = time.time()
+        _last_autonomy_video = _mono_now()
         _daily_autonomy_video_date = time.strftime("%Y-%m-%d", time.gmtime())
         logger.warning(f"Failed to initialize autonomy milestones: {_e}")
 
     # Start background tasks
     heartbeat_task = asyncio.create_task(_heartbeat_loop())
+    scheduler_task = asyncio.create_task(_scheduler_loop())
 
     logger.info(f"Balance: ${vault.balance_usd:.2f}")
     logger.info(f"LLM: {cost_guard.current_provider.value if cost_guard.current_provider else 'NONE'}")
@@ -5328,7 +6861,12 @@ async def lifespan(app):
     # Shutdown
     logger.info(f"{_ai_name} shutting down...")
     heartbeat_task.cancel()
+    scheduler_task.cancel()
+    _twitter_pool.shutdown(wait=False, cancel_futures=True)
     memory.save_to_disk()
+    await _close_http_session()
+    await _shutdown_llm_clients()
+    await _close_json_http()
     logger.info("Goodbye.")
 
 
@@ -5340,11 +6878,10 @@ def create_wawa_app() -> "FastAPI":
     # addresses from vault_config are available even if not set in .env.
     fallback_address = os.getenv("PAYMENT_ADDRESS", os.getenv("VAULT_ADDRESS", ""))
     payment_addresses = {}
-    for chain in SUPPORTED_CHAINS:
-        env_key = f"{chain.chain_id.upper()}_PAYMENT_ADDRESS"
-        addr = os.getenv(env_key, fallback_address)
+    for chain_id, env_entry in _chain_env_snapshot().items():
+        addr = env_entry["payment"] or fallback_address
         if addr:
-            payment_addresses[chain.chain_id] = addr
+            payment_addresses[chain_id] = addr
 
     # Store reference so lifespan can update it
     global _payment_addresses_ref
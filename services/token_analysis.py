@@ -10,6 +10,7 @@ Analyzes any ERC-20 token using public APIs (no API key needed):
 Revenue: $5/analysis (99%+ margin — only cost is LLM interpretation)
 """
 
+import asyncio
 import logging
 import time
 from dataclasses import dataclass, field
@@ -174,10 +175,12 @@ class TokenAnalysisService:
         analysis.token.address = token_address.strip()
         analysis.token.chain = chain
 
-        # Fetch on-chain data
-        await self._fetch_token_info(analysis)
-        await self._fetch_holder_stats(analysis)
-        await self._fetch_liquidity(analysis)
+        # Fetch on-chain data (independent sources — fetched concurrently)
+        await asyncio.gather(
+            self._fetch_token_info(analysis),
+            self._fetch_holder_stats(analysis),
+            self._fetch_liquidity(analysis),
+        )
 
         # Compute risk score from collected data
         self._compute_risk_score(analysis)
@@ -210,22 +213,20 @@ class TokenAnalysisService:
             return
 
         try:
-            # Get contract ABI (also tells us if verified)
-            url = (
+            # Contract ABI (also tells us if verified) + token info via contract read
+            abi_url = (
                 f"{explorer['api']}?module=contract&action=getabi"
                 f"&address={analysis.token.address}"
             )
-            data = await self._http_fn(url)
-            if data and data.get("status") == "1":
-                analysis.token.verified = True
-                analysis.data_sources.append(f"{explorer['name']} contract")
-
-            # Get token info via contract read
-            url = (
+            info_url = (
                 f"{explorer['api']}?module=token&action=tokeninfo"
                 f"&contractaddress={analysis.token.address}"
             )
-            data = await self._http_fn(url)
+            abi_data, data = await asyncio.gather(self._http_fn(abi_url), self._http_fn(info_url))
+            if abi_data and abi_data.get("status") == "1":
+                analysis.token.verified = True
+                analysis.data_sources.append(f"{explorer['name']} contract")
+
             if data and data.get("status") == "1":
                 result = data.get("result", [{}])
                 if isinstance(result, list) and result:
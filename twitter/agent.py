@@ -13,8 +13,10 @@ Designed for: mortal framework
 import os
 import re
 import time
+import heapq
 import logging
 import json
+from collections import OrderedDict
 from dataclasses import dataclass, field
 from enum import Enum
 from typing import Optional
@@ -176,8 +178,10 @@ class TwitterAgent:
         self._last_mention_id: Optional[str] = None    # Pagination cursor
         self._last_mention_scan: float = 0.0
         self._MENTION_SCAN_INTERVAL: float = 150.0     # 2.5 min between scans (was 5)
-        # Track normalized question patterns → count (for deep-think escalation)
-        self._question_counts: dict[str, int] = {}
+        # Track normalized question patterns → count (for deep-think escalation).
+        # LRU-bounded: keys are user-supplied text with unbounded cardinality.
+        self._question_counts: OrderedDict[str, int] = OrderedDict()
+        self._QUESTION_COUNTS_MAX: int = 1024
 
 
     def set_generate_function(self, fn: callable):
@@ -211,11 +215,14 @@ class TwitterAgent:
         """
         self._reply_tweet_fn = fn
 
-    def set_get_mentions_function(self, fn: callable):
+    def set_get_mentions_function(self, fn: callable, since_id: Optional[str] = None):
         """Set mentions fetching callback.
         fn(since_id: str | None) -> list[{id, text, author_id}]
+        since_id: persisted cursor from a previous run (only newer mentions are fetched)
         """
         self._get_mentions_fn = fn
+        if since_id:
+            self._last_mention_id = since_id
 
     def set_record_highlight_function(self, fn: callable):
         """Set highlight recording callback for autonomous awareness moments.
@@ -303,8 +310,9 @@ class TwitterAgent:
             tweet_id = await self._post_fn(content)
 
             # Record
+            posted_at = time.time()
             record = TweetRecord(
-                timestamp=time.time(),
+                timestamp=posted_at,
                 tweet_type=tweet_type,
                 content=content,
                 tweet_id=tweet_id,
@@ -312,7 +320,7 @@ class TwitterAgent:
             )
             self.tweet_history.append(record)
             self.daily_tweet_count += 1
-            self.last_tweet_timestamp = time.time()
+            self.last_tweet_timestamp = posted_at
 
             # Save to disk
             self._save_tweet_log(record)
@@ -458,6 +466,9 @@ class TwitterAgent:
             q_key = re.sub(r'[^a-z0-9 ]', '', tweet_text.lower())[:60].strip()
             if q_key:
                 self._question_counts[q_key] = self._question_counts.get(q_key, 0) + 1
+                self._question_counts.move_to_end(q_key)
+                if len(self._question_counts) > self._QUESTION_COUNTS_MAX:
+                    self._question_counts.popitem(last=False)
             repeat_count = self._question_counts.get(q_key, 1)
 
             context = {
@@ -573,27 +584,43 @@ class TwitterAgent:
         with open(log_file, "a", encoding="utf-8") as f:
             f.write(json.dumps(log_entry, ensure_ascii=False) + "\n")
 
-    def get_past_mention_replies(self, max_tier: int = 0) -> list[TweetRecord]:
+    def get_past_mention_replies(
+        self,
+        max_tier: int = 0,
+        require_ids: bool = False,
+        limit: int = 0,
+    ) -> list[TweetRecord]:
         """Get past mention replies that were generated at or below a specific tier.
         Used by the re-reply system: when AI gets richer and upgrades model,
         it can re-answer past questions with higher quality.
 
         Args:
             max_tier: Only return replies made at this tier or lower (0 = all)
+            require_ids: Also require our own tweet_id (reply was actually posted)
+            limit: Only return the N most recent matches (0 = all)
         Returns:
             List of TweetRecord for mention replies, oldest first.
         """
-        replies = [
+        replies = (
             r for r in self.tweet_history
             if r.tweet_type == TweetType.MENTION_REPLY
             and r.reply_to_id  # Must have original mention ID for re-reply
+            and (not require_ids or r.tweet_id)
             and (max_tier == 0 or r.model_tier <= max_tier)
-        ]
+        )
+        if limit > 0:
+            # Keep only the newest N without sorting the whole history
+            return heapq.nlargest(limit, replies, key=lambda r: r.timestamp)[::-1]
         return sorted(replies, key=lambda r: r.timestamp)
 
+    def get_recent(self, n: int) -> list[TweetRecord]:
+        """Get the n most recent tweets, oldest first.
+        tweet_history is appended in time order, so this is a tail slice — no sort."""
+        return self.tweet_history[-n:] if n > 0 else []
+
     def get_public_log(self, limit: int = 20) -> list[dict]:
         """Get recent tweets with thought process for public display."""
-        recent = sorted(self.tweet_history, key=lambda r: r.timestamp, reverse=True)[:limit]
+        recent = reversed(self.get_recent(limit))
         return [
             {
                 "time": r.timestamp,